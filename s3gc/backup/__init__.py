@@ -7,6 +7,7 @@ Backup Engine - Backup lifecycle and restore operations.
 
 from s3gc.backup.manager import (
     write_backup_file,
+    store_backup,
     read_backup_file,
     create_operation_tarball,
     prune_old_backups,
@@ -22,6 +23,7 @@ from s3gc.backup.restore import (
 __all__ = [
     # Manager
     "write_backup_file",
+    "store_backup",
     "read_backup_file",
     "create_operation_tarball",
     "prune_old_backups",
@@ -8,30 +8,47 @@ This module handles restoring deleted S3 objects from backups.
 It supports both full operation restores and single object restores.
 """
 
+from __future__ import annotations
+
+import asyncio
 from dataclasses import dataclass, field
+from functools import partial
 from datetime import datetime, UTC
 from pathlib import Path
-from typing import Any, List
+from typing import TYPE_CHECKING, Any, List
 
 import aiosqlite
 import structlog
 
-from s3gc.backup.manager import read_backup_file
+from s3gc import core
+from s3gc.backup.manager import read_backup_file, verify_backup_digest
 from s3gc.config import S3GCConfig
-from s3gc.core import GCState
-from s3gc.exceptions import RestoreError
-from s3gc.vault.compressor import decompress_backup
+from s3gc.exceptions import BackupError, RestoreError
+from s3gc.vault.compressor import batched_decompress_backup, decompress_backup
 from s3gc.vault.sqlite_vault import (
     DeletionRecord,
-    get_deletions_by_operation,
     get_deletion_record,
+    iter_deletions_by_operation,
     mark_restored,
+    mark_restored_bulk,
 )
 
+if TYPE_CHECKING:
+    # s3gc.core imports the backup package, so only import GCState for typing
+    from s3gc.core import GCState
+
 logger = structlog.get_logger()
 
+# restore_operation marks restored keys in the vault this many at a time
+RESTORE_MARK_BATCH_SIZE = 500
+
+# restore_operation checks, reads, decompresses and uploads this many
+# objects concurrently; the decoded objects of a batch are held in memory
+# until uploaded
+RESTORE_BATCH_SIZE = 32
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RestoreResult:
     """Result of a restore operation."""
 
@@ -65,7 +82,8 @@ async def restore_operation(
     Args:
         config: S3GC configuration
         state: Runtime state
-        vault_db: Vault database connection
+        vault_db: Vault database connection to read the deletions from;
+            restored keys are marked through state["vault_pool"].writer()
         operation_id: Operation ID to restore
         dry_run: If True, only report what would be restored
         skip_existing: Skip objects that already exist in S3
@@ -85,25 +103,6 @@ async def restore_operation(
         dry_run=dry_run,
     )
 
-    # Get all deletions for this operation (excluding already restored)
-    deletions = await get_deletions_by_operation(
-        vault_db, operation_id, include_restored=False
-    )
-
-    if not deletions:
-        logger.warning(
-            "no_deletions_found",
-            operation_id=operation_id,
-        )
-        return RestoreResult(
-            operation_id=operation_id,
-            restored_count=0,
-            failed_count=0,
-            skipped_count=0,
-            errors=["No unrestored deletions found for this operation"],
-            dry_run=dry_run,
-        )
-
     restored_count = 0
     failed_count = 0
     skipped_count = 0
@@ -112,58 +111,89 @@ async def restore_operation(
     failed_keys: List[str] = []
     skipped_keys: List[str] = []
 
-    async with state["s3_session"].create_client(
-        "s3",
-        region_name=config.region,
-    ) as s3_client:
-        for deletion in deletions:
-            s3_key = deletion["s3_key"]
-            backup_path = Path(deletion["backup_path"])
+    s3_client = await core.get_s3_client(config, state)
+
+    # Deletions waiting to be restored as one batch, and restored keys
+    # not yet marked in the vault
+    pending_restores: List[tuple[str, Path, bytes | None]] = []
+    pending_marks: List[str] = []
+    seen_deletions = False
+
+    async def flush_restores() -> None:
+        nonlocal restored_count, failed_count, skipped_count
+        batch = pending_restores[:]
+        pending_restores.clear()
+
+        # Check which objects already exist in S3, all at once
+        if skip_existing:
+            existing = await _existing_keys(config, s3_client, batch)
+            for s3_key in existing:
+                skipped_count += 1
+                skipped_keys.append(s3_key)
+                logger.debug(
+                    "restore_skipped_exists",
+                    s3_key=s3_key,
+                )
+            batch = [item for item in batch if item[0] not in existing]
 
-            try:
-                # Check if object already exists in S3
-                if skip_existing:
-                    try:
-                        await s3_client.head_object(
-                            Bucket=config.bucket, Key=s3_key
-                        )
-                        # Object exists, skip
-                        skipped_count += 1
-                        skipped_keys.append(s3_key)
-                        logger.debug(
-                            "restore_skipped_exists",
-                            s3_key=s3_key,
-                        )
-                        continue
-                    except Exception:
-                        # Object doesn't exist, proceed with restore
-                        pass
-
-                if not dry_run:
-                    await restore_single_object(
-                        config,
-                        state,
-                        vault_db,
-                        s3_client,
-                        s3_key,
-                        backup_path,
-                        restore_op_id,
-                    )
+        if dry_run:
+            restored_count += len(batch)
+            restored_keys.extend(s3_key for s3_key, *_ in batch)
+            return
 
+        batch_errors = await _restore_batch(config, state, s3_client, batch)
+        for (s3_key, *_), error in zip(batch, batch_errors):
+            if error is None:
                 restored_count += 1
                 restored_keys.append(s3_key)
-
-            except Exception as e:
-                error_msg = f"{s3_key}: {str(e)}"
-                errors.append(error_msg)
+                pending_marks.append(s3_key)
+            else:
+                errors.append(f"{s3_key}: {str(error)}")
                 failed_count += 1
                 failed_keys.append(s3_key)
                 logger.error(
                     "restore_object_failed",
                     s3_key=s3_key,
-                    error=str(e),
+                    error=str(error),
                 )
 
+        if len(pending_marks) >= RESTORE_MARK_BATCH_SIZE:
+            await _mark_restored_keys(state, pending_marks, restore_op_id)
+            pending_marks.clear()
+
+    # Stream the unrestored deletions rather than loading them all
+    async for deletion in iter_deletions_by_operation(
+        vault_db, operation_id, include_restored=False
+    ):
+        seen_deletions = True
+        pending_restores.append(
+            (
+                deletion["s3_key"],
+                Path(deletion["backup_path"]),
+                deletion["content_hash"],
+            )
+        )
+        if len(pending_restores) >= RESTORE_BATCH_SIZE:
+            await flush_restores()
+
+    if pending_restores:
+        await flush_restores()
+    await _mark_restored_keys(state, pending_marks, restore_op_id)
+
+    if not seen_deletions:
+        logger.warning(
+            "no_deletions_found",
+            operation_id=operation_id,
+        )
+        return RestoreResult(
+            operation_id=operation_id,
+            restored_count=0,
+            failed_count=0,
+            skipped_count=0,
+            errors=["No unrestored deletions found for this operation"],
+            dry_run=dry_run,
+        )
+
     duration = (datetime.now(UTC) - start_time).total_seconds()
 
     result = RestoreResult(
@@ -192,6 +222,135 @@ async def restore_operation(
     return result
 
 
+async def _mark_restored_keys(
+    state: GCState,
+    s3_keys: List[str],
+    restore_operation_id: str,
+) -> None:
+    """Mark restored keys on the vault pool's write connection."""
+    if not s3_keys:
+        return
+    async with state["vault_pool"].writer() as vault_db:
+        await mark_restored_bulk(vault_db, s3_keys, restore_operation_id)
+
+
+async def _existing_keys(
+    config: S3GCConfig,
+    s3_client: Any,
+    batch: List[tuple[str, Path, bytes | None]],
+) -> set[str]:
+    """Return the keys of a restore batch that already exist in S3."""
+    responses = await asyncio.gather(
+        *(s3_client.head_object(Bucket=config.bucket, Key=s3_key) for s3_key, *_ in batch),
+        return_exceptions=True,
+    )
+    existing: set[str] = set()
+    for (s3_key, *_), response in zip(batch, responses):
+        if not isinstance(response, BaseException):
+            existing.add(s3_key)
+        elif not isinstance(response, Exception):
+            raise response
+        # Any other failure: the object doesn't exist, proceed with restore
+    return existing
+
+
+async def _restore_batch(
+    config: S3GCConfig,
+    state: GCState,
+    s3_client: Any,
+    batch: List[tuple[str, Path, bytes | None]],
+) -> List[Exception | None]:
+    """
+    Restore a batch of objects without marking them in the vault.
+
+    The backups are read concurrently, checked against their recorded
+    digests and decompressed together with batched_decompress_backup;
+    the uploads then run concurrently as well.
+
+    Args:
+        config: S3GC configuration
+        state: Runtime state
+        s3_client: S3 client
+        batch: (s3_key, backup_path, content_hash) of the objects to
+            restore; content_hash may be None
+
+    Returns:
+        None per restored object and the RestoreError of each failed
+        one, in the order of ``batch``
+    """
+    results: List[Exception | None] = [None] * len(batch)
+
+    blobs = await asyncio.gather(
+        *(read_backup_file(backup_path) for _, backup_path, _ in batch),
+        return_exceptions=True,
+    )
+    readable = []
+    for i, blob in enumerate(blobs):
+        if isinstance(blob, Exception):
+            results[i] = blob
+        elif isinstance(blob, BaseException):
+            raise blob
+        elif not _backup_intact(blob, batch[i][2]):
+            results[i] = BackupError("Backup file does not match its recorded hash")
+        else:
+            readable.append(i)
+
+    decompressed = await batched_decompress_backup(
+        [blobs[i] for i in readable], state["zstd_dicts"], return_exceptions=True
+    )
+    to_upload = []
+    for i, original_bytes in zip(readable, decompressed):
+        if isinstance(original_bytes, BaseException):
+            if not isinstance(original_bytes, Exception):
+                raise original_bytes
+            results[i] = original_bytes
+        else:
+            to_upload.append((i, original_bytes))
+
+    async def upload(i: int, original_bytes: bytes) -> None:
+        s3_key, backup_path, _ = batch[i]
+        await s3_client.put_object(
+            Bucket=config.bucket,
+            Key=s3_key,
+            Body=original_bytes,
+        )
+        logger.info(
+            "object_restored",
+            s3_key=s3_key,
+            backup_path=str(backup_path),
+            size=len(original_bytes),
+        )
+
+    uploaded = await asyncio.gather(
+        *(upload(i, original_bytes) for i, original_bytes in to_upload),
+        return_exceptions=True,
+    )
+    for (i, _), outcome in zip(to_upload, uploaded):
+        if isinstance(outcome, BaseException):
+            if not isinstance(outcome, Exception):
+                raise outcome
+            results[i] = outcome
+
+    # Report failures like restore_single_object does
+    for i, error in enumerate(results):
+        if error is not None:
+            s3_key, backup_path, _ = batch[i]
+            results[i] = RestoreError(
+                f"Failed to restore object: {error}",
+                details={"s3_key": s3_key, "backup_path": str(backup_path)},
+            )
+
+    return results
+
+
+def _backup_intact(data: bytes, content_hash: bytes | None) -> bool:
+    """Whether backup contents match their recorded digest (if checkable)."""
+    if content_hash is None:
+        return True
+    # None: an xxh3 digest without xxhash installed, so it can't be checked
+    return verify_backup_digest(data, content_hash) is not False
+
+
 async def restore_single_object(
     config: S3GCConfig,
     state: GCState,
@@ -200,6 +359,8 @@ async def restore_single_object(
     s3_key: str,
     backup_path: Path,
     restore_operation_id: str | None = None,
+    mark: bool = True,
+    content_hash: bytes | None = None,
 ) -> None:
     """
     Restore a single object from backup.
@@ -212,6 +373,10 @@ async def restore_single_object(
         s3_key: S3 key to restore
         backup_path: Path to the backup file
         restore_operation_id: Optional ID of the restore operation
+        mark: Mark the object restored in the vault; batch restores pass
+            False and mark their keys with mark_restored_bulk instead
+        content_hash: Recorded digest of the backup file, checked before
+            restoring when given
 
     Raises:
         RestoreError: If restore fails
@@ -219,9 +384,11 @@ async def restore_single_object(
     try:
         # Step 1: Read compressed backup
         compressed_bytes = await read_backup_file(backup_path)
+        if not _backup_intact(compressed_bytes, content_hash):
+            raise BackupError("Backup file does not match its recorded hash")
 
         # Step 2: Decompress
-        original_bytes = await decompress_backup(compressed_bytes)
+        original_bytes = await decompress_backup(compressed_bytes, state["zstd_dicts"])
 
         # Step 3: Upload to S3
         await s3_client.put_object(
@@ -231,7 +398,8 @@ async def restore_single_object(
         )
 
         # Step 4: Mark as restored in vault
-        await mark_restored(vault_db, s3_key, restore_operation_id)
+        if mark:
+            await mark_restored(vault_db, s3_key, restore_operation_id)
 
         logger.info(
             "object_restored",
@@ -272,7 +440,7 @@ async def restore_single_by_key(
     start_time = datetime.now(UTC)
     restore_op_id = str(ULID())
 
-    async with aiosqlite.connect(state["vault_db_path"]) as vault_db:
+    async with state["vault_pool"].acquire() as vault_db:
         # Find deletion record
         deletion = await get_deletion_record(vault_db, s3_key)
 
@@ -300,30 +468,38 @@ async def restore_single_by_key(
         backup_path = Path(deletion["backup_path"])
 
         if not dry_run:
-            async with state["s3_session"].create_client(
-                "s3",
-                region_name=config.region,
-            ) as s3_client:
-                try:
-                    await restore_single_object(
-                        config,
-                        state,
-                        vault_db,
-                        s3_client,
-                        s3_key,
-                        backup_path,
-                        restore_op_id,
-                    )
-                except Exception as e:
-                    return RestoreResult(
-                        operation_id=restore_op_id,
-                        restored_count=0,
-                        failed_count=1,
-                        skipped_count=0,
-                        errors=[str(e)],
-                        dry_run=dry_run,
-                        failed_keys=[s3_key],
+            s3_client = await core.get_s3_client(config, state)
+            try:
+                await restore_single_object(
+                    config,
+                    state,
+                    vault_db,
+                    s3_client,
+                    s3_key,
+                    backup_path,
+                    restore_op_id,
+                    mark=False,
+                    content_hash=deletion["content_hash"],
+                )
+                # Concurrent single-key restores share one commit
+                await state["vault_pool"].write(
+                    partial(
+                        mark_restored,
+                        s3_key=s3_key,
+                        restore_operation_id=restore_op_id,
+                        commit=False,
                     )
+                )
+            except Exception as e:
+                return RestoreResult(
+                    operation_id=restore_op_id,
+                    restored_count=0,
+                    failed_count=1,
+                    skipped_count=0,
+                    errors=[str(e)],
+                    dry_run=dry_run,
+                    failed_keys=[s3_key],
+                )
 
     duration = (datetime.now(UTC) - start_time).total_seconds()
 
@@ -358,26 +534,23 @@ async def verify_restore(
         True if object exists and matches expected size
     """
     try:
-        async with state["s3_session"].create_client(
-            "s3",
-            region_name=config.region,
-        ) as s3_client:
-            response = await s3_client.head_object(
-                Bucket=config.bucket, Key=s3_key
-            )
+        s3_client = await core.get_s3_client(config, state)
+        response = await s3_client.head_object(
+            Bucket=config.bucket, Key=s3_key
+        )
 
-            if expected_size is not None:
-                actual_size = response["ContentLength"]
-                if actual_size != expected_size:
-                    logger.warning(
-                        "restore_size_mismatch",
-                        s3_key=s3_key,
-                        expected=expected_size,
-                        actual=actual_size,
-                    )
-                    return False
+        if expected_size is not None:
+            actual_size = response["ContentLength"]
+            if actual_size != expected_size:
+                logger.warning(
+                    "restore_size_mismatch",
+                    s3_key=s3_key,
+                    expected=expected_size,
+                    actual=actual_size,
+                )
+                return False
 
-            return True
+        return True
 
     except Exception as e:
         logger.error(
@@ -408,7 +581,7 @@ async def list_restorable_objects(
     """
     query = """
         SELECT id, operation_id, s3_key, backup_path, original_size,
-               compressed_size, deleted_at, restored_at
+               compressed_size, deleted_at, restored_at, content_hash
         FROM deletions
         WHERE restored_at IS NULL
     """
@@ -439,6 +612,7 @@ async def list_restorable_objects(
                     compressed_size=row[5],
                     deleted_at=row[6],
                     restored_at=row[7],
+                    content_hash=row[8],
                 )
             )
 
@@ -459,12 +633,21 @@ async def estimate_restore_time(
     Returns:
         Dict with estimate details
     """
-    deletions = await get_deletions_by_operation(
-        vault_db, operation_id, include_restored=False
-    )
-
-    total_original_bytes = sum(d["original_size"] for d in deletions)
-    total_compressed_bytes = sum(d["compressed_size"] for d in deletions)
+    # Let SQLite add up the sizes instead of summing rows in Python
+    async with vault_db.execute(
+        """
+        SELECT COUNT(*),
+               COALESCE(SUM(original_size), 0), COALESCE(SUM(compressed_size), 0)
+        FROM deletions
+        WHERE operation_id = ? AND restored_at IS NULL
+        """,
+        (operation_id,),
+    ) as cursor:
+        (
+            object_count,
+            total_original_bytes,
+            total_compressed_bytes,
+        ) = await cursor.fetchone()
 
     # Rough estimates
     # - Decompression: ~100MB/s
@@ -474,7 +657,7 @@ async def estimate_restore_time(
     estimated_total_secs = estimated_decompress_secs + estimated_upload_secs
 
     return {
-        "object_count": len(deletions),
+        "object_count": object_count,
         "total_original_bytes": total_original_bytes,
         "total_compressed_bytes": total_compressed_bytes,
         "estimated_seconds": round(estimated_total_secs, 1),
@@ -39,6 +39,11 @@ def create_empty_config() -> ConfigDict:
         DeprecationWarning,
         stacklevel=2,
     )
+    return _default_config()
+
+
+def _default_config() -> ConfigDict:
+    """Return a fresh dictionary of the default configuration values."""
     return {
         "bucket": "",
         "region": "us-east-1",
@@ -183,13 +188,18 @@ def execute_mode(config: ConfigDict) -> ConfigDict:
     Returns:
         New configuration dictionary with execute mode
     """
+    _warn_execute_mode()
+    return {**config, "mode": GCMode.EXECUTE}
+
+
+def _warn_execute_mode() -> None:
+    """Tell the user on stderr that execute mode deletes objects."""
     import sys
 
     print(
         "\u26a0\ufe0f  WARNING: Execute mode will be enabled. Deletions will occur.",
         file=sys.stderr,
     )
-    return {**config, "mode": GCMode.EXECUTE}
 
 
 def retain_objects_older_than(config: ConfigDict, days: int) -> ConfigDict:
@@ -205,9 +215,14 @@ def retain_objects_older_than(config: ConfigDict, days: int) -> ConfigDict:
     Returns:
         New configuration dictionary with retention period set
     """
+    _check_retention_days(days)
+    return {**config, "retention_days": days}
+
+
+def _check_retention_days(days: int) -> None:
+    """Raise ValueError for a negative retention period."""
     if days < 0:
         raise ValueError(f"retention days must be >= 0, got {days}")
-    return {**config, "retention_days": days}
 
 
 def enable_vault(config: ConfigDict, vault_path: Path | str) -> ConfigDict:
@@ -285,6 +300,12 @@ def run_daily_at(config: ConfigDict, time: str) -> ConfigDict:
     Returns:
         New configuration dictionary with schedule set
     """
+    _check_daily_time(time)
+    return {**config, "schedule_cron": time}
+
+
+def _check_daily_time(time: str) -> None:
+    """Raise ValueError unless ``time`` is a valid HH:MM time of day."""
     # Basic validation
     parts = time.split(":")
     if len(parts) != 2:
@@ -296,8 +317,6 @@ def run_daily_at(config: ConfigDict, time: str) -> ConfigDict:
     except ValueError:
         raise ValueError(f"Invalid time format: {time}, expected HH:MM")
 
-    return {**config, "schedule_cron": time}
-
 
 def with_max_concurrent_ops(config: ConfigDict, max_ops: int) -> ConfigDict:
     """
@@ -407,6 +426,11 @@ def build_config(config_dict: ConfigDict) -> S3GCConfig:
         DeprecationWarning,
         stacklevel=2,
     )
+    return _build_config(config_dict)
+
+
+def _build_config(config_dict: ConfigDict) -> S3GCConfig:
+    """Check for a bucket and build the S3GCConfig (build_config without the warning)."""
     if not config_dict.get("bucket"):
         from s3gc.exceptions import ConfigurationError
         from s3gc.errors import explain_missing_bucket_env
@@ -535,8 +559,9 @@ def create_config(
             vault_path="/var/lib/s3gc_vault"
         )
     """
-    # Start with defaults
-    config_dict = create_empty_config()
+    # One dictionary, filled in place; the copy-per-step builder functions
+    # would copy it once per option
+    config_dict = _default_config()
 
     # Set required bucket
     config_dict["bucket"] = bucket
@@ -546,38 +571,38 @@ def create_config(
         config_dict["region"] = region
 
     if tables:
-        for table, columns in tables.items():
-            config_dict = scan_table(config_dict, table, columns)
+        config_dict["tables"].update(tables)
 
     if exclude_prefixes:
-        config_dict = exclude_prefixes(config_dict, exclude_prefixes)
+        config_dict["exclude_prefixes"].extend(exclude_prefixes)
 
     if retention_days is not None:
-        config_dict = retain_objects_older_than(config_dict, retention_days)
+        _check_retention_days(retention_days)
+        config_dict["retention_days"] = retention_days
 
     if vault_path:
-        path = Path(vault_path) if isinstance(vault_path, str) else vault_path
-        config_dict = enable_vault(config_dict, path)
+        config_dict["vault_path"] = Path(vault_path)
 
     if cdc_backend and cdc_connection_url:
         if isinstance(cdc_backend, str):
-            backend = CDCBackend(cdc_backend.lower())
-        else:
-            backend = cdc_backend
-        config_dict = enable_cdc(config_dict, backend, cdc_connection_url)
+            cdc_backend = CDCBackend(cdc_backend.lower())
+        config_dict["cdc_backend"] = cdc_backend
+        config_dict["cdc_connection_url"] = cdc_connection_url
 
     if schedule_cron:
-        config_dict = run_daily_at(config_dict, schedule_cron)
+        _check_daily_time(schedule_cron)
+        config_dict["schedule_cron"] = schedule_cron
 
     # Handle mode
     if isinstance(mode, str):
         mode_lower = mode.lower()
         if mode_lower == "execute":
-            config_dict = execute_mode(config_dict)
+            _warn_execute_mode()
+            config_dict["mode"] = GCMode.EXECUTE
         elif mode_lower == "audit_only":
-            config_dict = audit_only_mode(config_dict)
+            config_dict["mode"] = GCMode.AUDIT_ONLY
         else:
-            config_dict = dry_run_mode(config_dict)
+            config_dict["mode"] = GCMode.DRY_RUN
     else:
         config_dict["mode"] = mode
 
@@ -587,4 +612,4 @@ def create_config(
             config_dict[key] = value
 
     # Build and return validated config
-    return build_config(config_dict)
+    return _build_config(config_dict)
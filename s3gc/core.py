@@ -8,15 +8,64 @@ This module contains the core GC cycle functions that coordinate
 all the components: registry, CDC, vault, backup, and S3 operations.
 """
 
+import asyncio
+import os
+from contextlib import AsyncExitStack
 from dataclasses import dataclass, field
-from datetime import datetime, UTC
+from datetime import datetime, timedelta, UTC
 from pathlib import Path
 from typing import Any, Dict, List, TypedDict
 
-from s3gc.config import S3GCConfig, GCMode
-
+import structlog
+from aiobotocore.config import AioConfig
+from aiobotocore.session import get_session
+from ulid import ULID
 
-@dataclass
+from s3gc.backup.manager import store_backup
+from s3gc.config import S3GCConfig, GCMode
+from s3gc.registry import (
+    RegistryBatcher,
+    async_registry_txn,
+    get_orphan_candidates,
+    get_ref_count,
+    get_ref_counts,
+    increment_ref,
+    init_registry_db,
+    registry_connection,
+)
+from s3gc.vault.compressor import prepare_backup_compression, shutdown_executors
+from s3gc.vault.dict_train import ZstdDictionaries, train_dictionaries
+from s3gc.vault.pool import VaultPool
+from s3gc.vault.replicator import close_replication_pools
+from s3gc.vault.sqlite_vault import (
+    init_vault_db,
+    record_deletions,
+    record_operation,
+    start_operation_with_deletions,
+)
+
+logger = structlog.get_logger()
+
+# Connection pool size for the shared S3 client, sized for concurrent
+# verification/backup/restore fan-out.
+S3_MAX_POOL_CONNECTIONS = 100
+
+# Maximum keys per S3 DeleteObjects request; vault records are committed
+# on the same boundary so each batch is recorded before it is deleted.
+DELETE_BATCH_SIZE = 1000
+
+# Objects downloaded, compressed and written concurrently while a batch
+# is backed up. Compression runs on worker threads that release the GIL,
+# so this keeps every core busy while downloads are in flight; it also
+# caps how many object bodies are held in memory at once.
+BACKUP_CONCURRENCY = 2 * (os.cpu_count() or 1)
+
+# How long a GC cycle waits for queued CDC events to reach the registry
+# before giving up on the cycle
+REGISTRY_FLUSH_TIMEOUT_SECONDS = 60.0
+
+
+@dataclass(slots=True, frozen=True)
 class GCResult:
     """Result of a garbage collection cycle."""
 
@@ -33,7 +82,7 @@ class GCResult:
     skipped_keys: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RestoreResult:
     """Result of a restore operation."""
 
@@ -44,7 +93,7 @@ class RestoreResult:
     restored_keys: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GCMetrics:
     """Metrics for GC operations."""
 
@@ -64,11 +113,21 @@ class GCState(TypedDict):
     registry_db_path: Path
     vault_db_path: Path
     vault_path: Path
+    vault_pool: VaultPool  # Shared vault connections (readers + one writer)
+    zstd_dicts: ZstdDictionaries  # Trained backup compression dictionaries
+    zstd_dicts_trained: bool  # False until the vault has any dictionary
+    exclude_tuple: tuple[str, ...]  # config.exclude_prefixes for str.startswith
     s3_session: Any  # aiobotocore session
-    s3_client: Any  # aiobotocore client context manager
+    s3_client: Any  # Shared aiobotocore client, created on first use
+    s3_exit_stack: AsyncExitStack | None  # Owns s3_client's lifetime
     cdc_connection: Any  # Database connection if CDC enabled
     cdc_stop: Any  # CDC stop function
+    registry_batcher: RegistryBatcher | None  # Applies CDC events to the registry
+    cdc_pairs: tuple[tuple[str, str], ...]  # Flattened config.tables
+    cdc_is_postgres: bool
+    cdc_prepared: Dict[tuple[str, str], Any]  # (table, column) -> lookup query
     last_run_at: datetime | None
+    last_run_at_iso: str | None  # last_run_at.isoformat(), cached for the API
     total_runs: int
     total_deleted: int
     total_backed_up: int
@@ -89,11 +148,6 @@ async def initialize_gc_state(config: S3GCConfig) -> GCState:
     Returns:
         Initialized GCState dictionary
     """
-    from aiobotocore.session import get_session
-
-    from s3gc.registry import init_registry_db
-    from s3gc.vault import init_vault_db
-
     # Create directories
     config.vault_path.mkdir(parents=True, exist_ok=True)
     registry_path = config.vault_path / "registry.db"
@@ -111,15 +165,34 @@ async def initialize_gc_state(config: S3GCConfig) -> GCState:
     if config.cdc_backend and config.cdc_connection_url:
         cdc_conn = await _init_cdc_connection(config)
 
+    zstd_dicts = ZstdDictionaries.load(config.vault_path)
+
     return GCState(
         registry_db_path=registry_path,
         vault_db_path=vault_db_path,
         vault_path=config.vault_path,
+        vault_pool=VaultPool(vault_db_path),
+        zstd_dicts=zstd_dicts,
+        zstd_dicts_trained=len(zstd_dicts) > 0,
+        exclude_tuple=tuple(config.exclude_prefixes),
         s3_session=session,
-        s3_client=None,  # Created per-operation via context manager
+        s3_client=None,  # Created lazily by get_s3_client()
+        s3_exit_stack=None,
         cdc_connection=cdc_conn,
         cdc_stop=None,
+        registry_batcher=None,
+        cdc_pairs=tuple(
+            (table, column)
+            for table, columns in config.tables.items()
+            for column in columns
+        ),
+        cdc_is_postgres=(
+            config.cdc_backend is not None
+            and config.cdc_backend.value == "postgres"
+        ),
+        cdc_prepared={},
         last_run_at=None,
+        last_run_at_iso=None,
         total_runs=0,
         total_deleted=0,
         total_backed_up=0,
@@ -128,6 +201,45 @@ async def initialize_gc_state(config: S3GCConfig) -> GCState:
     )
 
 
+async def get_s3_client(config: S3GCConfig, state: GCState) -> Any:
+    """
+    Get the shared S3 client, creating it on first use.
+
+    The client (and its connection pool) is reused across GC cycles and
+    restores, and is closed by shutdown_gc_state().
+
+    Args:
+        config: S3GC configuration
+        state: Runtime state
+
+    Returns:
+        aiobotocore S3 client
+    """
+    if state["s3_client"] is not None:
+        return state["s3_client"]
+
+    stack = AsyncExitStack()
+    client = await stack.enter_async_context(
+        state["s3_session"].create_client(
+            "s3",
+            region_name=config.region,
+            config=AioConfig(
+                max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+                retries={"max_attempts": 10, "mode": "adaptive"},
+            ),
+        )
+    )
+
+    # Another task may have created the client while we were awaiting
+    if state["s3_client"] is not None:
+        await stack.aclose()
+        return state["s3_client"]
+
+    state["s3_client"] = client
+    state["s3_exit_stack"] = stack
+    return client
+
+
 async def _init_cdc_connection(config: S3GCConfig) -> Any:
     """Initialize CDC database connection."""
     if config.cdc_backend is None or config.cdc_connection_url is None:
@@ -151,6 +263,36 @@ async def _init_cdc_connection(config: S3GCConfig) -> Any:
     return None
 
 
+async def _prepare_cdc_statements(state: GCState) -> Dict[tuple[str, str], Any]:
+    """
+    Build the per-column reference lookup queries once for a cycle.
+
+    For PostgreSQL each query is prepared server-side with asyncpg so that
+    every candidate lookup skips SQL formatting and re-parsing. aiomysql
+    has no server-side prepare, so MySQL gets the pre-formatted SQL text.
+
+    Args:
+        state: Runtime state with an open CDC connection
+
+    Returns:
+        Dictionary mapping (table, column) to a prepared statement or SQL
+    """
+    prepared: Dict[tuple[str, str], Any] = {}
+    conn = state["cdc_connection"]
+
+    for table, column in state["cdc_pairs"]:
+        if state["cdc_is_postgres"]:
+            prepared[(table, column)] = await conn.prepare(
+                f"SELECT 1 FROM {table} WHERE {column} LIKE $1 LIMIT 1"
+            )
+        else:
+            prepared[(table, column)] = (
+                f"SELECT 1 FROM {table} WHERE {column} LIKE %s LIMIT 1"
+            )
+
+    return prepared
+
+
 async def run_gc_cycle(config: S3GCConfig, state: GCState) -> GCResult:
     """
     Run a complete garbage collection cycle.
@@ -168,17 +310,10 @@ async def run_gc_cycle(config: S3GCConfig, state: GCState) -> GCResult:
     Returns:
         GCResult with operation details
     """
-    import structlog
-    from ulid import ULID
-
-    from s3gc.registry import get_orphan_candidates, get_ref_count, increment_ref
-    from s3gc.vault import record_operation
-    from s3gc.backup import write_backup_file
-    from s3gc.vault.compressor import compress_for_backup
-
-    logger = structlog.get_logger()
     operation_id = str(ULID())
     start_time = datetime.now(UTC)
+    # Single clock read reused for every candidate's retention check
+    cycle_now = start_time
 
     logger.info("gc_cycle_started", operation_id=operation_id, mode=config.mode.value)
 
@@ -187,91 +322,131 @@ async def run_gc_cycle(config: S3GCConfig, state: GCState) -> GCResult:
     skipped_keys: List[str] = []
 
     try:
-        async with state["s3_session"].create_client(
-            "s3",
-            region_name=config.region,
-        ) as s3_client:
-            # Step 1: List all S3 objects
-            s3_keys = await _list_all_s3_keys(s3_client, config)
-            logger.info("objects_listed", total=len(s3_keys))
-
-            # Step 2: Find orphan candidates from registry
-            import aiosqlite
-
-            async with aiosqlite.connect(state["registry_db_path"]) as reg_db:
-                candidates = await get_orphan_candidates(reg_db, s3_keys)
-            logger.info("candidates_found", count=len(candidates))
-
-            # Step 3: Multi-layer verification
-            verified_orphans: List[str] = []
-            for s3_key in candidates:
-                is_orphan, reason = await _verify_orphan(
-                    config, state, s3_client, s3_key
-                )
-                if is_orphan:
-                    verified_orphans.append(s3_key)
-                else:
-                    skipped_keys.append(s3_key)
-                    logger.debug(
-                        "verification_failed", s3_key=s3_key, reason=reason
-                    )
-
-            logger.info("orphans_verified", count=len(verified_orphans))
+        if config.cdc_connection_url and state["cdc_connection"]:
+            state["cdc_prepared"] = await _prepare_cdc_statements(state)
+
+        s3_client = await get_s3_client(config, state)
+
+        # Step 1: List all S3 objects
+        s3_keys = await _list_all_s3_keys(s3_client, config)
+        logger.info("objects_listed", total=len(s3_keys))
+
+        # References captured by CDC but not yet committed are invisible
+        # to the registry; a failed flush raises RegistryError and aborts
+        # the cycle rather than deleting against a stale registry
+        if state["registry_batcher"] is not None:
+            await state["registry_batcher"].flush(
+                timeout=REGISTRY_FLUSH_TIMEOUT_SECONDS
+            )
+
+        # Step 2: Find orphan candidates from registry
+        async with registry_connection(state["registry_db_path"]) as reg_db:
+            candidates = await get_orphan_candidates(reg_db, list(s3_keys))
+            ref_counts = await get_ref_counts(reg_db, candidates)
+        logger.info("candidates_found", count=len(candidates))
+
+        # Step 3: Multi-layer verification. Registry, retention and
+        # exclusion checks run in one pass over pre-fetched data; only
+        # the survivors are checked against the database.
+        verified_orphans, rejected = _verify_orphans_bulk(
+            candidates,
+            ref_counts,
+            s3_keys,
+            state["exclude_tuple"],
+            config.retention_days,
+            cycle_now,
+        )
 
-            # Step 4: Backup and delete (if execute mode)
-            deleted_count = 0
-            backed_up_count = 0
+        if verified_orphans and config.cdc_connection_url and state["cdc_connection"]:
+            still_orphaned: List[str] = []
+            async with registry_connection(state["registry_db_path"]) as reg_db:
+                for s3_key in verified_orphans:
+                    if await _check_database_references(config, state, s3_key):
+                        # Fix registry
+                        async with async_registry_txn(reg_db):
+                            await increment_ref(reg_db, s3_key)
+                        rejected.append((s3_key, "found_in_database"))
+                    else:
+                        still_orphaned.append(s3_key)
+            verified_orphans = still_orphaned
+
+        for s3_key, reason in rejected:
+            skipped_keys.append(s3_key)
+            logger.debug(
+                "verification_failed", s3_key=s3_key, reason=reason
+            )
+
+        logger.info("orphans_verified", count=len(verified_orphans))
+
+        # Step 4: Backup and delete (if execute mode)
+        deleted_count = 0
+        backed_up_count = 0
+
+        if config.mode == GCMode.EXECUTE:
+            # Vault writes go through the pool's shared write connection.
+            # It runs synchronous=NORMAL; under WAL a committed batch
+            # survives a process crash, so the backup-before-delete
+            # ordering still holds.
+            vault_pool = state["vault_pool"]
+
+            # The operation row is committed together with the first
+            # batch of deletions (or on its own if no batch gets recorded)
+            operation_stats: dict | None = {
+                "candidates": len(candidates),
+                "verified": len(verified_orphans),
+            }
+
+            # Each batch is backed up concurrently, then its vault
+            # records and S3 deletes are flushed together so that every
+            # batch is recorded before any of it is deleted.
+            for start in range(0, len(verified_orphans), DELETE_BATCH_SIZE):
+                vault_writes = await _backup_batch(
+                    config, s3_client, operation_id,
+                    verified_orphans[start : start + DELETE_BATCH_SIZE],
+                    state["zstd_dicts"], errors,
+                )
+                if not vault_writes:
+                    continue
 
-            if config.mode == GCMode.EXECUTE:
-                async with aiosqlite.connect(state["vault_db_path"]) as vault_db:
-                    # Record operation
+                recorded, batch_deleted = await _record_and_delete_batch(
+                    config, s3_client, vault_pool, operation_id,
+                    vault_writes, errors, operation_stats,
+                )
+                if recorded:
+                    operation_stats = None
+                backed_up_count += recorded
+                deleted_count += len(batch_deleted)
+                deleted_keys.extend(batch_deleted)
+
+            if operation_stats is not None:
+                async with vault_pool.writer() as vault_db:
                     await record_operation(
-                        vault_db,
-                        operation_id,
-                        config.mode.value,
-                        {"candidates": len(candidates), "verified": len(verified_orphans)},
+                        vault_db, operation_id, config.mode.value, operation_stats
                     )
 
-                    for s3_key in verified_orphans:
-                        try:
-                            await _backup_and_delete(
-                                config,
-                                state,
-                                s3_client,
-                                vault_db,
-                                operation_id,
-                                s3_key,
-                            )
-                            deleted_count += 1
-                            backed_up_count += 1
-                            deleted_keys.append(s3_key)
-                        except Exception as e:
-                            error_msg = f"{s3_key}: {str(e)}"
-                            errors.append(error_msg)
-                            logger.error(
-                                "backup_delete_failed",
-                                s3_key=s3_key,
-                                error=str(e),
-                            )
-
-            elif config.mode == GCMode.AUDIT_ONLY:
-                # Record operation without deleting
-                async with aiosqlite.connect(state["vault_db_path"]) as vault_db:
-                    await record_operation(
-                        vault_db,
-                        operation_id,
-                        config.mode.value,
-                        {
-                            "candidates": len(candidates),
-                            "verified": len(verified_orphans),
-                            "would_delete": verified_orphans,
-                        },
-                    )
+            if backed_up_count and not state["zstd_dicts_trained"]:
+                await _train_first_dictionaries(state)
+
+        elif config.mode == GCMode.AUDIT_ONLY:
+            # Record operation without deleting
+            async with state["vault_pool"].writer() as vault_db:
+                await record_operation(
+                    vault_db,
+                    operation_id,
+                    config.mode.value,
+                    {
+                        "candidates": len(candidates),
+                        "verified": len(verified_orphans),
+                        "would_delete": verified_orphans,
+                    },
+                )
 
-        duration = (datetime.now(UTC) - start_time).total_seconds()
+        end_time = datetime.now(UTC)
+        duration = (end_time - start_time).total_seconds()
 
         # Update state
-        state["last_run_at"] = datetime.now(UTC)
+        state["last_run_at"] = end_time
+        state["last_run_at_iso"] = end_time.isoformat()
         state["total_runs"] += 1
         state["total_deleted"] += deleted_count
         state["total_backed_up"] += backed_up_count
@@ -305,9 +480,35 @@ async def run_gc_cycle(config: S3GCConfig, state: GCState) -> GCResult:
         raise
 
 
-async def _list_all_s3_keys(s3_client: Any, config: S3GCConfig) -> List[str]:
-    """List all S3 keys in the bucket."""
-    keys: List[str] = []
+async def _train_first_dictionaries(state: GCState) -> None:
+    """
+    Train the vault's first zstd dictionaries from its backups so far.
+
+    Runs after EXECUTE cycles until a bucket has enough small backups to
+    train on; later cycles compress with the result. Failures are logged
+    and never fail the GC cycle.
+    """
+    try:
+        async with state["vault_pool"].acquire() as vault_db:
+            trained = await train_dictionaries(vault_db, state["zstd_dicts"])
+    except Exception as e:
+        logger.warning("dict_training_failed", error=str(e))
+        return
+
+    if trained:
+        state["zstd_dicts_trained"] = True
+
+
+async def _list_all_s3_keys(
+    s3_client: Any, config: S3GCConfig
+) -> Dict[str, datetime]:
+    """
+    List all S3 keys in the bucket.
+
+    Returns:
+        Dictionary mapping each key to its LastModified time, in listing order
+    """
+    objects: Dict[str, datetime] = {}
     paginator = s3_client.get_paginator("list_objects_v2")
 
     async for page in paginator.paginate(
@@ -315,9 +516,89 @@ async def _list_all_s3_keys(s3_client: Any, config: S3GCConfig) -> List[str]:
         MaxKeys=config.s3_list_batch_size,
     ):
         for obj in page.get("Contents", []):
-            keys.append(obj["Key"])
+            objects[obj["Key"]] = obj["LastModified"]
+
+    return objects
+
+
+def _classify_orphan(
+    s3_key: str,
+    ref_count: int,
+    last_modified: datetime | None,
+    exclude_prefixes: tuple[str, ...],
+    retention_days: int,
+    retention_cutoff: datetime,
+) -> tuple[bool, str]:
+    """
+    Apply the local (registry, retention, exclusion) safety layers to one key.
+
+    Pure function with no I/O; the database layer is applied separately.
+
+    Args:
+        retention_days: Minimum object age in days
+        retention_cutoff: ``now - retention_days``, computed once per cycle
+            so that fresh-enough keys cost a single datetime comparison
+
+    Returns:
+        Tuple of (is_orphan, reason)
+    """
+    # Layer 1: Registry check
+    if ref_count > 0:
+        return (False, f"registry_ref_count={ref_count}")
 
-    return keys
+    # Layer 3: Retention gating
+    if last_modified is None:
+        # If we can't check age, err on the side of caution
+        return (False, "age_check_failed")
+    if last_modified > retention_cutoff:
+        # now - last_modified, in whole days
+        age_days = retention_days + (retention_cutoff - last_modified).days
+        return (False, f"too_recent_age={age_days}d")
+
+    # Layer 4: Exclusion prefixes
+    if s3_key.startswith(exclude_prefixes):
+        prefix = next(p for p in exclude_prefixes if s3_key.startswith(p))
+        return (False, f"excluded_prefix={prefix}")
+
+    return (True, "verified_orphan")
+
+
+def _verify_orphans_bulk(
+    keys: List[str],
+    ref_counts: Dict[str, int],
+    last_modified_map: Dict[str, datetime],
+    exclude_prefixes: tuple[str, ...],
+    retention_days: int,
+    now: datetime,
+) -> tuple[List[str], List[tuple[str, str]]]:
+    """
+    Run the local safety layers over all candidates in one pass.
+
+    Registry counts and LastModified times are looked up from
+    pre-fetched maps, so no per-key awaits are needed.
+
+    Returns:
+        Tuple of (passed_keys, [(rejected_key, reason), ...])
+    """
+    passed: List[str] = []
+    rejected: List[tuple[str, str]] = []
+    retention_cutoff = now - timedelta(days=retention_days)
+
+    for s3_key in keys:
+        is_orphan, reason = _classify_orphan(
+            s3_key,
+            ref_counts.get(s3_key, 0),
+            last_modified_map.get(s3_key),
+            exclude_prefixes,
+            retention_days,
+            retention_cutoff,
+        )
+        if is_orphan:
+            passed.append(s3_key)
+        else:
+            rejected.append((s3_key, reason))
+
+    return passed, rejected
 
 
 async def _verify_orphan(
@@ -325,48 +606,59 @@ async def _verify_orphan(
     state: GCState,
     s3_client: Any,
     s3_key: str,
+    now: datetime,
 ) -> tuple[bool, str]:
     """
-    Multi-layer verification to ensure object is truly orphaned.
+    Multi-layer verification to ensure a single object is truly orphaned.
+
+    The cheap local layers run first; the database is only queried for
+    keys that pass them. run_gc_cycle uses the bulk equivalent.
+
+    Args:
+        config: S3GC configuration
+        state: Runtime state
+        s3_client: S3 client
+        s3_key: Candidate S3 key
+        now: Reference time for retention gating (captured once per cycle)
 
     Returns:
         Tuple of (is_orphan, reason)
     """
-    import aiosqlite
-
-    from s3gc.registry import get_ref_count, increment_ref
-
     # Layer 1: Registry check
-    async with aiosqlite.connect(state["registry_db_path"]) as reg_db:
+    async with registry_connection(state["registry_db_path"]) as reg_db:
         ref_count = await get_ref_count(reg_db, s3_key)
         if ref_count > 0:
             return (False, f"registry_ref_count={ref_count}")
 
+    # Layer 3 input: object age
+    try:
+        response = await s3_client.head_object(Bucket=config.bucket, Key=s3_key)
+        last_modified = response["LastModified"]
+    except Exception:
+        last_modified = None
+
+    # Layers 1, 3 and 4
+    is_orphan, reason = _classify_orphan(
+        s3_key,
+        ref_count,
+        last_modified,
+        state["exclude_tuple"],
+        config.retention_days,
+        now - timedelta(days=config.retention_days),
+    )
+    if not is_orphan:
+        return (is_orphan, reason)
+
     # Layer 2: Database verification (if CDC enabled)
     if config.cdc_connection_url and state["cdc_connection"]:
         exists = await _check_database_references(config, state, s3_key)
         if exists:
             # Fix registry
-            async with aiosqlite.connect(state["registry_db_path"]) as reg_db:
-                await increment_ref(reg_db, s3_key)
+            async with registry_connection(state["registry_db_path"]) as reg_db:
+                async with async_registry_txn(reg_db):
+                    await increment_ref(reg_db, s3_key)
             return (False, "found_in_database")
 
-    # Layer 3: Retention gating
-    try:
-        response = await s3_client.head_object(Bucket=config.bucket, Key=s3_key)
-        last_modified = response["LastModified"]
-        age_days = (datetime.now(UTC) - last_modified).days
-        if age_days < config.retention_days:
-            return (False, f"too_recent_age={age_days}d")
-    except Exception:
-        # If we can't check age, err on the side of caution
-        return (False, "age_check_failed")
-
-    # Layer 4: Exclusion prefixes
-    for prefix in config.exclude_prefixes:
-        if s3_key.startswith(prefix):
-            return (False, f"excluded_prefix={prefix}")
-
     return (True, "verified_orphan")
 
 
@@ -376,107 +668,187 @@ async def _check_database_references(
     s3_key: str,
 ) -> bool:
     """Check if S3 key is referenced in any tracked database column."""
-    if not config.tables:
+    if not state["cdc_pairs"]:
         return False
 
     conn = state["cdc_connection"]
     if conn is None:
         return False
 
-    for table, columns in config.tables.items():
-        for column in columns:
-            # Use parameterized query
-            if config.cdc_backend and config.cdc_backend.value == "postgres":
-                result = await conn.fetchval(
-                    f"SELECT 1 FROM {table} WHERE {column} LIKE $1 LIMIT 1",
-                    f"%{s3_key}%",
-                )
-            else:
-                # MySQL
-                async with conn.acquire() as mysql_conn:
-                    async with mysql_conn.cursor() as cursor:
-                        await cursor.execute(
-                            f"SELECT 1 FROM {table} WHERE {column} LIKE %s LIMIT 1",
-                            (f"%{s3_key}%",),
-                        )
-                        result = await cursor.fetchone()
-
-            if result:
-                return True
+    # run_gc_cycle prepares these per cycle; direct callers get them here
+    if not state["cdc_prepared"]:
+        state["cdc_prepared"] = await _prepare_cdc_statements(state)
+
+    pattern = f"%{s3_key}%"
+
+    for query in state["cdc_prepared"].values():
+        if state["cdc_is_postgres"]:
+            result = await query.fetchval(pattern)
+        else:
+            # MySQL
+            async with conn.acquire() as mysql_conn:
+                async with mysql_conn.cursor() as cursor:
+                    await cursor.execute(query, (pattern,))
+                    result = await cursor.fetchone()
+
+        if result:
+            return True
 
     return False
 
 
-async def _backup_and_delete(
+async def _backup_object(
     config: S3GCConfig,
-    state: GCState,
     s3_client: Any,
-    vault_db: Any,
     operation_id: str,
     s3_key: str,
-) -> None:
-    """Atomic backup-then-delete operation."""
-    import structlog
-
-    from s3gc.backup import write_backup_file
-    from s3gc.vault import record_deletion
-    from s3gc.vault.compressor import compress_for_backup
-
-    logger = structlog.get_logger()
+    dictionaries: ZstdDictionaries | None = None,
+) -> tuple[str, str, int, int, bytes]:
+    """
+    Download, compress and write the backup file for one object.
 
+    Returns:
+        Vault row of (s3_key, backup_path, original_size, compressed_size,
+        content_hash), content_hash being the backup file's SHA-256 digest
+    """
     # Step 1: Download from S3
     response = await s3_client.get_object(Bucket=config.bucket, Key=s3_key)
     async with response["Body"] as stream:
         original_bytes = await stream.read()
     original_size = len(original_bytes)
 
-    # Step 2: Compress (if enabled)
+    # Steps 2-3: Compress (if enabled), hash and write the backup file.
+    # Image preprocessing runs first; the rest is one worker-thread hop.
+    encode = executor = None
     if config.compress_backups:
-        compressed_bytes = await compress_for_backup(s3_key, original_bytes)
-    else:
-        compressed_bytes = original_bytes
-    compressed_size = len(compressed_bytes)
-
-    # Step 3: Write backup file
-    backup_path = await write_backup_file(
-        config.vault_path, operation_id, s3_key, compressed_bytes
+        encode, executor = await prepare_backup_compression(
+            s3_key, original_bytes, dictionaries=dictionaries
+        )
+    backup_path, compressed_size, content_hash = await store_backup(
+        config.vault_path, operation_id, s3_key, original_bytes, encode, executor
     )
 
-    # Step 4: Record in vault DB (must succeed before delete)
-    await record_deletion(
-        vault_db,
-        operation_id,
-        s3_key,
-        str(backup_path),
-        original_size,
-        compressed_size,
+    return (s3_key, str(backup_path), original_size, compressed_size, content_hash)
+
+
+async def _backup_batch(
+    config: S3GCConfig,
+    s3_client: Any,
+    operation_id: str,
+    s3_keys: List[str],
+    dictionaries: ZstdDictionaries | None,
+    errors: List[str],
+) -> List[tuple]:
+    """
+    Back up a batch of objects, BACKUP_CONCURRENCY at a time.
+
+    Failures are appended to ``errors`` and their keys left out.
+
+    Returns:
+        Vault rows of the backed-up objects, in the order of ``s3_keys``
+    """
+    semaphore = asyncio.Semaphore(BACKUP_CONCURRENCY)
+
+    async def backup(s3_key: str) -> tuple[str, str, int, int, bytes]:
+        async with semaphore:
+            return await _backup_object(
+                config, s3_client, operation_id, s3_key, dictionaries
+            )
+
+    results = await asyncio.gather(
+        *(backup(s3_key) for s3_key in s3_keys), return_exceptions=True
     )
 
-    # Step 5: Delete from S3 (only after backup recorded)
-    await s3_client.delete_object(Bucket=config.bucket, Key=s3_key)
+    vault_writes: List[tuple] = []
+    for s3_key, result in zip(s3_keys, results):
+        if isinstance(result, BaseException):
+            if not isinstance(result, Exception):
+                raise result
+            errors.append(f"{s3_key}: {str(result)}")
+            logger.error("backup_failed", s3_key=s3_key, error=str(result))
+        else:
+            vault_writes.append(result)
+    return vault_writes
+
+
+async def _record_and_delete_batch(
+    config: S3GCConfig,
+    s3_client: Any,
+    vault_pool: VaultPool,
+    operation_id: str,
+    vault_writes: List[tuple],
+    errors: List[str],
+    operation_stats: dict | None = None,
+) -> tuple[int, List[str]]:
+    """
+    Record a batch of backups in the vault, then delete them from S3.
+
+    The vault rows are committed in one transaction before the matching
+    DeleteObjects request is issued, so the backup-before-delete invariant
+    holds for the whole batch. Failures are appended to ``errors``.
+
+    For a run's first batch pass ``operation_stats``: the operation row
+    is then inserted in the same transaction as the deletions.
+
+    Returns:
+        Tuple of (recorded_count, deleted_keys)
+    """
+    keys = [row[0] for row in vault_writes]
+
+    # Step 4: Record in vault DB (must succeed before delete). The write
+    # connection is only held for the insert, not for the S3 round trip.
+    try:
+        async with vault_pool.writer() as vault_db:
+            if operation_stats is not None:
+                await start_operation_with_deletions(
+                    vault_db, operation_id, config.mode.value,
+                    operation_stats, vault_writes,
+                )
+            else:
+                await record_deletions(vault_db, operation_id, vault_writes)
+    except Exception as e:
+        errors.extend(f"{s3_key}: {str(e)}" for s3_key in keys)
+        logger.error("vault_record_failed", count=len(keys), error=str(e))
+        return (0, [])
+
+    # Step 5: Delete from S3 (only after backups recorded)
+    try:
+        response = await s3_client.delete_objects(
+            Bucket=config.bucket,
+            Delete={"Objects": [{"Key": s3_key} for s3_key in keys], "Quiet": True},
+        )
+    except Exception as e:
+        errors.extend(f"{s3_key}: {str(e)}" for s3_key in keys)
+        logger.error("batch_delete_failed", count=len(keys), error=str(e))
+        return (len(keys), [])
+
+    failed = {}
+    for error in response.get("Errors", []):
+        failed[error["Key"]] = error.get("Message", error.get("Code", "delete failed"))
+        errors.append(f"{error['Key']}: {failed[error['Key']]}")
+        logger.error("delete_failed", s3_key=error["Key"], error=failed[error["Key"]])
+
+    deleted = [s3_key for s3_key in keys if s3_key not in failed]
 
     logger.info(
-        "object_backed_up_and_deleted",
-        s3_key=s3_key,
-        backup_path=str(backup_path),
-        original_size=original_size,
-        compressed_size=compressed_size,
+        "batch_backed_up_and_deleted",
+        operation_id=operation_id,
+        deleted=len(deleted),
+        failed=len(failed),
     )
 
+    return (len(keys), deleted)
+
 
 async def get_metrics(config: S3GCConfig, state: GCState) -> GCMetrics:
     """Get current GC metrics."""
-    import aiosqlite
-
     # Calculate vault size
-    vault_size = sum(
-        f.stat().st_size for f in config.vault_path.rglob("*") if f.is_file()
-    )
+    vault_size = _dir_size(config.vault_path)
 
     # Calculate average compression ratio from vault records
     avg_compression = 0.0
     try:
-        async with aiosqlite.connect(state["vault_db_path"]) as db:
+        async with state["vault_pool"].acquire() as db:
             async with db.execute(
                 """
                 SELECT AVG(CAST(original_size AS FLOAT) / NULLIF(compressed_size, 0))
@@ -502,12 +874,30 @@ async def get_metrics(config: S3GCConfig, state: GCState) -> GCMetrics:
     )
 
 
-async def shutdown_gc_state(state: GCState) -> None:
-    """Cleanup resources."""
-    import structlog
+def _dir_size(path: Path) -> int:
+    """
+    Total size in bytes of regular files under a directory.
+
+    Uses os.scandir so file sizes come from the directory entries rather
+    than a separate Path.stat() per file.
+    """
+    total = 0
+    stack = [str(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+                    elif entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except FileNotFoundError:
+            continue
+    return total
 
-    logger = structlog.get_logger()
 
+async def shutdown_gc_state(state: GCState) -> None:
+    """Cleanup resources."""
     # Stop CDC if running
     if state["cdc_stop"]:
         try:
@@ -515,6 +905,14 @@ async def shutdown_gc_state(state: GCState) -> None:
         except Exception as e:
             logger.warning("cdc_stop_failed", error=str(e))
 
+    # Apply any buffered registry changes (after CDC has stopped producing)
+    if state["registry_batcher"] is not None:
+        try:
+            await state["registry_batcher"].close()
+        except Exception as e:
+            logger.warning("registry_batcher_close_failed", error=str(e))
+        state["registry_batcher"] = None
+
     # Close CDC connection
     if state["cdc_connection"]:
         try:
@@ -522,4 +920,22 @@ async def shutdown_gc_state(state: GCState) -> None:
         except Exception as e:
             logger.warning("cdc_connection_close_failed", error=str(e))
 
+    # Close pooled vault connections
+    await state["vault_pool"].close()
+
+    # Close shared S3 client
+    if state["s3_exit_stack"] is not None:
+        try:
+            await state["s3_exit_stack"].aclose()
+        except Exception as e:
+            logger.warning("s3_client_close_failed", error=str(e))
+        state["s3_client"] = None
+        state["s3_exit_stack"] = None
+
+    # Close pooled replication connections, bound to this event loop
+    await close_replication_pools()
+
+    # Release compression threads and worker processes
+    shutdown_executors()
+
     logger.info("gc_state_shutdown_complete")
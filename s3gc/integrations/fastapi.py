@@ -11,15 +11,18 @@ This module provides a complete integration with FastAPI including:
 - Health checks
 """
 
+import asyncio
+import hmac
+import json
 import os
+import time
 from contextlib import asynccontextmanager
 from dataclasses import asdict
-from datetime import datetime
-from typing import Any, Callable
+from datetime import datetime, UTC
+from typing import Any, Callable, Dict, List
 
-import aiosqlite
 import structlog
-from fastapi import Depends, FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from s3gc.backup.restore import RestoreResult, restore_operation, restore_single_by_key
@@ -30,6 +33,7 @@ from s3gc.core import (
     GCResult,
     GCState,
     get_metrics,
+    get_s3_client,
     initialize_gc_state,
     run_gc_cycle,
     shutdown_gc_state,
@@ -40,28 +44,80 @@ from s3gc.env import (
     create_config_from_env,
     safe_defaults,
 )
-from s3gc.registry import create_registry_handler
+from s3gc.registry import RegistryBatcher
 from s3gc.vault import get_vault_stats, list_operations
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast-json" extra
+    orjson = None
+
 logger = structlog.get_logger()
 
 # Security
 security = HTTPBearer(auto_error=False)
 
+# How long a /metrics body is served from cache while nothing has changed.
+# Bounds how stale vault_size_bytes can get between GC runs.
+METRICS_CACHE_TTL_SECONDS = 1.0
+
+# How long an S3/CDC reachability verdict is reused by /health, so frequent
+# liveness polling does not turn into constant upstream API traffic.
+HEALTH_PROBE_TTL_SECONDS = 10.0
+
+# Largest page /operations serves; larger limits are rejected with a 422
+MAX_OPERATIONS_PAGE_SIZE = 500
+
+
+# (unix second, ISO-8601 string) for the /health timestamp
+_now_iso_cache: tuple[int, str] = (0, "")
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time as ISO-8601, formatted at most once per second."""
+    global _now_iso_cache
+
+    second = int(time.time())
+    if _now_iso_cache[0] != second:
+        _now_iso_cache = (
+            second,
+            datetime.fromtimestamp(second, UTC).isoformat(),
+        )
+    return _now_iso_cache[1]
+
+
+def _json_response(body: bytes) -> Response:
+    """Wrap a pre-serialized JSON body so FastAPI skips re-encoding it."""
+    return Response(content=body, media_type="application/json")
+
+
+def _dump_json(payload: dict) -> bytes:
+    """
+    Serialize a response body to compact JSON bytes.
+
+    Uses orjson when it is installed, otherwise the stdlib encoder with
+    the same separators as FastAPI's JSONResponse.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode()
+
 
 async def verify_api_key(
+    request: Request,
     credentials: HTTPAuthorizationCredentials | None = Depends(security),
 ) -> bool:
     """
     Verify API key from Authorization header.
 
-    The API key is read from the S3GC_ADMIN_API_KEY environment variable.
+    The API key is read from the S3GC_ADMIN_API_KEY environment variable
+    once, when the routes are registered (see register_s3gc_routes).
     Requests must include: Authorization: Bearer <api_key>
 
     Raises:
         HTTPException: If API key is missing or invalid
     """
-    api_key = os.getenv("S3GC_ADMIN_API_KEY")
+    api_key: bytes | None = getattr(request.app.state, "s3gc_api_key", None)
 
     if not api_key:
         raise HTTPException(
@@ -75,7 +131,8 @@ async def verify_api_key(
             detail="Authorization header required",
         )
 
-    if credentials.credentials != api_key:
+    # Constant-time comparison so response timing doesn't leak the key
+    if not hmac.compare_digest(credentials.credentials.encode(), api_key):
         raise HTTPException(
             status_code=403,
             detail="Invalid API key",
@@ -84,66 +141,102 @@ async def verify_api_key(
     return True
 
 
-def register_s3gc_routes(
-    app: FastAPI,
-    config: S3GCConfig,
-    state: GCState,
-    prefix: str = "/admin/s3gc",
-) -> None:
-    """
-    Register S3GC admin endpoints on a FastAPI app.
+def _config_body(config: S3GCConfig) -> bytes:
+    """Serialize the /config response (sensitive values redacted)."""
+    return _dump_json(
+        {
+            "bucket": config.bucket,
+            "region": config.region,
+            "mode": config.mode.value,
+            "retention_days": config.retention_days,
+            "exclude_prefixes": config.exclude_prefixes,
+            "tables": config.tables,
+            "backup_before_delete": config.backup_before_delete,
+            "compress_backups": config.compress_backups,
+            "cdc_backend": config.cdc_backend.value if config.cdc_backend else None,
+            "cdc_enabled": config.cdc_backend is not None,
+            "replication_enabled": config.replication_enabled,
+            "schedule_cron": config.schedule_cron,
+        }
+    )
 
-    All endpoints require Bearer token authentication.
 
-    Args:
-        app: FastAPI application
-        config: S3GC configuration
-        state: Runtime state
-        prefix: URL prefix for endpoints (default: /admin/s3gc)
+async def _cached_probe(
+    request: Request, name: str, probe: Callable[[], Any]
+) -> tuple[bool, str | None]:
+    """Run a health probe at most once per HEALTH_PROBE_TTL_SECONDS."""
+    # probe name -> (ok, error, expires_at)
+    probe_cache: Dict[str, tuple[bool, str | None, float]] = (
+        request.app.state.s3gc_cache["probes"]
+    )
+    now = time.monotonic()
+    cached = probe_cache.get(name)
+    if cached is not None and now < cached[2]:
+        return (cached[0], cached[1])
+
+    ok, error = await probe()
+    probe_cache[name] = (ok, error, now + HEALTH_PROBE_TTL_SECONDS)
+    return (ok, error)
+
+
+async def trigger_gc(request: Request) -> Response:
     """
+    Manually trigger a GC cycle.
 
-    @app.post(f"{prefix}/run", dependencies=[Depends(verify_api_key)])
-    async def trigger_gc() -> dict:
-        """
-        Manually trigger a GC cycle.
+    Returns the GC result including deleted objects count.
+    """
+    app = request.app
+    result = await run_gc_cycle(get_s3gc_config(app), get_s3gc_state(app))
+    return _json_response(_dump_json(asdict(result)))
 
-        Returns the GC result including deleted objects count.
-        """
-        result = await run_gc_cycle(config, state)
-        return asdict(result)
 
-    @app.get(f"{prefix}/status", dependencies=[Depends(verify_api_key)])
-    async def get_status() -> dict:
-        """
-        Get current GC status.
-
-        Returns last run time, total runs, and current mode.
-        """
-        return {
-            "last_run_at": (
-                state["last_run_at"].isoformat() if state["last_run_at"] else None
-            ),
-            "total_runs": state["total_runs"],
-            "total_deleted": state["total_deleted"],
-            "total_backed_up": state["total_backed_up"],
-            "mode": config.mode.value,
-            "bucket": config.bucket,
-            "retention_days": config.retention_days,
-        }
+async def get_status(request: Request) -> Response:
+    """
+    Get current GC status.
+
+    Returns last run time, total runs, and current mode.
+    """
+    config = get_s3gc_config(request.app)
+    state = get_s3gc_state(request.app)
+    status_cache = request.app.state.s3gc_cache["status"]
+
+    key = (state["total_runs"], state["last_run_at"])
+    if status_cache["key"] != key:
+        status_cache["body"] = _dump_json(
+            {
+                "last_run_at": state["last_run_at_iso"],
+                "total_runs": state["total_runs"],
+                "total_deleted": state["total_deleted"],
+                "total_backed_up": state["total_backed_up"],
+                "mode": config.mode.value,
+                "bucket": config.bucket,
+                "retention_days": config.retention_days,
+            }
+        )
+        status_cache["key"] = key
+    return _json_response(status_cache["body"])
+
 
-    @app.get(f"{prefix}/metrics", dependencies=[Depends(verify_api_key)])
-    async def get_gc_metrics() -> dict:
-        """
-        Get detailed GC metrics.
+async def get_gc_metrics(request: Request) -> Response:
+    """
+    Get detailed GC metrics.
 
-        Returns metrics including vault size and compression ratio.
-        """
-        metrics = await get_metrics(config, state)
-        return {
+    Returns metrics including vault size and compression ratio.
+    """
+    config = get_s3gc_config(request.app)
+    state = get_s3gc_state(request.app)
+    metrics_cache = request.app.state.s3gc_cache["metrics"]
+
+    key = (state["total_runs"], state["total_restored"], state["last_error"])
+    now = time.monotonic()
+    if metrics_cache["key"] == key and now < metrics_cache["expires_at"]:
+        return _json_response(metrics_cache["body"])
+
+    metrics = await get_metrics(config, state)
+    metrics_cache["body"] = _dump_json(
+        {
             "total_runs": metrics.total_runs,
-            "last_run_at": (
-                metrics.last_run_at.isoformat() if metrics.last_run_at else None
-            ),
+            "last_run_at": state["last_run_at_iso"],
             "total_deleted": metrics.total_deleted,
             "total_backed_up": metrics.total_backed_up,
             "total_restored": metrics.total_restored,
@@ -152,139 +245,215 @@ def register_s3gc_routes(
             "avg_compression_ratio": metrics.avg_compression_ratio,
             "last_error": metrics.last_error,
         }
+    )
+    metrics_cache["key"] = key
+    metrics_cache["expires_at"] = now + METRICS_CACHE_TTL_SECONDS
+    return _json_response(metrics_cache["body"])
+
+
+async def restore_gc_operation(
+    request: Request,
+    operation_id: str,
+    dry_run: bool = True,
+    skip_existing: bool = True,
+) -> dict:
+    """
+    Restore deleted objects from a GC operation.
 
-    @app.post(f"{prefix}/restore/{{operation_id}}", dependencies=[Depends(verify_api_key)])
-    async def restore_gc_operation(
-        operation_id: str,
-        dry_run: bool = True,
-        skip_existing: bool = True,
-    ) -> dict:
-        """
-        Restore deleted objects from a GC operation.
-
-        Args:
-            operation_id: The operation ID to restore
-            dry_run: If true, only report what would be restored
-            skip_existing: Skip objects that already exist in S3
-        """
-        async with aiosqlite.connect(state["vault_db_path"]) as vault_db:
-            result = await restore_operation(
-                config, state, vault_db, operation_id, dry_run, skip_existing
-            )
-            return asdict(result)
-
-    @app.post(f"{prefix}/restore-key", dependencies=[Depends(verify_api_key)])
-    async def restore_single_key(
-        s3_key: str,
-        dry_run: bool = True,
-    ) -> dict:
-        """
-        Restore a single deleted object by its S3 key.
-
-        Args:
-            s3_key: The S3 key to restore
-            dry_run: If true, only report what would be restored
-        """
-        result = await restore_single_by_key(config, state, s3_key, dry_run)
+    Args:
+        operation_id: The operation ID to restore
+        dry_run: If true, only report what would be restored
+        skip_existing: Skip objects that already exist in S3
+    """
+    config = get_s3gc_config(request.app)
+    state = get_s3gc_state(request.app)
+    async with state["vault_pool"].acquire() as vault_db:
+        result = await restore_operation(
+            config, state, vault_db, operation_id, dry_run, skip_existing
+        )
         return asdict(result)
 
-    @app.get(f"{prefix}/operations", dependencies=[Depends(verify_api_key)])
-    async def list_gc_operations(
-        limit: int = 50,
-        offset: int = 0,
-        mode: str | None = None,
-    ) -> list:
-        """
-        List GC operations with pagination.
-
-        Args:
-            limit: Maximum number of operations to return
-            offset: Number of operations to skip
-            mode: Filter by mode (dry_run, audit_only, execute)
-        """
-        async with aiosqlite.connect(state["vault_db_path"]) as vault_db:
-            operations = await list_operations(vault_db, limit, offset, mode)
-            return operations
-
-    @app.get(f"{prefix}/vault-stats", dependencies=[Depends(verify_api_key)])
-    async def get_vault_statistics() -> dict:
-        """
-        Get vault statistics including storage usage.
-        """
-        async with aiosqlite.connect(state["vault_db_path"]) as vault_db:
-            return await get_vault_stats(vault_db)
-
-    @app.get(f"{prefix}/health", dependencies=[Depends(verify_api_key)])
-    async def health_check() -> dict:
-        """
-        Health check endpoint.
-
-        Verifies vault and S3 connectivity.
-        """
-        # Check vault accessible
-        vault_ok = state["vault_db_path"].exists()
-
-        # Check S3 reachable
-        s3_ok = False
-        s3_error = None
+
+async def restore_single_key(
+    request: Request,
+    s3_key: str,
+    dry_run: bool = True,
+) -> dict:
+    """
+    Restore a single deleted object by its S3 key.
+
+    Args:
+        s3_key: The S3 key to restore
+        dry_run: If true, only report what would be restored
+    """
+    config = get_s3gc_config(request.app)
+    state = get_s3gc_state(request.app)
+    result = await restore_single_by_key(config, state, s3_key, dry_run)
+    return asdict(result)
+
+
+async def list_gc_operations(
+    request: Request,
+    limit: int = Query(50, ge=1, le=MAX_OPERATIONS_PAGE_SIZE),
+    cursor: str | None = None,
+    mode: str | None = None,
+) -> dict:
+    """
+    List GC operations, newest first, one page at a time.
+
+    Args:
+        limit: Maximum number of operations to return (1 to
+            MAX_OPERATIONS_PAGE_SIZE)
+        cursor: ``next_cursor`` from the previous page
+        mode: Filter by mode (dry_run, audit_only, execute)
+    """
+    state = get_s3gc_state(request.app)
+    async with state["vault_pool"].acquire() as vault_db:
+        operations = await list_operations(vault_db, limit, mode=mode, cursor=cursor)
+
+    # A short page is the last one
+    next_cursor = (
+        operations[-1]["id"] if operations and len(operations) == limit else None
+    )
+    return {"items": operations, "next_cursor": next_cursor}
+
+
+async def get_vault_statistics(request: Request) -> Response:
+    """
+    Get vault statistics including storage usage.
+    """
+    state = get_s3gc_state(request.app)
+    async with state["vault_pool"].acquire() as vault_db:
+        stats = await get_vault_stats(vault_db)
+    return _json_response(_dump_json(stats))
+
+
+async def health_check(request: Request) -> Response:
+    """
+    Health check endpoint.
+
+    Verifies vault and S3 connectivity. S3 and CDC results are
+    reused for HEALTH_PROBE_TTL_SECONDS between real probes.
+    """
+    config = get_s3gc_config(request.app)
+    state = get_s3gc_state(request.app)
+
+    async def _check_vault() -> tuple[bool, str | None]:
+        return (state["vault_db_path"].exists(), None)
+
+    async def _check_s3() -> tuple[bool, str | None]:
         try:
-            async with state["s3_session"].create_client(
-                "s3",
-                region_name=config.region,
-            ) as s3_client:
-                await s3_client.head_bucket(Bucket=config.bucket)
-                s3_ok = True
+            s3_client = await get_s3_client(config, state)
+            await s3_client.head_bucket(Bucket=config.bucket)
+            return (True, None)
         except Exception as e:
-            s3_error = str(e)
+            return (False, str(e))
 
-        # Check CDC if enabled
-        cdc_ok = True
-        cdc_error = None
-        if config.cdc_backend and state["cdc_connection"]:
-            try:
-                # Ping connection
-                if config.cdc_backend.value == "postgres":
-                    await state["cdc_connection"].fetchval("SELECT 1")
-                cdc_ok = True
-            except Exception as e:
-                cdc_ok = False
-                cdc_error = str(e)
-
-        status = "healthy"
-        if not vault_ok or not s3_ok:
-            status = "degraded"
-        if not vault_ok and not s3_ok:
-            status = "unhealthy"
-
-        return {
-            "status": status,
-            "vault_accessible": vault_ok,
-            "s3_reachable": s3_ok,
-            "s3_error": s3_error,
-            "cdc_connected": cdc_ok if config.cdc_backend else None,
-            "cdc_error": cdc_error,
-            "timestamp": datetime.utcnow().isoformat(),
-        }
+    async def _check_cdc() -> tuple[bool, str | None]:
+        if not (config.cdc_backend and state["cdc_connection"]):
+            return (True, None)
+        try:
+            # Ping connection
+            if config.cdc_backend.value == "postgres":
+                await state["cdc_connection"].fetchval("SELECT 1")
+            return (True, None)
+        except Exception as e:
+            return (False, str(e))
+
+    # Probes are independent, so latency is the slowest one, not the sum
+    (vault_ok, _), (s3_ok, s3_error), (cdc_ok, cdc_error) = await asyncio.gather(
+        _check_vault(),
+        _cached_probe(request, "s3", _check_s3),
+        _cached_probe(request, "cdc", _check_cdc),
+    )
+
+    status = "healthy"
+    if not vault_ok or not s3_ok:
+        status = "degraded"
+    if not vault_ok and not s3_ok:
+        status = "unhealthy"
+
+    return _json_response(
+        _dump_json(
+            {
+                "status": status,
+                "vault_accessible": vault_ok,
+                "s3_reachable": s3_ok,
+                "s3_error": s3_error,
+                "cdc_connected": cdc_ok if config.cdc_backend else None,
+                "cdc_error": cdc_error,
+                "timestamp": _utc_now_iso(),
+            }
+        )
+    )
 
-    @app.get(f"{prefix}/config", dependencies=[Depends(verify_api_key)])
-    async def get_config() -> dict:
-        """
-        Get current configuration (sensitive values redacted).
-        """
-        return {
-            "bucket": config.bucket,
-            "region": config.region,
-            "mode": config.mode.value,
-            "retention_days": config.retention_days,
-            "exclude_prefixes": config.exclude_prefixes,
-            "tables": config.tables,
-            "backup_before_delete": config.backup_before_delete,
-            "compress_backups": config.compress_backups,
-            "cdc_backend": config.cdc_backend.value if config.cdc_backend else None,
-            "cdc_enabled": config.cdc_backend is not None,
-            "replication_enabled": config.replication_enabled,
-            "schedule_cron": config.schedule_cron,
-        }
+
+async def get_config(request: Request) -> Response:
+    """
+    Get current configuration (sensitive values redacted).
+    """
+    return _json_response(request.app.state.s3gc_cache["config_body"])
+
+
+# (path, method, handler) for every admin endpoint, relative to the prefix
+ROUTES: List[tuple[str, str, Callable[..., Any]]] = [
+    ("/run", "POST", trigger_gc),
+    ("/status", "GET", get_status),
+    ("/metrics", "GET", get_gc_metrics),
+    ("/restore/{operation_id}", "POST", restore_gc_operation),
+    ("/restore-key", "POST", restore_single_key),
+    ("/operations", "GET", list_gc_operations),
+    ("/vault-stats", "GET", get_vault_statistics),
+    ("/health", "GET", health_check),
+    ("/config", "GET", get_config),
+]
+
+
+def register_s3gc_routes(
+    app: FastAPI,
+    config: S3GCConfig,
+    state: GCState,
+    prefix: str = "/admin/s3gc",
+) -> None:
+    """
+    Register S3GC admin endpoints on a FastAPI app.
+
+    All endpoints require Bearer token authentication. The handlers are
+    module-level and read config/state from ``app.state``.
+
+    Args:
+        app: FastAPI application
+        config: S3GC configuration
+        state: Runtime state
+        prefix: URL prefix for endpoints (default: /admin/s3gc)
+    """
+    api_key = os.getenv("S3GC_ADMIN_API_KEY")
+    if not api_key:
+        # Admin endpoints answer 500 until the key is configured; the host
+        # app and scheduled GC keep running
+        logger.error("s3gc_admin_api_key_missing")
+    app.state.s3gc_api_key = api_key.encode() if api_key else None
+
+    app.state.s3gc_config = config
+    app.state.s3gc_state = state
+
+    # The config is frozen, so /config is serialized exactly once. /status
+    # only changes when a cycle finishes. /metrics is rebuilt when the
+    # run/restore/error state changes or its TTL expires.
+    app.state.s3gc_cache = {
+        "config_body": _config_body(config),
+        "status": {"key": None, "body": b""},
+        "metrics": {"key": None, "expires_at": 0.0, "body": b""},
+        "probes": {},
+    }
+
+    for path, method, handler in ROUTES:
+        app.add_api_route(
+            f"{prefix}{path}",
+            handler,
+            methods=[method],
+            dependencies=[Depends(verify_api_key)],
+        )
 
 
 def setup_s3gc_plugin(
@@ -297,11 +466,14 @@ def setup_s3gc_plugin(
 
     This is the main entry point for integrating S3GC with a FastAPI app.
     It sets up:
-    - Startup/shutdown lifecycle events
+    - Startup/shutdown lifecycle (via s3gc_lifespan)
     - Admin endpoints
     - CDC if configured
     - Scheduled tasks if configured
 
+    The app's existing lifespan (including any on_event handlers) keeps
+    running inside the S3GC one.
+
     Args:
         app: FastAPI application
         config: S3GC configuration
@@ -311,49 +483,52 @@ def setup_s3gc_plugin(
     app.state.s3gc_config = config
     app.state.s3gc_state = None
 
-    @app.on_event("startup")
-    async def startup():
-        """Initialize S3GC on app startup."""
-        logger.info("s3gc_plugin_starting", bucket=config.bucket, mode=config.mode.value)
+    app_lifespan = app.router.lifespan_context
 
-        # Initialize state
-        state = await initialize_gc_state(config)
-        app.state.s3gc_state = state
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        async with s3gc_lifespan(app, config, prefix):
+            async with app_lifespan(app) as app_state:
+                yield app_state
 
-        # Register routes
-        register_s3gc_routes(app, config, state, prefix)
+    app.router.lifespan_context = lifespan
 
-        # Start CDC if enabled
-        if config.cdc_backend and config.cdc_connection_url:
-            try:
-                handler = create_registry_handler(state["registry_db_path"])
-                stop_cdc = await start_cdc_capture(
-                    config.cdc_backend.value,
-                    config.cdc_connection_url,
-                    config.tables,
-                    handler,
-                )
-                state["cdc_stop"] = stop_cdc
-                logger.info("cdc_started", backend=config.cdc_backend.value)
-            except Exception as e:
-                logger.error("cdc_start_failed", error=str(e))
 
-        # Setup scheduled task if configured
-        if config.schedule_cron:
-            _setup_scheduled_task(config, state)
+async def _init_s3gc(app: FastAPI, config: S3GCConfig, prefix: str) -> GCState:
+    """Initialize state, routes, CDC and the scheduler for an app."""
+    logger.info("s3gc_plugin_starting", bucket=config.bucket, mode=config.mode.value)
 
-        logger.info("s3gc_plugin_started")
+    # Initialize state
+    state = await initialize_gc_state(config)
+    app.state.s3gc_state = state
+    app.state.s3gc_config = config
 
-    @app.on_event("shutdown")
-    async def shutdown():
-        """Cleanup S3GC on app shutdown."""
-        logger.info("s3gc_plugin_stopping")
+    # Register routes
+    register_s3gc_routes(app, config, state, prefix)
 
-        state = app.state.s3gc_state
-        if state:
-            await shutdown_gc_state(state)
+    # Start CDC if enabled
+    if config.cdc_backend and config.cdc_connection_url:
+        try:
+            batcher = RegistryBatcher(state["registry_db_path"])
+            await batcher.start()
+            state["registry_batcher"] = batcher
+            stop_cdc = await start_cdc_capture(
+                config.cdc_backend.value,
+                config.cdc_connection_url,
+                config.tables,
+                batcher.handler,
+            )
+            state["cdc_stop"] = stop_cdc
+            logger.info("cdc_started", backend=config.cdc_backend.value)
+        except Exception as e:
+            logger.error("cdc_start_failed", error=str(e))
 
-        logger.info("s3gc_plugin_stopped")
+    # Setup scheduled task if configured
+    if config.schedule_cron:
+        _setup_scheduled_task(config, state)
+
+    logger.info("s3gc_plugin_started")
+    return state
 
 
 def _setup_scheduled_task(config: S3GCConfig, state: GCState) -> None:
@@ -404,9 +579,13 @@ def _setup_scheduled_task(config: S3GCConfig, state: GCState) -> None:
 
 
 @asynccontextmanager
-async def s3gc_lifespan(app: FastAPI, config: S3GCConfig):
+async def s3gc_lifespan(
+    app: FastAPI,
+    config: S3GCConfig,
+    prefix: str = "/admin/s3gc",
+):
     """
-    Alternative lifespan context manager for FastAPI.
+    Lifespan context manager for FastAPI.
 
     Use this instead of setup_s3gc_plugin if you prefer the
     lifespan pattern:
@@ -416,44 +595,16 @@ async def s3gc_lifespan(app: FastAPI, config: S3GCConfig):
     Args:
         app: FastAPI application
         config: S3GC configuration
+        prefix: URL prefix for admin endpoints
     """
-    logger.info("s3gc_lifespan_starting")
-
-    # Initialize
-    state = await initialize_gc_state(config)
-    app.state.s3gc_state = state
-    app.state.s3gc_config = config
-
-    # Register routes
-    register_s3gc_routes(app, config, state)
-
-    # Start CDC
-    if config.cdc_backend and config.cdc_connection_url:
-        try:
-            handler = create_registry_handler(state["registry_db_path"])
-            stop_cdc = await start_cdc_capture(
-                config.cdc_backend.value,
-                config.cdc_connection_url,
-                config.tables,
-                handler,
-            )
-            state["cdc_stop"] = stop_cdc
-        except Exception as e:
-            logger.error("cdc_start_failed", error=str(e))
-
-    # Setup scheduler
-    if config.schedule_cron:
-        _setup_scheduled_task(config, state)
-
-    logger.info("s3gc_lifespan_started")
+    state = await _init_s3gc(app, config, prefix)
 
     try:
         yield
     finally:
-        # Cleanup
-        logger.info("s3gc_lifespan_stopping")
+        logger.info("s3gc_plugin_stopping")
         await shutdown_gc_state(state)
-        logger.info("s3gc_lifespan_stopped")
+        logger.info("s3gc_plugin_stopped")
 
 
 def get_s3gc_state(app: FastAPI) -> GCState:
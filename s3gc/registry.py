@@ -9,16 +9,86 @@ database changes via CDC. Each S3 key has a reference count that is
 incremented on INSERT/UPDATE and decremented on DELETE.
 
 Keys with ref_count = 0 are candidates for garbage collection.
+
+The ref-count write functions (increment_ref, decrement_ref, set_ref_count,
+delete_key, bulk_increment, bulk_decrement) do not commit. Group them in
+``async with async_registry_txn(db):`` so a batch of changes costs a
+single commit.
+
+first_seen/last_seen are stored as INTEGER unix epoch seconds.
 """
 
-from datetime import datetime, UTC
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, UTC
 from pathlib import Path
-from typing import List, Set
+from typing import Any, AsyncIterator, Dict, List
 
 import aiosqlite
+import structlog
 
 from s3gc.exceptions import RegistryError
 
+logger = structlog.get_logger()
+
+# Applied to every registry connection. WAL is persistent on the file
+# (set in init_registry_db); the rest are per-connection. synchronous=NORMAL
+# in WAL mode may lose the last commits on power loss, which is acceptable
+# here: the registry is a cache that can be reconciled from S3 and CDC.
+_CONNECTION_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+    PRAGMA cache_size=-65536;
+"""
+
+
+@asynccontextmanager
+async def async_registry_txn(
+    db: aiosqlite.Connection,
+) -> AsyncIterator[aiosqlite.Connection]:
+    """
+    Run a group of registry writes as one transaction.
+
+    Commits on success and rolls back if the block raises. If the
+    connection is already inside a transaction, the block joins it and
+    leaves the commit to the outer owner.
+
+    Args:
+        db: SQLite database connection
+
+    Yields:
+        The same connection
+    """
+    if db.in_transaction:
+        yield db
+        return
+
+    await db.execute("BEGIN IMMEDIATE")
+    try:
+        yield db
+    except BaseException:
+        await db.rollback()
+        raise
+    await db.commit()
+
+
+@asynccontextmanager
+async def registry_connection(db_path: Path) -> AsyncIterator[aiosqlite.Connection]:
+    """
+    Open a registry connection with the registry PRAGMAs applied.
+
+    Args:
+        db_path: Path to the registry database
+
+    Yields:
+        An open aiosqlite connection, closed when the block exits
+    """
+    async with aiosqlite.connect(db_path) as db:
+        await db.executescript(_CONNECTION_PRAGMAS)
+        yield db
+
 
 async def init_registry_db(db_path: Path) -> None:
     """
@@ -31,15 +101,17 @@ async def init_registry_db(db_path: Path) -> None:
         db_path: Path to the SQLite database file
     """
     try:
-        async with aiosqlite.connect(db_path) as db:
+        async with registry_connection(db_path) as db:
+            await db.execute("PRAGMA journal_mode=WAL")
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS refs (
                     s3_key TEXT PRIMARY KEY,
                     ref_count INTEGER NOT NULL DEFAULT 0,
-                    first_seen TEXT NOT NULL,
-                    last_seen TEXT NOT NULL
+                    first_seen INTEGER NOT NULL,
+                    last_seen INTEGER NOT NULL
                 )
             """)
+            await _migrate_iso_timestamps(db)
 
             # Create index for efficient orphan queries
             await db.execute("""
@@ -47,6 +119,17 @@ async def init_registry_db(db_path: Path) -> None:
                 ON refs(ref_count)
             """)
 
+            # Partial indexes: live keys only (index-only orphan lookups)
+            # and dead keys by age (cleanup_zero_refs)
+            await db.execute("""
+                CREATE INDEX IF NOT EXISTS idx_refs_live
+                ON refs(s3_key) WHERE ref_count > 0
+            """)
+            await db.execute("""
+                CREATE INDEX IF NOT EXISTS idx_refs_zero_last_seen
+                ON refs(last_seen) WHERE ref_count = 0
+            """)
+
             await db.commit()
     except Exception as e:
         raise RegistryError(
@@ -55,6 +138,43 @@ async def init_registry_db(db_path: Path) -> None:
         )
 
 
+async def _migrate_iso_timestamps(db: aiosqlite.Connection) -> None:
+    """
+    Rebuild a refs table created with TEXT ISO-8601 timestamps.
+
+    Older registries declared first_seen/last_seen as TEXT. Column
+    affinity would turn epoch integers back into text, so the table is
+    rebuilt with INTEGER columns and the existing values converted.
+    """
+    async with db.execute("PRAGMA table_info(refs)") as cursor:
+        columns = {row[1]: row[2].upper() for row in await cursor.fetchall()}
+
+    if columns.get("last_seen") != "TEXT":
+        return
+
+    logger.info("registry_migrating_timestamps")
+    await db.executescript("""
+        BEGIN IMMEDIATE;
+        DROP INDEX IF EXISTS idx_refs_ref_count;
+        DROP INDEX IF EXISTS idx_refs_live;
+        DROP INDEX IF EXISTS idx_refs_zero_last_seen;
+        ALTER TABLE refs RENAME TO refs_iso;
+        CREATE TABLE refs (
+            s3_key TEXT PRIMARY KEY,
+            ref_count INTEGER NOT NULL DEFAULT 0,
+            first_seen INTEGER NOT NULL,
+            last_seen INTEGER NOT NULL
+        );
+        INSERT INTO refs (s3_key, ref_count, first_seen, last_seen)
+        SELECT s3_key, ref_count,
+               CAST(strftime('%s', first_seen) AS INTEGER),
+               CAST(strftime('%s', last_seen) AS INTEGER)
+        FROM refs_iso;
+        DROP TABLE refs_iso;
+        COMMIT;
+    """)
+
+
 async def increment_ref(db: aiosqlite.Connection, s3_key: str) -> int:
     """
     Increment the reference count for an S3 key.
@@ -68,26 +188,22 @@ async def increment_ref(db: aiosqlite.Connection, s3_key: str) -> int:
     Returns:
         The new reference count
     """
-    now = datetime.now(UTC).isoformat()
+    now = int(time.time())
 
-    await db.execute(
+    async with db.execute(
         """
         INSERT INTO refs (s3_key, ref_count, first_seen, last_seen)
         VALUES (?, 1, ?, ?)
         ON CONFLICT(s3_key) DO UPDATE SET
             ref_count = ref_count + 1,
             last_seen = ?
+        RETURNING ref_count
         """,
         (s3_key, now, now, now),
-    )
-    await db.commit()
-
-    # Return the new count
-    async with db.execute(
-        "SELECT ref_count FROM refs WHERE s3_key = ?", (s3_key,)
     ) as cursor:
         row = await cursor.fetchone()
-        return row[0] if row else 1
+
+    return row[0] if row else 1
 
 
 async def decrement_ref(db: aiosqlite.Connection, s3_key: str) -> int:
@@ -103,25 +219,21 @@ async def decrement_ref(db: aiosqlite.Connection, s3_key: str) -> int:
     Returns:
         The new reference count (0 if key didn't exist)
     """
-    now = datetime.now(UTC).isoformat()
+    now = int(time.time())
 
-    await db.execute(
+    async with db.execute(
         """
         UPDATE refs
         SET ref_count = MAX(0, ref_count - 1),
             last_seen = ?
         WHERE s3_key = ?
+        RETURNING ref_count
         """,
         (now, s3_key),
-    )
-    await db.commit()
-
-    # Return the new count
-    async with db.execute(
-        "SELECT ref_count FROM refs WHERE s3_key = ?", (s3_key,)
     ) as cursor:
         row = await cursor.fetchone()
-        return row[0] if row else 0
+
+    return row[0] if row else 0
 
 
 async def set_ref_count(db: aiosqlite.Connection, s3_key: str, count: int) -> None:
@@ -136,7 +248,7 @@ async def set_ref_count(db: aiosqlite.Connection, s3_key: str, count: int) -> No
     if count < 0:
         raise ValueError(f"ref_count must be >= 0, got {count}")
 
-    now = datetime.now(UTC).isoformat()
+    now = int(time.time())
 
     await db.execute(
         """
@@ -148,7 +260,6 @@ async def set_ref_count(db: aiosqlite.Connection, s3_key: str, count: int) -> No
         """,
         (s3_key, count, now, now, count, now),
     )
-    await db.commit()
 
 
 async def get_ref_count(db: aiosqlite.Connection, s3_key: str) -> int:
@@ -169,6 +280,40 @@ async def get_ref_count(db: aiosqlite.Connection, s3_key: str) -> int:
         return row[0] if row else 0
 
 
+async def get_ref_counts(
+    db: aiosqlite.Connection,
+    s3_keys: List[str],
+) -> Dict[str, int]:
+    """
+    Get the current reference counts for many S3 keys in one query.
+
+    Args:
+        db: SQLite database connection
+        s3_keys: The S3 keys to query
+
+    Returns:
+        Dictionary mapping each key to its reference count (0 if unknown)
+    """
+    if not s3_keys:
+        return {}
+
+    await _stage_keys(db, s3_keys)
+    try:
+        async with db.execute(
+            """
+            SELECT r.s3_key, r.ref_count FROM s3keys s
+            CROSS JOIN refs r ON r.s3_key = s.k
+            """
+        ) as cursor:
+            rows = await cursor.fetchall()
+    finally:
+        await _clear_staged_keys(db)
+
+    counts = dict.fromkeys(s3_keys, 0)
+    counts.update(rows)
+    return counts
+
+
 async def has_reference(db: aiosqlite.Connection, s3_key: str) -> bool:
     """
     Check if an S3 key has any references.
@@ -184,6 +329,25 @@ async def has_reference(db: aiosqlite.Connection, s3_key: str) -> bool:
     return count > 0
 
 
+async def _stage_keys(db: aiosqlite.Connection, s3_keys: List[str]) -> None:
+    """Load S3 keys into the connection's temp s3keys table for set queries."""
+    await db.execute(
+        "CREATE TEMP TABLE IF NOT EXISTS s3keys (k TEXT PRIMARY KEY) WITHOUT ROWID"
+    )
+    await db.execute("DELETE FROM s3keys")
+    await db.executemany(
+        "INSERT OR IGNORE INTO s3keys (k) VALUES (?)",
+        ((key,) for key in s3_keys),
+    )
+    await db.commit()
+
+
+async def _clear_staged_keys(db: aiosqlite.Connection) -> None:
+    """Empty the temp s3keys table."""
+    await db.execute("DELETE FROM s3keys")
+    await db.commit()
+
+
 async def get_orphan_candidates(
     db: aiosqlite.Connection,
     all_s3_keys: List[str],
@@ -205,21 +369,27 @@ async def get_orphan_candidates(
     if not all_s3_keys:
         return []
 
-    # Get all keys that ARE referenced (ref_count > 0)
-    placeholders = ",".join("?" * len(all_s3_keys))
-    async with db.execute(
-        f"""
-        SELECT s3_key FROM refs
-        WHERE s3_key IN ({placeholders})
-        AND ref_count > 0
-        """,
-        all_s3_keys,
-    ) as cursor:
-        rows = await cursor.fetchall()
-        referenced_keys: Set[str] = {row[0] for row in rows}
+    # Stage the bucket listing in a temp table and anti-join against refs.
+    # This avoids binding every key into one IN (...) list, which is both
+    # slow for large buckets and capped by SQLite's host-parameter limit.
+    await _stage_keys(db, all_s3_keys)
 
-    # Return keys that are NOT referenced
-    return [key for key in all_s3_keys if key not in referenced_keys]
+    try:
+        # Keys that are NOT referenced (absent from refs or ref_count = 0)
+        async with db.execute(
+            """
+            SELECT s.k FROM s3keys s
+            WHERE NOT EXISTS (
+                SELECT 1 FROM refs r INDEXED BY idx_refs_live
+                WHERE r.s3_key = s.k AND r.ref_count > 0
+            )
+            """
+        ) as cursor:
+            rows = await cursor.fetchall()
+    finally:
+        await _clear_staged_keys(db)
+
+    return [row[0] for row in rows]
 
 
 async def get_all_referenced_keys(db: aiosqlite.Connection) -> List[str]:
@@ -233,7 +403,7 @@ async def get_all_referenced_keys(db: aiosqlite.Connection) -> List[str]:
         List of referenced S3 keys
     """
     async with db.execute(
-        "SELECT s3_key FROM refs WHERE ref_count > 0"
+        "SELECT s3_key FROM refs INDEXED BY idx_refs_live WHERE ref_count > 0"
     ) as cursor:
         rows = await cursor.fetchall()
         return [row[0] for row in rows]
@@ -270,11 +440,14 @@ async def delete_key(db: aiosqlite.Connection, s3_key: str) -> bool:
     cursor = await db.execute(
         "DELETE FROM refs WHERE s3_key = ?", (s3_key,)
     )
-    await db.commit()
     return cursor.rowcount > 0
 
 
-async def bulk_increment(db: aiosqlite.Connection, s3_keys: List[str]) -> None:
+async def bulk_increment(
+    db: aiosqlite.Connection,
+    s3_keys: List[str],
+    now: int | None = None,
+) -> None:
     """
     Increment reference counts for multiple S3 keys.
 
@@ -283,11 +456,13 @@ async def bulk_increment(db: aiosqlite.Connection, s3_keys: List[str]) -> None:
     Args:
         db: SQLite database connection
         s3_keys: List of S3 keys to increment
+        now: last_seen timestamp (epoch seconds); defaults to the current time
     """
     if not s3_keys:
         return
 
-    now = datetime.now(UTC).isoformat()
+    if now is None:
+        now = int(time.time())
 
     await db.executemany(
         """
@@ -299,10 +474,13 @@ async def bulk_increment(db: aiosqlite.Connection, s3_keys: List[str]) -> None:
         """,
         [(key, now, now, now) for key in s3_keys],
     )
-    await db.commit()
 
 
-async def bulk_decrement(db: aiosqlite.Connection, s3_keys: List[str]) -> None:
+async def bulk_decrement(
+    db: aiosqlite.Connection,
+    s3_keys: List[str],
+    now: int | None = None,
+) -> None:
     """
     Decrement reference counts for multiple S3 keys.
 
@@ -311,11 +489,13 @@ async def bulk_decrement(db: aiosqlite.Connection, s3_keys: List[str]) -> None:
     Args:
         db: SQLite database connection
         s3_keys: List of S3 keys to decrement
+        now: last_seen timestamp (epoch seconds); defaults to the current time
     """
     if not s3_keys:
         return
 
-    now = datetime.now(UTC).isoformat()
+    if now is None:
+        now = int(time.time())
 
     await db.executemany(
         """
@@ -326,7 +506,6 @@ async def bulk_decrement(db: aiosqlite.Connection, s3_keys: List[str]) -> None:
         """,
         [(now, key) for key in s3_keys],
     )
-    await db.commit()
 
 
 async def get_registry_stats(db: aiosqlite.Connection) -> dict:
@@ -336,31 +515,25 @@ async def get_registry_stats(db: aiosqlite.Connection) -> dict:
     Returns:
         Dict with registry statistics
     """
-    stats = {}
-
-    # Total keys
-    async with db.execute("SELECT COUNT(*) FROM refs") as cursor:
-        row = await cursor.fetchone()
-        stats["total_keys"] = row[0] if row else 0
-
-    # Referenced keys (ref_count > 0)
+    # One pass over refs instead of a separate scan per statistic
     async with db.execute(
-        "SELECT COUNT(*) FROM refs WHERE ref_count > 0"
+        """
+        SELECT
+            COUNT(*),
+            COALESCE(SUM(CASE WHEN ref_count > 0 THEN 1 ELSE 0 END), 0),
+            COALESCE(SUM(CASE WHEN ref_count = 0 THEN 1 ELSE 0 END), 0),
+            COALESCE(SUM(ref_count), 0)
+        FROM refs
+        """
     ) as cursor:
         row = await cursor.fetchone()
-        stats["referenced_keys"] = row[0] if row else 0
 
-    # Orphaned keys (ref_count = 0)
-    async with db.execute(
-        "SELECT COUNT(*) FROM refs WHERE ref_count = 0"
-    ) as cursor:
-        row = await cursor.fetchone()
-        stats["orphaned_keys"] = row[0] if row else 0
-
-    # Total references
-    async with db.execute("SELECT SUM(ref_count) FROM refs") as cursor:
-        row = await cursor.fetchone()
-        stats["total_references"] = row[0] if row and row[0] else 0
+    stats = {
+        "total_keys": row[0],
+        "referenced_keys": row[1],
+        "orphaned_keys": row[2],
+        "total_references": row[3],
+    }
 
     return stats
 
@@ -382,13 +555,11 @@ async def cleanup_zero_refs(
     Returns:
         Number of entries removed
     """
-    from datetime import timedelta
-
-    cutoff = (datetime.now(UTC) - timedelta(days=older_than_days)).isoformat()
+    cutoff = int((datetime.now(UTC) - timedelta(days=older_than_days)).timestamp())
 
     cursor = await db.execute(
         """
-        DELETE FROM refs
+        DELETE FROM refs INDEXED BY idx_refs_zero_last_seen
         WHERE ref_count = 0
         AND last_seen < ?
         """,
@@ -400,26 +571,255 @@ async def cleanup_zero_refs(
 
 
 # Convenience function for creating CDC handler
-def create_registry_handler(db_path: Path):
+def create_registry_handler(db: Path | aiosqlite.Connection | Any):
     """
     Create a CDC change handler that updates the registry.
 
+    Each event is committed on its own. For sustained CDC traffic use
+    RegistryBatcher, which commits events in batches.
+
     Args:
-        db_path: Path to the registry database
+        db: An open registry connection to share across events (writes
+            are serialized with a lock), a pool exposing ``acquire()``,
+            or a database path to open a connection per event
 
     Returns:
         Async function suitable for use as a CDC handler
     """
+    if isinstance(db, aiosqlite.Connection):
+        lock = asyncio.Lock()
+
+        @asynccontextmanager
+        async def borrow() -> AsyncIterator[aiosqlite.Connection]:
+            # One writer at a time, or a second event would join the
+            # first one's transaction
+            async with lock:
+                yield db
+
+    elif hasattr(db, "acquire"):
+        borrow = db.acquire
+    else:
+        def borrow():
+            return registry_connection(db)
 
     async def handler(s3_key: str, operation: str) -> None:
-        async with aiosqlite.connect(db_path) as db:
+        if operation not in ("insert", "delete"):
+            # For updates, we handle as old_value delete + new_value insert
+            # This is handled by the CDC layer which calls handler twice
+            return
+
+        async with borrow() as conn, async_registry_txn(conn):
             if operation == "insert":
-                await increment_ref(db, s3_key)
-            elif operation == "delete":
-                await decrement_ref(db, s3_key)
-            elif operation == "update":
-                # For updates, we handle as old_value delete + new_value insert
-                # This is handled by the CDC layer which calls handler twice
-                pass
+                await increment_ref(conn, s3_key)
+            else:
+                await decrement_ref(conn, s3_key)
 
     return handler
+
+
+class RegistryBatcher:
+    """
+    Write-behind queue that applies CDC reference changes to the registry.
+
+    The per-event handler only enqueues. A single consumer task drains
+    everything queued (up to max_batch events) and applies it over one
+    long-lived connection in one transaction, so batches grow with load:
+    while one commit is in flight the next batch accumulates. Events are
+    applied in arrival order: consecutive events of the same kind go out
+    as one executemany, so the result is identical to applying them one
+    at a time.
+
+    The queue is bounded by max_pending; when the registry falls behind,
+    the handler waits instead of buffering without limit, which slows the
+    CDC reader down to the rate the registry can absorb.
+
+    Usage:
+        batcher = RegistryBatcher(registry_db_path)
+        await batcher.start()
+        stop_cdc = await start_cdc_capture(..., batcher.handler)
+        ...
+        await batcher.close()
+    """
+
+    # Pause after a failed batch before retrying it
+    RETRY_DELAY_SECONDS = 1.0
+
+    def __init__(
+        self,
+        db_path: Path,
+        flush_interval: float = 0.0,
+        max_batch: int = 1000,
+        max_pending: int = 10_000,
+    ) -> None:
+        """
+        Args:
+            db_path: Path to the registry database
+            flush_interval: Seconds to let events accumulate after the
+                first one arrives (0 applies as soon as the consumer is free)
+            max_batch: Maximum events applied per transaction
+            max_pending: Queued events at which handler() starts waiting
+        """
+        self.db_path = db_path
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._db: aiosqlite.Connection | None = None
+        self._queue: asyncio.Queue[tuple[str, str]] = asyncio.Queue(maxsize=max_pending)
+        # Events taken off the queue but not yet committed, oldest first
+        self._held: List[tuple[str, str]] = []
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+        # Set when a batch fails to commit, so flush() stops waiting
+        self._failed = asyncio.Event()
+        self._last_error: Exception | None = None
+
+    async def start(self) -> None:
+        """Open the registry connection and start the consumer task."""
+        self._db = await aiosqlite.connect(self.db_path)
+        await self._db.executescript(_CONNECTION_PRAGMAS)
+        self._task = asyncio.create_task(self._run())
+
+    async def handler(self, s3_key: str, operation: str) -> None:
+        """CDC change handler (see s3gc.cdc.CDCChangeHandler)."""
+        if operation not in ("insert", "delete"):
+            # Updates arrive from the CDC layer as delete + insert pairs
+            return
+
+        await self._queue.put((s3_key, operation))
+
+    async def _run(self) -> None:
+        while True:
+            if not self._held:
+                self._held.append(await self._queue.get())
+                if self.flush_interval:
+                    await asyncio.sleep(self.flush_interval)
+            # Shielded so close() cannot interrupt a batch half-way
+            if not await asyncio.shield(self._apply_batch()):
+                await asyncio.sleep(self.RETRY_DELAY_SECONDS)
+
+    async def _apply_batch(self) -> bool:
+        """Commit held events plus whatever is queued, up to max_batch."""
+        async with self._lock:
+            batch, self._held = self._held, []
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            if not batch:
+                return True
+
+            try:
+                async with async_registry_txn(self._db):
+                    await _apply_ref_events(self._db, batch, int(time.time()))
+            except Exception as e:
+                # The batch was rolled back as a whole; hold it (ahead of
+                # anything still queued) for the retry
+                self._held = batch
+                self._last_error = e
+                self._failed.set()
+                logger.error(
+                    "registry_flush_failed", count=len(batch), error=str(e)
+                )
+                return False
+
+            for _ in batch:
+                self._queue.task_done()
+            return True
+
+    async def flush(self, timeout: float | None = None) -> None:
+        """
+        Wait until every event queued so far has been committed.
+
+        Args:
+            timeout: Seconds to wait at most (None waits until the queue
+                drains or a batch fails)
+
+        Raises:
+            RegistryError: If a batch failed to commit or the timeout
+                expired first. Uncommitted events stay queued for the
+                consumer's retry.
+        """
+        if self._task is None:
+            # No consumer running: apply inline, stopping at the first failure
+            while self._held or not self._queue.empty():
+                if not await self._apply_batch():
+                    raise self._flush_error("Registry batch failed to commit")
+            return
+
+        self._failed.clear()
+        joined = asyncio.ensure_future(self._queue.join())
+        failed = asyncio.ensure_future(self._failed.wait())
+        try:
+            done, _ = await asyncio.wait(
+                {joined, failed}, timeout=timeout,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            joined.cancel()
+            failed.cancel()
+
+        if joined in done:
+            return
+        if failed in done:
+            raise self._flush_error("Registry batch failed to commit")
+        raise self._flush_error("Timed out waiting for registry events to commit")
+
+    def _flush_error(self, message: str) -> RegistryError:
+        details = {"pending": len(self._held) + self._queue.qsize()}
+        if self._last_error is not None:
+            details["error"] = str(self._last_error)
+        return RegistryError(message, details)
+
+    async def close(self) -> None:
+        """Stop the consumer, apply anything still queued, close the connection."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self._db is None:
+            return
+
+        try:
+            await self.flush()
+        except RegistryError:
+            # Reported below as dropped events
+            pass
+
+        dropped = len(self._held) + self._queue.qsize()
+        if dropped:
+            logger.error("registry_events_dropped", count=dropped)
+
+        await self._db.close()
+        self._db = None
+
+
+async def _apply_ref_events(
+    db: aiosqlite.Connection, events: List[tuple[str, str]], now: int
+) -> None:
+    """Apply (s3_key, operation) events in order, batching runs of the same kind."""
+    run: List[str] = []
+    run_op = None
+
+    for s3_key, operation in events:
+        if operation != run_op and run:
+            await _apply_ref_run(db, run_op, run, now)
+            run = []
+        run_op = operation
+        run.append(s3_key)
+
+    if run:
+        await _apply_ref_run(db, run_op, run, now)
+
+
+async def _apply_ref_run(
+    db: aiosqlite.Connection, operation: str | None, s3_keys: List[str], now: int
+) -> None:
+    if operation == "insert":
+        await bulk_increment(db, s3_keys, now)
+    elif operation == "delete":
+        await bulk_decrement(db, s3_keys, now)
@@ -6,37 +6,78 @@ Safety Vault - Immutable audit trail and backup storage.
 """
 
 from s3gc.vault.sqlite_vault import (
+    connect_vault,
     init_vault_db,
     record_operation,
+    complete_operation,
     record_deletion,
+    record_deletions,
+    start_operation_with_deletions,
     get_deletion_record,
     get_deletions_by_operation,
+    iter_deletions_by_operation,
     mark_restored,
+    mark_restored_bulk,
+    get_operation,
     list_operations,
+    get_vault_stats,
+    search_deletions,
+    iter_search_deletions,
+    search_deletions_by_prefix,
+    get_unrestored_deletions,
     DeletionRecord,
     OperationRecord,
 )
 
+from s3gc.vault.pool import VaultPool
+
 from s3gc.vault.compressor import (
+    batched_decompress_backup,
     compress_for_backup,
+    prepare_backup_compression,
     decompress_backup,
     is_image_file,
 )
 
+from s3gc.vault.dict_train import ZstdDictionaries, train_dictionaries
+
+from s3gc.vault.replicator import close_replication_pools
+
 __all__ = [
     # Vault functions
+    "connect_vault",
     "init_vault_db",
     "record_operation",
+    "complete_operation",
     "record_deletion",
+    "record_deletions",
+    "start_operation_with_deletions",
     "get_deletion_record",
     "get_deletions_by_operation",
+    "iter_deletions_by_operation",
     "mark_restored",
+    "mark_restored_bulk",
+    "get_operation",
     "list_operations",
+    "get_vault_stats",
+    "search_deletions",
+    "iter_search_deletions",
+    "search_deletions_by_prefix",
+    "get_unrestored_deletions",
+    # Connection pool
+    "VaultPool",
     # Types
     "DeletionRecord",
     "OperationRecord",
     # Compressor
     "compress_for_backup",
+    "prepare_backup_compression",
     "decompress_backup",
+    "batched_decompress_backup",
     "is_image_file",
+    # Compression dictionaries
+    "ZstdDictionaries",
+    "train_dictionaries",
+    # Replication
+    "close_replication_pools",
 ]
@@ -11,20 +11,75 @@ This module provides compression functions that combine:
 Target compression ratio: 8-15x for images, 2-5x for other files.
 """
 
+from __future__ import annotations
+
 import asyncio
 import io
-from concurrent.futures import ThreadPoolExecutor
-from typing import Tuple
+import mimetypes
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import TYPE_CHECKING, Callable, List, Tuple
 
 import structlog
 import zstandard as zstd
 
 from s3gc.exceptions import BackupError
 
+if TYPE_CHECKING:
+    from s3gc.vault.dict_train import ZstdDictionaries
+
+try:
+    import pyvips
+except Exception:  # not installed, or libvips itself is missing
+    pyvips = None
+
 logger = structlog.get_logger()
 
-# Thread pool for CPU-bound image operations
-_executor = ThreadPoolExecutor(max_workers=4)
+# Thread pool for CPU-bound image operations and mid-sized zstd work,
+# sized like CPython's default and created on first use (_get_executor)
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+# Worker processes for the PIL image pipeline. PIL takes the GIL back
+# between its C calls, so image work only scales across cores in
+# separate processes. The pool is created on first use.
+IMAGE_PROCESS_WORKERS = os.cpu_count() or 1
+_image_executor: Executor | None = None
+
+# Payloads above this size leave the event loop and are compressed with
+# zstd's own worker threads (one per core)
+ZSTD_LARGE_PAYLOAD = 1024 * 1024
+
+# Payloads at least this large also use long-distance matching over a
+# 2**ZSTD_LONG_WINDOW_LOG byte window (``zstd --long=27``), catching
+# repeats far beyond the level's own window. The window size is recorded
+# in the frame header, and decoders accept up to 2**27 by default.
+ZSTD_LONG_PAYLOAD = 4 * 1024 * 1024
+ZSTD_LONG_WINDOW_LOG = 27
+
+# Large payloads already use every core, so they run one at a time on a
+# dedicated thread instead of oversubscribing the CPU from _executor.
+# Created on first use (_get_large_executor)
+_large_executor: ThreadPoolExecutor | None = None
+
+# Largest payload compressed directly on the event loop, by zstd level.
+# Each limit is roughly 0.5 ms of work: an executor handoff costs ~30 us,
+# so anything bigger is cheaper to offload than to stall the loop with.
+# (max level, max inline bytes), ascending by level
+_ZSTD_INLINE_LIMITS = (
+    (3, 128 * 1024),
+    (9, 16 * 1024),
+    (15, 4 * 1024),
+    (22, 2 * 1024),
+)
+
+# Per-thread zstd contexts. Contexts are expensive to build and not
+# thread-safe, and work runs on both the event loop and _executor threads.
+_zstd_local = threading.local()
 
 # Image extensions (case-insensitive)
 IMAGE_EXTENSIONS = {
@@ -38,11 +93,45 @@ IMAGE_EXTENSIONS = {
     ".tif",
 }
 
+_IMAGE_EXTENSIONS_TUPLE = tuple(IMAGE_EXTENSIONS)
+
 # Default compression settings
 DEFAULT_ZSTD_LEVEL = 19  # Maximum compression
 DEFAULT_IMAGE_MAX_DIM = 1024  # Max dimension for image preprocessing
 DEFAULT_JPEG_QUALITY = 60  # JPEG quality for preprocessing
 
+# Already entropy-coded formats. Level 19 gains <2% on them at 10-100x
+# the CPU of level 1, so they are compressed at INCOMPRESSIBLE_ZSTD_LEVEL
+# (still a regular zstd frame). Files with a compression encoding
+# (.gz, .bz2, .xz, .br) are treated the same.
+_INCOMPRESSIBLE_MIME_PREFIXES = (
+    "image/jpeg",
+    "image/png",
+    "image/webp",
+    "image/gif",
+    "image/avif",
+    "image/heic",
+    "video/",
+    "audio/",
+    "font/woff2",
+    "application/zip",
+    "application/zstd",
+    "application/x-7z-compressed",
+    "application/vnd.rar",
+)
+INCOMPRESSIBLE_ZSTD_LEVEL = 1
+
+# Other payloads larger than this are probed: if level 1 cannot shrink
+# their first INCOMPRESSIBLE_PROBE_SIZE bytes by INCOMPRESSIBLE_MIN_RATIO,
+# they are treated as incompressible too
+INCOMPRESSIBLE_PROBE_SIZE = 4096
+INCOMPRESSIBLE_MIN_RATIO = 1.05
+
+# Shrink ratio LANCZOS must still cover after PIL's integer box
+# pre-reduction. 3.0 is visually indistinguishable from plain LANCZOS and
+# ~2.5x faster on an 8x downscale.
+IMAGE_REDUCING_GAP = 3.0
+
 
 def is_image_file(s3_key: str) -> bool:
     """
@@ -54,8 +143,10 @@ def is_image_file(s3_key: str) -> bool:
     Returns:
         True if the file appears to be an image
     """
-    s3_key_lower = s3_key.lower()
-    return any(s3_key_lower.endswith(ext) for ext in IMAGE_EXTENSIONS)
+    # One C-level endswith over all extensions. Measured faster than
+    # slicing off the suffix for a frozenset lookup on typical S3 keys,
+    # where the extra slice costs more than lowercasing the whole key.
+    return s3_key.lower().endswith(_IMAGE_EXTENSIONS_TUPLE)
 
 
 async def compress_for_backup(
@@ -65,6 +156,7 @@ async def compress_for_backup(
     preprocess_images: bool = True,
     max_image_dim: int = DEFAULT_IMAGE_MAX_DIM,
     jpeg_quality: int = DEFAULT_JPEG_QUALITY,
+    dictionaries: ZstdDictionaries | None = None,
 ) -> bytes:
     """
     Compress data for backup storage.
@@ -72,10 +164,13 @@ async def compress_for_backup(
     For image files:
     1. Resize to max dimension (preserving aspect ratio)
     2. Convert to JPEG with specified quality
-    3. Compress with zstd
+    3. Compress with zstd at INCOMPRESSIBLE_ZSTD_LEVEL (JPEG is already
+       entropy-coded)
 
     For other files:
-    1. Compress with zstd only
+    1. Compress with zstd, using the trained dictionary for the file's
+       type when one exists and the file is small. Already-compressed
+       data (archives, video, ...) uses INCOMPRESSIBLE_ZSTD_LEVEL.
 
     Args:
         s3_key: S3 key (used to detect file type)
@@ -84,36 +179,17 @@ async def compress_for_backup(
         preprocess_images: Whether to preprocess images
         max_image_dim: Maximum dimension for image resize
         jpeg_quality: JPEG quality (1-100)
+        dictionaries: Trained zstd dictionaries of the vault, if any
 
     Returns:
         Compressed bytes
     """
     try:
-        # Step 1: Image preprocessing (if applicable)
-        if preprocess_images and is_image_file(s3_key):
-            try:
-                processed_bytes = await _preprocess_image(
-                    raw_bytes, max_image_dim, jpeg_quality
-                )
-                logger.debug(
-                    "image_preprocessed",
-                    s3_key=s3_key,
-                    original_size=len(raw_bytes),
-                    processed_size=len(processed_bytes),
-                )
-            except Exception as e:
-                # If image preprocessing fails, fall back to raw bytes
-                logger.warning(
-                    "image_preprocessing_failed",
-                    s3_key=s3_key,
-                    error=str(e),
-                )
-                processed_bytes = raw_bytes
-        else:
-            processed_bytes = raw_bytes
-
-        # Step 2: zstd compression
-        compressed = await _compress_zstd(processed_bytes, zstd_level)
+        data, level, dict_data = await _plan_compression(
+            s3_key, raw_bytes, zstd_level, preprocess_images,
+            max_image_dim, jpeg_quality, dictionaries,
+        )
+        compressed = await _compress_zstd(data, level, dict_data)
 
         compression_ratio = len(raw_bytes) / len(compressed) if compressed else 0
         logger.debug(
@@ -133,8 +209,133 @@ async def compress_for_backup(
         )
 
 
+async def prepare_backup_compression(
+    s3_key: str,
+    raw_bytes: bytes,
+    zstd_level: int = DEFAULT_ZSTD_LEVEL,
+    preprocess_images: bool = True,
+    max_image_dim: int = DEFAULT_IMAGE_MAX_DIM,
+    jpeg_quality: int = DEFAULT_JPEG_QUALITY,
+    dictionaries: ZstdDictionaries | None = None,
+) -> Tuple[Callable[[], bytes], Executor]:
+    """
+    Run the asynchronous part of compress_for_backup and defer the zstd step.
+
+    Image preprocessing and the choice of level and dictionary happen
+    here. The returned callable does the zstd compression, so a caller
+    can run it in the same worker thread as its own file I/O. It must run
+    on the returned executor, which keeps large payloads on the
+    single-thread pool like _compress_zstd does.
+
+    Args:
+        s3_key: S3 key (used to detect file type)
+        raw_bytes: Raw file data
+        zstd_level: zstd compression level (1-22, default 19)
+        preprocess_images: Whether to preprocess images
+        max_image_dim: Maximum dimension for image resize
+        jpeg_quality: JPEG quality (1-100)
+        dictionaries: Trained zstd dictionaries of the vault, if any
+
+    Returns:
+        Tuple of (callable returning the compressed bytes, executor to
+        run it on)
+    """
+    try:
+        data, level, dict_data = await _plan_compression(
+            s3_key, raw_bytes, zstd_level, preprocess_images,
+            max_image_dim, jpeg_quality, dictionaries,
+        )
+    except Exception as e:
+        raise BackupError(
+            f"Compression failed for {s3_key}: {e}",
+            details={"s3_key": s3_key, "original_size": len(raw_bytes)},
+        )
+    executor = (
+        _get_large_executor() if len(data) > ZSTD_LARGE_PAYLOAD else _get_executor()
+    )
+    return partial(_compress_zstd_sync, data, level, dict_data), executor
+
+
+async def _plan_compression(
+    s3_key: str,
+    raw_bytes: bytes,
+    zstd_level: int,
+    preprocess_images: bool,
+    max_image_dim: int,
+    jpeg_quality: int,
+    dictionaries: ZstdDictionaries | None,
+) -> Tuple[bytes, int, zstd.ZstdCompressionDict | None]:
+    """
+    Preprocess images and pick the zstd level and dictionary for a backup.
+
+    Returns:
+        Tuple of (data to compress, zstd level, dictionary or None)
+    """
+    dict_data = None
+    preprocessed = False
+
+    # Step 1: Image preprocessing (if applicable)
+    if preprocess_images and is_image_file(s3_key):
+        try:
+            processed_bytes = await _preprocess_image(
+                raw_bytes, max_image_dim, jpeg_quality
+            )
+            preprocessed = True
+            logger.debug(
+                "image_preprocessed",
+                s3_key=s3_key,
+                original_size=len(raw_bytes),
+                processed_size=len(processed_bytes),
+            )
+        except Exception as e:
+            # If image preprocessing fails, fall back to raw bytes
+            logger.warning(
+                "image_preprocessing_failed",
+                s3_key=s3_key,
+                error=str(e),
+            )
+            processed_bytes = raw_bytes
+    else:
+        processed_bytes = raw_bytes
+        if dictionaries is not None:
+            dict_data = dictionaries.for_key(s3_key, len(processed_bytes))
+
+    # Step 2: zstd level (preprocessed images are JPEG by now)
+    level = zstd_level
+    if level > INCOMPRESSIBLE_ZSTD_LEVEL and dict_data is None:
+        if preprocessed or _is_incompressible(s3_key, processed_bytes):
+            level = INCOMPRESSIBLE_ZSTD_LEVEL
+
+    return processed_bytes, level, dict_data
+
+
+def _is_incompressible(s3_key: str, data: bytes) -> bool:
+    """
+    Check whether data is already compressed, by type or by a quick probe.
+
+    Args:
+        s3_key: S3 key (used to detect file type)
+        data: Data about to be compressed
+
+    Returns:
+        True if strong zstd levels would waste CPU on it
+    """
+    mime_type, encoding = mimetypes.guess_type(s3_key)
+    if encoding is not None or (
+        mime_type is not None and mime_type.startswith(_INCOMPRESSIBLE_MIME_PREFIXES)
+    ):
+        return True
+
+    if len(data) <= INCOMPRESSIBLE_PROBE_SIZE:
+        return False
+    probe = data[:INCOMPRESSIBLE_PROBE_SIZE]
+    compressed = _get_compressor(INCOMPRESSIBLE_ZSTD_LEVEL).compress(probe)
+    return len(probe) < len(compressed) * INCOMPRESSIBLE_MIN_RATIO
+
+
 async def decompress_backup(
     compressed_bytes: bytes,
+    dictionaries: ZstdDictionaries | None = None,
 ) -> bytes:
     """
     Decompress backup data.
@@ -144,16 +345,82 @@ async def decompress_backup(
 
     Args:
         compressed_bytes: zstd-compressed data
+        dictionaries: Trained zstd dictionaries of the vault; required
+            for backups that were compressed with one
 
     Returns:
         Decompressed bytes
     """
     try:
-        return await _decompress_zstd(compressed_bytes)
+        dict_data = _frame_dictionary(compressed_bytes, dictionaries)
+        return await _decompress_zstd(compressed_bytes, dict_data)
+    except Exception as e:
+        raise BackupError(f"Decompression failed: {e}")
+
+
+async def batched_decompress_backup(
+    blobs: List[bytes],
+    dictionaries: ZstdDictionaries | None = None,
+    return_exceptions: bool = False,
+) -> List[bytes | BaseException]:
+    """
+    Decompress many backups at once on the compression thread pool.
+
+    zstd releases the GIL while decoding, so a batch of small backups
+    decodes in parallel across cores instead of one by one on the event
+    loop.
+
+    Args:
+        blobs: zstd-compressed backups
+        dictionaries: Trained zstd dictionaries of the vault
+        return_exceptions: Return a failed blob's BackupError in its
+            place instead of raising it (like asyncio.gather)
+
+    Returns:
+        Decompressed bytes, in the order of ``blobs``
+    """
+    loop = asyncio.get_event_loop()
+    executor = _get_executor()
+    return await asyncio.gather(
+        *(
+            loop.run_in_executor(executor, _decompress_backup_sync, blob, dictionaries)
+            for blob in blobs
+        ),
+        return_exceptions=return_exceptions,
+    )
+
+
+def _decompress_backup_sync(
+    compressed_bytes: bytes,
+    dictionaries: ZstdDictionaries | None = None,
+) -> bytes:
+    """Synchronous decompress_backup, for the batched path."""
+    try:
+        dict_data = _frame_dictionary(compressed_bytes, dictionaries)
+        return _decompress_zstd_sync(compressed_bytes, dict_data)
     except Exception as e:
         raise BackupError(f"Decompression failed: {e}")
 
 
+def _frame_dictionary(
+    compressed_bytes: bytes,
+    dictionaries: ZstdDictionaries | None,
+) -> zstd.ZstdCompressionDict | None:
+    """Return the dictionary a zstd frame was compressed with, if any."""
+    # The frame header names the dictionary it was compressed with
+    dict_id = zstd.get_frame_parameters(compressed_bytes).dict_id
+    if not dict_id:
+        return None
+
+    dict_data = dictionaries.by_id(dict_id) if dictionaries else None
+    if dict_data is None:
+        raise BackupError(
+            f"zstd dictionary {dict_id} is not available",
+            details={"dict_id": dict_id},
+        )
+    return dict_data
+
+
 async def _preprocess_image(
     raw_bytes: bytes,
     max_dim: int,
@@ -162,16 +429,117 @@ async def _preprocess_image(
     """
     Preprocess image: resize and convert to JPEG.
 
-    This runs in a thread pool because PIL operations are CPU-bound.
+    This runs off the event loop because image operations are CPU-bound,
+    in worker processes when _get_image_executor() provides them.
     """
+    global _image_executor
+
     loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(
-        _executor,
-        _preprocess_image_sync,
-        raw_bytes,
-        max_dim,
-        jpeg_quality,
-    )
+    try:
+        return await loop.run_in_executor(
+            _get_image_executor(),
+            _preprocess_image_sync,
+            raw_bytes,
+            max_dim,
+            jpeg_quality,
+        )
+    except BrokenProcessPool as e:
+        # A worker died (e.g. OOM-killed); keep going on threads
+        logger.warning("image_process_pool_broken", error=str(e))
+        _image_executor = _get_executor()
+        return await loop.run_in_executor(
+            _image_executor,
+            _preprocess_image_sync,
+            raw_bytes,
+            max_dim,
+            jpeg_quality,
+        )
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the shared compression thread pool, creating it on first use."""
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=min(32, (os.cpu_count() or 1) + 4),
+                    thread_name_prefix="s3gc-compress",
+                )
+    return _executor
+
+
+def _get_large_executor() -> ThreadPoolExecutor:
+    """Return the single-thread pool for large zstd payloads, creating it on first use."""
+    global _large_executor
+
+    if _large_executor is None:
+        with _executor_lock:
+            if _large_executor is None:
+                _large_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="s3gc-zstd"
+                )
+    return _large_executor
+
+
+def shutdown_executors() -> None:
+    """
+    Release the compression worker threads and processes.
+
+    Pools are recreated on next use, so this is safe to call whenever the
+    caller is done compressing (e.g. on application shutdown).
+    """
+    global _executor, _image_executor, _large_executor
+
+    with _executor_lock:
+        executor, _executor = _executor, None
+        image_executor, _image_executor = _image_executor, None
+        large_executor, _large_executor = _large_executor, None
+
+    if image_executor is not None and image_executor is not executor:
+        image_executor.shutdown(wait=False)
+    if executor is not None:
+        executor.shutdown(wait=False)
+    if large_executor is not None:
+        large_executor.shutdown(wait=False)
+
+
+def _get_image_executor() -> Executor:
+    """
+    Return the executor for image preprocessing, creating it on first use.
+
+    Uses a process pool on multi-core hosts. libvips releases the GIL for
+    its whole pipeline and a single core gains nothing from processes,
+    so those cases stay on the shared thread pool.
+    """
+    global _image_executor
+
+    if _image_executor is None:
+        _image_executor = _get_executor()
+        if pyvips is None and IMAGE_PROCESS_WORKERS > 1:
+            # Never fork: the parent runs event loop, executor and
+            # aiosqlite threads whose locks a forked child would inherit
+            method = (
+                "forkserver"
+                if "forkserver" in multiprocessing.get_all_start_methods()
+                else "spawn"
+            )
+            try:
+                _image_executor = ProcessPoolExecutor(
+                    max_workers=IMAGE_PROCESS_WORKERS,
+                    mp_context=multiprocessing.get_context(method),
+                    initializer=_init_image_worker,
+                )
+            except (OSError, ValueError) as e:
+                logger.warning("image_process_pool_unavailable", error=str(e))
+
+    return _image_executor
+
+
+def _init_image_worker() -> None:
+    """Import PIL once per worker process instead of on its first image."""
+    from PIL import Image  # noqa: F401
 
 
 def _preprocess_image_sync(
@@ -179,7 +547,10 @@ def _preprocess_image_sync(
     max_dim: int,
     jpeg_quality: int,
 ) -> bytes:
-    """Synchronous image preprocessing."""
+    """Synchronous image preprocessing (libvips when available, else PIL)."""
+    if pyvips is not None:
+        return _preprocess_image_vips(raw_bytes, max_dim, jpeg_quality)
+
     from PIL import Image
 
     # Open image
@@ -193,7 +564,20 @@ def _preprocess_image_sync(
         ratio = max_dim / max(original_width, original_height)
         new_width = int(original_width * ratio)
         new_height = int(original_height * ratio)
-        img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        if img.format == "JPEG":
+            # libjpeg can emit RGB at 1/2, 1/4 or 1/8 scale straight from
+            # the IDCT. draft() never goes below the requested size, so
+            # LANCZOS only has the small remaining correction left.
+            img.draft("RGB", (new_width, new_height))
+        if img.size != (new_width, new_height):
+            # reducing_gap box-reduces by an integer factor first whenever
+            # at least 3x of shrink would remain for LANCZOS (e.g. large
+            # PNGs, which have no draft mode)
+            img = img.resize(
+                (new_width, new_height),
+                Image.Resampling.LANCZOS,
+                reducing_gap=IMAGE_REDUCING_GAP,
+            )
 
     # Convert to RGB if necessary (for JPEG)
     if img.mode in ("RGBA", "P", "LA"):
@@ -201,7 +585,9 @@ def _preprocess_image_sync(
         background = Image.new("RGB", img.size, (255, 255, 255))
         if img.mode == "P":
             img = img.convert("RGBA")
-        background.paste(img, mask=img.split()[-1] if "A" in img.mode else None)
+        # An RGBA/LA image as its own mask is blended by its alpha band in
+        # a single pass, without split() copying every band out first
+        background.paste(img, mask=img)
         img = background
     elif img.mode != "RGB":
         img = img.convert("RGB")
@@ -212,46 +598,146 @@ def _preprocess_image_sync(
     return output.getvalue()
 
 
-async def _compress_zstd(data: bytes, level: int) -> bytes:
+def _preprocess_image_vips(
+    raw_bytes: bytes,
+    max_dim: int,
+    jpeg_quality: int,
+) -> bytes:
+    """
+    Image preprocessing with libvips.
+
+    thumbnail_buffer shrinks on load and streams the image, so large
+    JPEGs are never fully decoded into memory.
+    """
+    img = pyvips.Image.thumbnail_buffer(raw_bytes, max_dim, size="down")
+
+    if img.hasalpha():
+        # Composite transparency onto white, like the PIL path
+        img = img.flatten(background=[255])
+    if img.interpretation != "srgb":
+        img = img.colourspace("srgb")
+
+    return img.jpegsave_buffer(Q=jpeg_quality, optimize_coding=True, strip=True)
+
+
+async def _compress_zstd(
+    data: bytes,
+    level: int,
+    dict_data: zstd.ZstdCompressionDict | None = None,
+) -> bytes:
     """
     Compress data using zstd.
 
-    Runs in thread pool for large data to avoid blocking.
+    Small payloads (relative to the level's cost) are compressed inline;
+    the rest run in a thread pool to avoid blocking the event loop.
     """
-    if len(data) > 1024 * 1024:  # > 1MB
+    if len(data) > ZSTD_LARGE_PAYLOAD:
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            _get_large_executor(), _compress_zstd_sync, data, level, dict_data
+        )
+    elif len(data) > _zstd_inline_limit(level):
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(
-            _executor, _compress_zstd_sync, data, level
+            _get_executor(), _compress_zstd_sync, data, level, dict_data
         )
     else:
-        return _compress_zstd_sync(data, level)
-
-
-def _compress_zstd_sync(data: bytes, level: int) -> bytes:
-    """Synchronous zstd compression."""
-    cctx = zstd.ZstdCompressor(level=level)
-    return cctx.compress(data)
+        return _compress_zstd_sync(data, level, dict_data)
+
+
+def _zstd_inline_limit(level: int) -> int:
+    """Largest payload worth compressing on the event loop at a level."""
+    for max_level, limit in _ZSTD_INLINE_LIMITS:
+        if level <= max_level:
+            return limit
+    return _ZSTD_INLINE_LIMITS[-1][1]
+
+
+def _get_compressor(
+    level: int,
+    dict_data: zstd.ZstdCompressionDict | None = None,
+    threads: int = 0,
+    long_window: bool = False,
+) -> zstd.ZstdCompressor:
+    """Return this thread's cached compressor for the given settings."""
+    compressors = getattr(_zstd_local, "compressors", None)
+    if compressors is None:
+        compressors = _zstd_local.compressors = {}
+
+    key = (
+        level,
+        dict_data.dict_id() if dict_data is not None else 0,
+        threads,
+        long_window,
+    )
+    cctx = compressors.get(key)
+    if cctx is None:
+        if long_window:
+            params = zstd.ZstdCompressionParameters.from_level(
+                level,
+                window_log=ZSTD_LONG_WINDOW_LOG,
+                enable_ldm=True,
+                threads=threads,
+            )
+            cctx = zstd.ZstdCompressor(dict_data=dict_data, compression_params=params)
+        else:
+            cctx = zstd.ZstdCompressor(
+                level=level, dict_data=dict_data, threads=threads
+            )
+        compressors[key] = cctx
+    return cctx
+
+
+def _get_decompressor(
+    dict_data: zstd.ZstdCompressionDict | None = None,
+) -> zstd.ZstdDecompressor:
+    """Return this thread's cached decompressor for a dictionary."""
+    decompressors = getattr(_zstd_local, "decompressors", None)
+    if decompressors is None:
+        decompressors = _zstd_local.decompressors = {}
+
+    key = dict_data.dict_id() if dict_data is not None else 0
+    dctx = decompressors.get(key)
+    if dctx is None:
+        dctx = decompressors[key] = zstd.ZstdDecompressor(dict_data=dict_data)
+    return dctx
+
+
+def _compress_zstd_sync(
+    data: bytes,
+    level: int,
+    dict_data: zstd.ZstdCompressionDict | None = None,
+) -> bytes:
+    """Synchronous zstd compression (multithreaded, long window for large payloads)."""
+    threads = -1 if len(data) > ZSTD_LARGE_PAYLOAD else 0
+    long_window = len(data) >= ZSTD_LONG_PAYLOAD
+    return _get_compressor(level, dict_data, threads, long_window).compress(data)
 
 
-async def _decompress_zstd(data: bytes) -> bytes:
+async def _decompress_zstd(
+    data: bytes,
+    dict_data: zstd.ZstdCompressionDict | None = None,
+) -> bytes:
     """
     Decompress zstd-compressed data.
 
     Runs in thread pool for large data to avoid blocking.
     """
-    if len(data) > 1024 * 1024:  # > 1MB
+    if len(data) > ZSTD_LARGE_PAYLOAD:
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(
-            _executor, _decompress_zstd_sync, data
+            _get_executor(), _decompress_zstd_sync, data, dict_data
         )
     else:
-        return _decompress_zstd_sync(data)
+        return _decompress_zstd_sync(data, dict_data)
 
 
-def _decompress_zstd_sync(data: bytes) -> bytes:
+def _decompress_zstd_sync(
+    data: bytes,
+    dict_data: zstd.ZstdCompressionDict | None = None,
+) -> bytes:
     """Synchronous zstd decompression."""
-    dctx = zstd.ZstdDecompressor()
-    return dctx.decompress(data)
+    return _get_decompressor(dict_data).decompress(data)
 
 
 def get_compression_stats(
@@ -312,8 +798,12 @@ async def estimate_compression_ratio(
     if not sample:
         return 1.0
 
-    # Compress sample
-    compressed = await _compress_zstd(sample, level=DEFAULT_ZSTD_LEVEL)
+    # Compress sample at the level compress_for_backup would pick, so the
+    # estimate costs and reports what the real backup would
+    level = DEFAULT_ZSTD_LEVEL
+    if is_image_file(s3_key) or _is_incompressible(s3_key, sample):
+        level = INCOMPRESSIBLE_ZSTD_LEVEL
+    compressed = await _compress_zstd(sample, level)
 
     ratio = len(sample) / len(compressed) if compressed else 1.0
 
@@ -0,0 +1,230 @@
+# SPDX-License-Identifier: LGPL-2.1-only
+# Copyright (c) 2026 Akshat Kotpalliwar (alias IntegerAlex)
+
+"""
+S3GC Dictionary Training - zstd dictionaries for small backups.
+
+zstd compresses small objects poorly on their own because every frame
+starts with an empty history. A dictionary trained on similar files
+(JSON documents, HTML pages, ...) primes that history, which is worth up
+to several times the ratio on objects of a few KB.
+
+Dictionaries are trained per file-type bucket (the lowercase extension)
+from recent small backups and stored in ``<vault>/dicts``. Every zstd
+frame records the id of the dictionary it was compressed with, so old
+dictionaries are kept after retraining: backups written with them stay
+restorable.
+"""
+
+import asyncio
+import re
+from pathlib import Path, PurePosixPath
+from typing import Dict, List
+
+import aiosqlite
+import structlog
+import zstandard as zstd
+
+from s3gc.backup.manager import read_backup_file
+from s3gc.vault.compressor import decompress_backup, is_image_file
+
+logger = structlog.get_logger()
+
+# Target dictionary size (zstd's default)
+DICT_SIZE = 110_592
+
+# Objects above this size compress without a dictionary; the gain
+# shrinks to a few percent while the training cost stays the same
+MAX_DICT_INPUT_SIZE = 128 * 1024
+
+# Below this many samples a bucket is not worth a dictionary
+MIN_TRAINING_SAMPLES = 32
+
+DICTS_DIRNAME = "dicts"
+
+_BUCKET_UNSAFE = re.compile(r"[^a-z0-9]+")
+
+
+def dictionary_bucket(s3_key: str) -> str:
+    """
+    Map an S3 key to the dictionary bucket it trains and uses.
+
+    Args:
+        s3_key: S3 key or filename
+
+    Returns:
+        The lowercase extension (without the dot), or "none"
+    """
+    suffix = PurePosixPath(s3_key).suffix.lower().lstrip(".")
+    return _BUCKET_UNSAFE.sub("", suffix) or "none"
+
+
+class ZstdDictionaries:
+    """
+    The trained zstd dictionaries of one vault.
+
+    Looked up by bucket when compressing (newest dictionary wins) and by
+    dictionary id when decompressing.
+
+    Usage:
+        dictionaries = ZstdDictionaries.load(vault_path)
+        compressed = await compress_for_backup(key, data, dictionaries=dictionaries)
+        original = await decompress_backup(compressed, dictionaries)
+    """
+
+    def __init__(self, dicts_dir: Path) -> None:
+        """
+        Args:
+            dicts_dir: Directory holding the ``.zdict`` files
+        """
+        self.dicts_dir = dicts_dir
+        self._by_bucket: Dict[str, zstd.ZstdCompressionDict] = {}
+        self._by_id: Dict[int, zstd.ZstdCompressionDict] = {}
+
+    @classmethod
+    def load(cls, vault_path: Path) -> "ZstdDictionaries":
+        """
+        Load every dictionary stored in a vault.
+
+        Args:
+            vault_path: Path to the vault directory
+
+        Returns:
+            The vault's dictionaries (empty if none were trained yet)
+        """
+        dictionaries = cls(vault_path / DICTS_DIRNAME)
+        if not dictionaries.dicts_dir.is_dir():
+            return dictionaries
+
+        # Oldest first, so the newest dictionary of a bucket ends up active
+        paths = sorted(
+            dictionaries.dicts_dir.glob("*.zdict"), key=lambda p: p.stat().st_mtime
+        )
+        for path in paths:
+            bucket = path.stem.rsplit("-", 1)[0]
+            dictionaries._register(bucket, zstd.ZstdCompressionDict(path.read_bytes()))
+
+        return dictionaries
+
+    def _register(self, bucket: str, dict_data: zstd.ZstdCompressionDict) -> None:
+        self._by_bucket[bucket] = dict_data
+        self._by_id[dict_data.dict_id()] = dict_data
+
+    def for_key(self, s3_key: str, size: int) -> zstd.ZstdCompressionDict | None:
+        """
+        Return the dictionary to compress an object with, if any.
+
+        Args:
+            s3_key: S3 key of the object
+            size: Size of the data about to be compressed
+
+        Returns:
+            The active dictionary of the key's bucket, or None for large
+            objects and buckets without a dictionary
+        """
+        if size > MAX_DICT_INPUT_SIZE:
+            return None
+        return self._by_bucket.get(dictionary_bucket(s3_key))
+
+    def by_id(self, dict_id: int) -> zstd.ZstdCompressionDict | None:
+        """Return the dictionary with a given id, if this vault has it."""
+        return self._by_id.get(dict_id)
+
+    def add(self, bucket: str, dict_data: zstd.ZstdCompressionDict) -> Path:
+        """
+        Persist a dictionary and make it the active one for its bucket.
+
+        Args:
+            bucket: Dictionary bucket (see dictionary_bucket)
+            dict_data: Trained dictionary
+
+        Returns:
+            Path of the written ``.zdict`` file
+        """
+        self.dicts_dir.mkdir(parents=True, exist_ok=True)
+        path = self.dicts_dir / f"{bucket}-{dict_data.dict_id()}.zdict"
+
+        # Write atomically: temp file -> rename
+        temp_path = path.with_suffix(".zdict.tmp")
+        temp_path.write_bytes(dict_data.as_bytes())
+        temp_path.rename(path)
+
+        self._register(bucket, dict_data)
+        return path
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+
+async def train_dictionaries(
+    vault_db: aiosqlite.Connection,
+    dictionaries: ZstdDictionaries,
+    max_samples_per_bucket: int = 2000,
+) -> Dict[str, int]:
+    """
+    Train one dictionary per bucket from the most recent small backups.
+
+    Args:
+        vault_db: Vault database connection
+        dictionaries: Dictionaries to decode existing backups with and to
+            add the new dictionaries to
+        max_samples_per_bucket: Most recent backups used per bucket
+
+    Returns:
+        Mapping of bucket -> id of the newly trained dictionary
+    """
+    paths: Dict[str, List[str]] = {}
+    async with vault_db.execute(
+        """
+        SELECT s3_key, backup_path FROM deletions
+        WHERE original_size <= ?
+        ORDER BY deleted_at DESC
+        """,
+        (MAX_DICT_INPUT_SIZE,),
+    ) as cursor:
+        async for s3_key, backup_path in cursor:
+            if is_image_file(s3_key):
+                # Stored as preprocessed JPEG, which a dictionary can't help
+                continue
+            bucket_paths = paths.setdefault(dictionary_bucket(s3_key), [])
+            if len(bucket_paths) < max_samples_per_bucket:
+                bucket_paths.append(backup_path)
+
+    trained: Dict[str, int] = {}
+    loop = asyncio.get_running_loop()
+
+    for bucket, bucket_paths in paths.items():
+        if len(bucket_paths) < MIN_TRAINING_SAMPLES:
+            continue
+
+        samples: List[bytes] = []
+        for backup_path in bucket_paths:
+            try:
+                compressed = await read_backup_file(Path(backup_path))
+                samples.append(await decompress_backup(compressed, dictionaries))
+            except Exception as e:
+                # Pruned or unreadable backups just don't contribute
+                logger.debug("dict_sample_skipped", path=backup_path, error=str(e))
+
+        if len(samples) < MIN_TRAINING_SAMPLES:
+            continue
+
+        try:
+            dict_data = await loop.run_in_executor(
+                None, zstd.train_dictionary, DICT_SIZE, samples
+            )
+        except zstd.ZstdError as e:
+            # Too little (or too uniform) data to build a dictionary from
+            logger.info("dict_training_skipped", bucket=bucket, error=str(e))
+            continue
+
+        dictionaries.add(bucket, dict_data)
+        trained[bucket] = dict_data.dict_id()
+        logger.info(
+            "dict_trained",
+            bucket=bucket,
+            dict_id=dict_data.dict_id(),
+            samples=len(samples),
+        )
+
+    return trained
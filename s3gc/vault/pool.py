@@ -0,0 +1,335 @@
+# SPDX-License-Identifier: LGPL-2.1-only
+# Copyright (c) 2026 Akshat Kotpalliwar (alias IntegerAlex)
+
+"""
+S3GC Vault Pool - Long-lived SQLite connections to the vault database.
+
+Opening an aiosqlite connection spawns a worker thread, reopens the
+database file and resets every PRAGMA. Callers that hit the vault
+repeatedly (admin endpoints, restores) borrow a connection from this
+pool instead.
+
+Connections handed out by acquire() are read-only (PRAGMA query_only).
+Under WAL they read from their own snapshot, so they run alongside the
+writer instead of queuing behind it.
+
+Connections are opened lazily on first use, so creating a pool is free
+and a pool that is never used never starts a thread.
+
+SQLite allows one writer at a time, so write transactions go through a
+single long-lived connection that writers take turns on (writer()).
+They queue on an asyncio.Lock instead of spinning on busy_timeout.
+
+Small independent writes can instead be queued with write(): a
+background flusher runs everything queued so far in one transaction, so
+concurrent writers share a commit (and its WAL flush) instead of paying
+for one each. Each caller still gets its result only once its write is
+committed.
+
+The pool also keeps the planner statistics fresh: PRAGMA optimize runs
+every OPTIMIZE_INTERVAL_SECONDS while the pool is in use and once more
+on every connection when the pool is closed.
+
+The writer checkpoints automatically only every 10000 pages, so the WAL
+is also truncated in idle windows: once writes have stopped for
+CHECKPOINT_IDLE_SECONDS, a wal_checkpoint(TRUNCATE) copies it back into
+the database and resets it, keeping reads from walking a long WAL.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable, List, TypeVar
+
+import aiosqlite
+import structlog
+
+from s3gc.vault.sqlite_vault import (
+    VAULT_CACHED_STATEMENTS,
+    configure_vault_connection,
+)
+
+logger = structlog.get_logger()
+
+# How often a pool in use re-runs PRAGMA optimize
+OPTIMIZE_INTERVAL_SECONDS = 4 * 60 * 60
+
+# How often the pool looks for an idle window to truncate the WAL in, and
+# how long writes must have stopped for the window to count as idle
+CHECKPOINT_INTERVAL_SECONDS = 60
+CHECKPOINT_IDLE_SECONDS = 30
+
+# Most queued writes the flusher commits together
+GROUP_COMMIT_MAX_WRITES = 1000
+
+T = TypeVar("T")
+
+
+class VaultPool:
+    """
+    Fixed-size pool of aiosqlite connections to one vault database.
+
+    Usage:
+        pool = VaultPool(vault_db_path)
+        async with pool.acquire() as db:
+            await list_operations(db)
+        async with pool.writer() as db:
+            await record_deletions(db, operation_id, rows)
+        await pool.write(partial(mark_restored, s3_key=key, commit=False))
+        await pool.close()
+    """
+
+    def __init__(self, db_path: Path, size: int = 4) -> None:
+        """
+        Args:
+            db_path: Path to the vault SQLite database
+            size: Maximum number of open connections
+        """
+        if size < 1:
+            raise ValueError(f"pool size must be >= 1, got {size}")
+
+        self.db_path = db_path
+        self.size = size
+        self._idle: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self._connections: List[aiosqlite.Connection] = []
+        self._opening = 0
+        self._closed = False
+        # Set by close() before the write queue drains: write() is refused
+        # while writer() still serves the queued writes
+        self._draining = False
+        self._writer: aiosqlite.Connection | None = None
+        self._write_lock = asyncio.Lock()
+        self._optimize_task: asyncio.Task | None = None
+        self._checkpoint_task: asyncio.Task | None = None
+        # time.monotonic() of the last writer() release and WAL truncation
+        self._last_write = 0.0
+        self._last_checkpoint = 0.0
+        self._write_queue: asyncio.Queue[tuple[Callable, asyncio.Future]] = (
+            asyncio.Queue()
+        )
+        self._flusher_task: asyncio.Task | None = None
+
+    async def _connect(self, read_only: bool) -> aiosqlite.Connection:
+        """Open and configure a new pooled connection."""
+        db = await aiosqlite.connect(
+            self.db_path, cached_statements=VAULT_CACHED_STATEMENTS
+        )
+        await configure_vault_connection(db)
+        if read_only:
+            await db.execute("PRAGMA query_only=1")
+        return db
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Borrow a read-only connection for the ``async with`` block.
+
+        Opens a new connection while the pool is below its size limit,
+        otherwise waits for one to be released.
+        """
+        if self._closed:
+            raise RuntimeError("VaultPool is closed")
+
+        if self._idle.empty() and self._opening + len(self._connections) < self.size:
+            # Count the slot before awaiting so concurrent callers
+            # cannot overshoot the size limit
+            self._opening += 1
+            try:
+                db = await self._connect(read_only=True)
+            finally:
+                self._opening -= 1
+            self._connections.append(db)
+        else:
+            db = await self._idle.get()
+
+        try:
+            yield db
+        finally:
+            if db.in_transaction:
+                # Never hand the next borrower a half-finished transaction
+                await db.rollback()
+            self._idle.put_nowait(db)
+
+    @asynccontextmanager
+    async def writer(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Borrow the pool's write connection for the ``async with`` block.
+
+        Only one task holds it at a time; others wait their turn. The
+        connection is opened on first use and kept until close().
+        """
+        if self._closed:
+            raise RuntimeError("VaultPool is closed")
+
+        async with self._write_lock:
+            if self._writer is None:
+                db = await self._connect(read_only=False)
+                # Writes arrive in large batches; checkpoint less often
+                await db.execute("PRAGMA wal_autocheckpoint=10000")
+                self._writer = db
+                self._optimize_task = asyncio.create_task(
+                    self._optimize_periodically()
+                )
+                self._checkpoint_task = asyncio.create_task(
+                    self._checkpoint_when_idle()
+                )
+
+            try:
+                yield self._writer
+            finally:
+                if self._writer.in_transaction:
+                    await self._writer.rollback()
+                self._last_write = time.monotonic()
+
+    async def write(
+        self, op: Callable[[aiosqlite.Connection], Awaitable[T]]
+    ) -> T:
+        """
+        Run a write in the next group commit and wait until it is durable.
+
+        ``op`` is called with the write connection inside a transaction
+        shared with other queued writes, so it must not commit. It runs
+        under its own savepoint: if it raises, only its changes are rolled
+        back and the exception is re-raised here.
+
+        Args:
+            op: Coroutine function performing the write
+
+        Returns:
+            Whatever ``op`` returned, once the transaction has committed
+        """
+        if self._closed or self._draining:
+            raise RuntimeError("VaultPool is closed")
+
+        if self._flusher_task is None:
+            self._flusher_task = asyncio.create_task(self._flush_writes())
+
+        future = asyncio.get_running_loop().create_future()
+        self._write_queue.put_nowait((op, future))
+        return await future
+
+    async def flush(self) -> None:
+        """Wait until every write queued so far has been committed."""
+        await self._write_queue.join()
+
+    async def _flush_writes(self) -> None:
+        """Commit queued writes, everything queued so far per transaction."""
+        while True:
+            batch = [await self._write_queue.get()]
+            while (
+                len(batch) < GROUP_COMMIT_MAX_WRITES
+                and not self._write_queue.empty()
+            ):
+                batch.append(self._write_queue.get_nowait())
+
+            try:
+                await self._commit_batch(batch)
+            finally:
+                for _ in batch:
+                    self._write_queue.task_done()
+
+    async def _commit_batch(self, batch: List[tuple[Callable, asyncio.Future]]) -> None:
+        """Run a batch of queued writes in one transaction."""
+        results = []
+        try:
+            async with self.writer() as db:
+                await db.execute("BEGIN IMMEDIATE")
+                for op, future in batch:
+                    await db.execute("SAVEPOINT queued_write")
+                    try:
+                        results.append((future, await op(db), None))
+                    except Exception as e:
+                        await db.execute("ROLLBACK TO queued_write")
+                        results.append((future, None, e))
+                    await db.execute("RELEASE queued_write")
+                await db.commit()
+        except Exception as e:
+            logger.error("vault_group_commit_failed", writes=len(batch), error=str(e))
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future, result, error in results:
+            if future.done():
+                # The caller was cancelled; its write committed regardless
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    async def _optimize_periodically(self) -> None:
+        """Refresh planner statistics as the vault grows."""
+        while True:
+            await asyncio.sleep(OPTIMIZE_INTERVAL_SECONDS)
+            try:
+                async with self.writer() as db:
+                    await db.execute("PRAGMA optimize")
+            except Exception as e:
+                logger.warning("vault_optimize_failed", error=str(e))
+
+    async def _checkpoint_when_idle(self) -> None:
+        """Truncate the WAL whenever writes have paused after some activity."""
+        while True:
+            await asyncio.sleep(CHECKPOINT_INTERVAL_SECONDS)
+            idle = time.monotonic() - self._last_write >= CHECKPOINT_IDLE_SECONDS
+            if not idle or self._last_checkpoint >= self._last_write:
+                continue
+            try:
+                await self.checkpoint()
+            except Exception as e:
+                logger.warning("vault_checkpoint_failed", error=str(e))
+
+    async def checkpoint(self) -> None:
+        """Copy the WAL back into the database and truncate it."""
+        async with self.writer() as db:
+            async with db.execute("PRAGMA wal_checkpoint(TRUNCATE)") as cursor:
+                busy, wal_pages, checkpointed = await cursor.fetchone()
+        if not busy:
+            # Our own writer() release just bumped _last_write
+            self._last_checkpoint = self._last_write
+        logger.debug(
+            "vault_checkpointed",
+            busy=bool(busy),
+            wal_pages=wal_pages,
+            checkpointed=checkpointed,
+        )
+
+    async def close(self) -> None:
+        """Close every connection opened by the pool."""
+        self._draining = True
+        if self._flusher_task is not None:
+            # Let writes already queued commit before shutting down
+            await self.flush()
+            self._flusher_task.cancel()
+            await asyncio.gather(self._flusher_task, return_exceptions=True)
+            self._flusher_task = None
+        self._closed = True
+
+        for task in (self._optimize_task, self._checkpoint_task):
+            if task is not None:
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+        self._optimize_task = self._checkpoint_task = None
+
+        connections, self._connections = self._connections, []
+        if self._writer is not None:
+            connections.append(self._writer)
+            self._writer = None
+
+        for db in connections:
+            try:
+                # Analyzes whatever this connection's queries showed to be
+                # stale, which readers need write access for
+                await db.execute("PRAGMA query_only=0")
+                await db.execute("PRAGMA optimize")
+            except Exception as e:
+                logger.warning("vault_optimize_failed", error=str(e))
+            try:
+                await db.close()
+            except Exception as e:
+                logger.warning("vault_pool_close_failed", error=str(e))
+
+        self._idle = asyncio.Queue()
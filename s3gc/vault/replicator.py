@@ -13,23 +13,166 @@ Supports:
 """
 
 import asyncio
+import hashlib
 import json
 from datetime import datetime, UTC
 from pathlib import Path
-from typing import Any, List
+from typing import Any, Awaitable, Callable, Dict, List
 
 import aiosqlite
 import structlog
 
 from s3gc.exceptions import VaultError
+from s3gc.vault.dict_train import DICTS_DIRNAME
+from s3gc.vault.sqlite_vault import connect_vault
 
 logger = structlog.get_logger()
 
+# Replicated columns, in vault table order
+_OPERATION_COLUMNS = ("id", "timestamp", "mode", "stats", "completed_at", "error")
+_DELETION_COLUMNS = (
+    "id",
+    "operation_id",
+    "s3_key",
+    "backup_path",
+    "original_size",
+    "compressed_size",
+    "content_hash",
+    "deleted_at",
+    "restored_at",
+    "restore_operation_id",
+)
+
+# Vault columns replicated as an expression rather than as stored. Content
+# hashes are digest BLOBs in the vault (older rows may hold hex text) and
+# hex text in the replicas.
+_SOURCE_EXPRESSIONS = {
+    "content_hash": (
+        "CASE typeof(content_hash) WHEN 'blob' THEN lower(hex(content_hash)) "
+        "ELSE content_hash END"
+    ),
+}
+
+
+def _source_select(source_table: str, columns: tuple[str, ...]) -> str:
+    """Build the SELECT that reads a vault table in replica form."""
+    expressions = ", ".join(_SOURCE_EXPRESSIONS.get(c, c) for c in columns)
+    return f"SELECT {expressions} FROM {source_table}"
+
+# Connection pools shared by every replication and verification run,
+# keyed by (event loop, URL): a pool only works on the loop it was
+# created on. A full replication plus verification otherwise pays a
+# TCP + TLS + auth handshake per call. Closed by close_replication_pools().
+_PoolKey = tuple[asyncio.AbstractEventLoop, str]
+_postgres_pools: Dict[_PoolKey, Any] = {}
+_mysql_pools: Dict[_PoolKey, Any] = {}
+
+# Upper bound on connections per replication target
+REPLICATION_POOL_MAX_SIZE = 8
+
+
+def _pool_key(url: str) -> _PoolKey:
+    """
+    Key the running loop's pool for a URL.
+
+    Pools left behind by loops that have since closed (an earlier
+    asyncio.run) are unusable and can no longer be closed; drop them.
+    """
+    for pools in (_postgres_pools, _mysql_pools):
+        for key in [key for key in pools if key[0].is_closed()]:
+            del pools[key]
+    return (asyncio.get_running_loop(), url)
+
+
+async def _get_postgres_pool(postgres_url: str) -> Any:
+    """Return the shared asyncpg pool for a URL, creating it on first use."""
+    import asyncpg
+
+    key = _pool_key(postgres_url)
+    pool = _postgres_pools.get(key)
+    if pool is not None:
+        return pool
+
+    pool = await asyncpg.create_pool(
+        postgres_url,
+        min_size=1,
+        max_size=REPLICATION_POOL_MAX_SIZE,
+        statement_cache_size=1024,
+    )
+
+    # Another task may have created the pool while we were awaiting
+    if key in _postgres_pools:
+        await pool.close()
+        return _postgres_pools[key]
+
+    _postgres_pools[key] = pool
+    return pool
+
+
+async def _get_mysql_pool(mysql_url: str) -> Any:
+    """Return the shared aiomysql pool for a URL, creating it on first use."""
+    import aiomysql
+    from urllib.parse import urlparse
+
+    key = _pool_key(mysql_url)
+    pool = _mysql_pools.get(key)
+    if pool is not None:
+        return pool
+
+    parsed = urlparse(mysql_url)
+    pool = await aiomysql.create_pool(
+        host=parsed.hostname or "localhost",
+        port=parsed.port or 3306,
+        user=parsed.username or "root",
+        password=parsed.password or "",
+        db=parsed.path.lstrip("/") or "s3gc",
+        minsize=1,
+        maxsize=REPLICATION_POOL_MAX_SIZE,
+    )
+
+    # Another task may have created the pool while we were awaiting
+    if key in _mysql_pools:
+        pool.close()
+        await pool.wait_closed()
+        return _mysql_pools[key]
+
+    _mysql_pools[key] = pool
+    return pool
+
+
+async def close_replication_pools() -> None:
+    """
+    Close the running event loop's pooled replication connections.
+
+    Pools are bound to the event loop they were created on, so call this
+    before that loop shuts down (shutdown_gc_state does).
+    """
+    loop = asyncio.get_running_loop()
+    postgres_pools = [
+        _postgres_pools.pop(key) for key in list(_postgres_pools) if key[0] is loop
+    ]
+    mysql_pools = [
+        _mysql_pools.pop(key) for key in list(_mysql_pools) if key[0] is loop
+    ]
+
+    for pool in postgres_pools:
+        try:
+            await pool.close()
+        except Exception as e:
+            logger.warning("postgres_pool_close_failed", error=str(e))
+
+    for pool in mysql_pools:
+        try:
+            pool.close()
+            await pool.wait_closed()
+        except Exception as e:
+            logger.warning("mysql_pool_close_failed", error=str(e))
+
 
 async def replicate_to_postgres(
     vault_db_path: Path,
     postgres_url: str,
-    batch_size: int = 100,
+    batch_size: int = 1000,
 ) -> dict:
     """
     Replicate vault database to PostgreSQL.
@@ -39,13 +182,11 @@ async def replicate_to_postgres(
     Args:
         vault_db_path: Path to local vault SQLite database
         postgres_url: PostgreSQL connection URL
-        batch_size: Number of records to sync per batch
+        batch_size: Number of records sent per COPY
 
     Returns:
         Dict with replication statistics
     """
-    import asyncpg
-
     stats = {
         "operations_synced": 0,
         "deletions_synced": 0,
@@ -53,85 +194,37 @@ async def replicate_to_postgres(
     }
 
     try:
-        # Connect to PostgreSQL
-        conn = await asyncpg.connect(postgres_url)
+        pool = await _get_postgres_pool(postgres_url)
 
-        try:
+        async with pool.acquire() as conn:
             # Create tables if not exist
             await _create_postgres_tables(conn)
 
-            # Read from SQLite and sync
-            async with aiosqlite.connect(vault_db_path) as sqlite_db:
-                # Sync operations
-                async with sqlite_db.execute(
-                    "SELECT id, timestamp, mode, stats, completed_at, error FROM operations"
-                ) as cursor:
-                    operations = await cursor.fetchall()
-
-                for op in operations:
-                    try:
-                        await conn.execute(
-                            """
-                            INSERT INTO s3gc_operations
-                            (id, timestamp, mode, stats, completed_at, error)
-                            VALUES ($1, $2, $3, $4, $5, $6)
-                            ON CONFLICT (id) DO UPDATE SET
-                                stats = $4,
-                                completed_at = $5,
-                                error = $6
-                            """,
-                            op[0],
-                            op[1],
-                            op[2],
-                            op[3],
-                            op[4],
-                            op[5],
-                        )
-                        stats["operations_synced"] += 1
-                    except Exception as e:
-                        stats["errors"].append(f"Operation {op[0]}: {e}")
-
-                # Sync deletions
-                async with sqlite_db.execute(
-                    """
-                    SELECT id, operation_id, s3_key, backup_path, original_size,
-                           compressed_size, content_hash, deleted_at, restored_at,
-                           restore_operation_id
-                    FROM deletions
-                    """
-                ) as cursor:
-                    deletions = await cursor.fetchall()
-
-                for deletion in deletions:
-                    try:
-                        await conn.execute(
-                            """
-                            INSERT INTO s3gc_deletions
-                            (id, operation_id, s3_key, backup_path, original_size,
-                             compressed_size, content_hash, deleted_at, restored_at,
-                             restore_operation_id)
-                            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-                            ON CONFLICT (id) DO UPDATE SET
-                                restored_at = $9,
-                                restore_operation_id = $10
-                            """,
-                            deletion[0],
-                            deletion[1],
-                            deletion[2],
-                            deletion[3],
-                            deletion[4],
-                            deletion[5],
-                            deletion[6],
-                            deletion[7],
-                            deletion[8],
-                            deletion[9],
-                        )
-                        stats["deletions_synced"] += 1
-                    except Exception as e:
-                        stats["errors"].append(f"Deletion {deletion[0]}: {e}")
-
-        finally:
-            await conn.close()
+            # Read from SQLite and sync. Rows are streamed into temporary
+            # staging tables with binary COPY (one round trip per batch)
+            # and merged with a single upsert per table, all in one
+            # transaction. stats goes over as the vault's JSON text, which
+            # the server parses straight into JSONB.
+            async with connect_vault(vault_db_path) as sqlite_db:
+                async with conn.transaction():
+                    stats["operations_synced"] = await _copy_upsert_postgres(
+                        conn,
+                        sqlite_db,
+                        "operations",
+                        "s3gc_operations",
+                        _OPERATION_COLUMNS,
+                        ("stats", "completed_at", "error"),
+                        batch_size,
+                    )
+                    stats["deletions_synced"] = await _copy_upsert_postgres(
+                        conn,
+                        sqlite_db,
+                        "deletions",
+                        "s3gc_deletions",
+                        _DELETION_COLUMNS,
+                        ("restored_at", "restore_operation_id"),
+                        batch_size,
+                    )
 
         logger.info(
             "postgres_replication_complete",
@@ -149,6 +242,47 @@ async def replicate_to_postgres(
     return stats
 
 
+async def _copy_upsert_postgres(
+    conn: Any,
+    sqlite_db: aiosqlite.Connection,
+    source_table: str,
+    table: str,
+    columns: tuple[str, ...],
+    update_columns: tuple[str, ...],
+    batch_size: int,
+) -> int:
+    """
+    Upsert every row of a vault table into its PostgreSQL replica.
+
+    Must run inside a transaction: the staging table is dropped on commit.
+
+    Returns:
+        Number of rows replicated
+    """
+    staging = f"{table}_staging"
+    await conn.execute(
+        f"CREATE TEMP TABLE {staging} (LIKE {table}) ON COMMIT DROP"
+    )
+
+    count = 0
+    async with sqlite_db.execute(
+        _source_select(source_table, columns)
+    ) as cursor:
+        while rows := await cursor.fetchmany(batch_size):
+            await conn.copy_records_to_table(staging, records=rows, columns=columns)
+            count += len(rows)
+
+    updates = ", ".join(f"{column} = EXCLUDED.{column}" for column in update_columns)
+    await conn.execute(
+        f"""
+        INSERT INTO {table} ({', '.join(columns)})
+        SELECT {', '.join(columns)} FROM {staging}
+        ON CONFLICT (id) DO UPDATE SET {updates}
+        """
+    )
+    return count
+
+
 async def _create_postgres_tables(conn: Any) -> None:
     """Create PostgreSQL tables for vault replication."""
     await conn.execute("""
@@ -156,12 +290,28 @@ async def _create_postgres_tables(conn: Any) -> None:
             id TEXT PRIMARY KEY,
             timestamp TEXT NOT NULL,
             mode TEXT NOT NULL,
-            stats TEXT NOT NULL,
+            stats JSONB NOT NULL,
             completed_at TEXT,
             error TEXT
         )
     """)
 
+    # Replicas created while stats was still TEXT
+    await conn.execute("""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_name = 's3gc_operations'
+                  AND column_name = 'stats'
+                  AND data_type = 'text'
+            ) THEN
+                ALTER TABLE s3gc_operations
+                ALTER COLUMN stats TYPE JSONB USING stats::jsonb;
+            END IF;
+        END $$
+    """)
+
     await conn.execute("""
         CREATE TABLE IF NOT EXISTS s3gc_deletions (
             id BIGINT PRIMARY KEY,
@@ -192,7 +342,7 @@ async def _create_postgres_tables(conn: Any) -> None:
 async def replicate_to_mysql(
     vault_db_path: Path,
     mysql_url: str,
-    batch_size: int = 100,
+    batch_size: int = 1000,
 ) -> dict:
     """
     Replicate vault database to MySQL.
@@ -200,14 +350,11 @@ async def replicate_to_mysql(
     Args:
         vault_db_path: Path to local vault SQLite database
         mysql_url: MySQL connection URL
-        batch_size: Number of records to sync per batch
+        batch_size: Number of records per multi-row INSERT and commit
 
     Returns:
         Dict with replication statistics
     """
-    import aiomysql
-    from urllib.parse import urlparse, parse_qs
-
     stats = {
         "operations_synced": 0,
         "deletions_synced": 0,
@@ -215,88 +362,53 @@ async def replicate_to_mysql(
     }
 
     try:
-        # Parse MySQL URL
-        parsed = urlparse(mysql_url)
-        conn_params = {
-            "host": parsed.hostname or "localhost",
-            "port": parsed.port or 3306,
-            "user": parsed.username or "root",
-            "password": parsed.password or "",
-            "db": parsed.path.lstrip("/") or "s3gc",
-        }
-
-        pool = await aiomysql.create_pool(**conn_params)
-
-        try:
-            async with pool.acquire() as conn:
-                async with conn.cursor() as cursor:
-                    # Create tables
-                    await _create_mysql_tables(cursor)
-                    await conn.commit()
-
-                    # Sync from SQLite
-                    async with aiosqlite.connect(vault_db_path) as sqlite_db:
-                        # Sync operations
-                        async with sqlite_db.execute(
-                            "SELECT id, timestamp, mode, stats, completed_at, error FROM operations"
-                        ) as sqlite_cursor:
-                            operations = await sqlite_cursor.fetchall()
-
-                        for op in operations:
-                            try:
-                                await cursor.execute(
-                                    """
-                                    INSERT INTO s3gc_operations
-                                    (id, timestamp, mode, stats, completed_at, error)
-                                    VALUES (%s, %s, %s, %s, %s, %s)
-                                    ON DUPLICATE KEY UPDATE
-                                        stats = VALUES(stats),
-                                        completed_at = VALUES(completed_at),
-                                        error = VALUES(error)
-                                    """,
-                                    op,
-                                )
-                                stats["operations_synced"] += 1
-                            except Exception as e:
-                                stats["errors"].append(f"Operation {op[0]}: {e}")
-
-                        await conn.commit()
-
-                        # Sync deletions
-                        async with sqlite_db.execute(
-                            """
-                            SELECT id, operation_id, s3_key, backup_path, original_size,
-                                   compressed_size, content_hash, deleted_at, restored_at,
-                                   restore_operation_id
-                            FROM deletions
-                            """
-                        ) as sqlite_cursor:
-                            deletions = await sqlite_cursor.fetchall()
-
-                        for deletion in deletions:
-                            try:
-                                await cursor.execute(
-                                    """
-                                    INSERT INTO s3gc_deletions
-                                    (id, operation_id, s3_key, backup_path, original_size,
-                                     compressed_size, content_hash, deleted_at, restored_at,
-                                     restore_operation_id)
-                                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                                    ON DUPLICATE KEY UPDATE
-                                        restored_at = VALUES(restored_at),
-                                        restore_operation_id = VALUES(restore_operation_id)
-                                    """,
-                                    deletion,
-                                )
-                                stats["deletions_synced"] += 1
-                            except Exception as e:
-                                stats["errors"].append(f"Deletion {deletion[0]}: {e}")
-
-                        await conn.commit()
-
-        finally:
-            pool.close()
-            await pool.wait_closed()
+        pool = await _get_mysql_pool(mysql_url)
+
+        async with pool.acquire() as conn:
+            async with conn.cursor() as cursor:
+                # Create tables
+                await _create_mysql_tables(cursor)
+                await conn.commit()
+
+                # Sync from SQLite
+                async with connect_vault(vault_db_path) as sqlite_db:
+                    stats["operations_synced"] = await _executemany_mysql(
+                        conn,
+                        cursor,
+                        sqlite_db,
+                        "operations",
+                        """
+                        INSERT INTO s3gc_operations
+                        (id, timestamp, mode, stats, completed_at, error)
+                        VALUES (%s, %s, %s, %s, %s, %s)
+                        ON DUPLICATE KEY UPDATE
+                            stats = VALUES(stats),
+                            completed_at = VALUES(completed_at),
+                            error = VALUES(error)
+                        """,
+                        _OPERATION_COLUMNS,
+                        batch_size,
+                        stats["errors"],
+                    )
+                    stats["deletions_synced"] = await _executemany_mysql(
+                        conn,
+                        cursor,
+                        sqlite_db,
+                        "deletions",
+                        """
+                        INSERT INTO s3gc_deletions
+                        (id, operation_id, s3_key, backup_path, original_size,
+                         compressed_size, content_hash, deleted_at, restored_at,
+                         restore_operation_id)
+                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                        ON DUPLICATE KEY UPDATE
+                            restored_at = VALUES(restored_at),
+                            restore_operation_id = VALUES(restore_operation_id)
+                        """,
+                        _DELETION_COLUMNS,
+                        batch_size,
+                        stats["errors"],
+                    )
 
         logger.info(
             "mysql_replication_complete",
@@ -314,6 +426,44 @@ async def replicate_to_mysql(
     return stats
 
 
+async def _executemany_mysql(
+    conn: Any,
+    cursor: Any,
+    sqlite_db: aiosqlite.Connection,
+    source_table: str,
+    insert_sql: str,
+    columns: tuple[str, ...],
+    batch_size: int,
+    errors: List[str],
+) -> int:
+    """
+    Upsert every row of a vault table into MySQL, one chunk at a time.
+
+    aiomysql rewrites executemany of an INSERT into a multi-row INSERT,
+    so each chunk is one round trip and one commit. A failing chunk is
+    rolled back and reported; the remaining chunks still go through.
+
+    Returns:
+        Number of rows replicated
+    """
+    count = 0
+    async with sqlite_db.execute(
+        _source_select(source_table, columns)
+    ) as sqlite_cursor:
+        while rows := await sqlite_cursor.fetchmany(batch_size):
+            try:
+                await cursor.executemany(insert_sql, rows)
+                await conn.commit()
+                count += len(rows)
+            except Exception as e:
+                await conn.rollback()
+                errors.append(
+                    f"{source_table} rows {rows[0][0]}..{rows[-1][0]}: {e}"
+                )
+
+    return count
+
+
 async def _create_mysql_tables(cursor: Any) -> None:
     """Create MySQL tables for vault replication."""
     await cursor.execute("""
@@ -321,12 +471,23 @@ async def _create_mysql_tables(cursor: Any) -> None:
             id VARCHAR(255) PRIMARY KEY,
             timestamp VARCHAR(50) NOT NULL,
             mode VARCHAR(20) NOT NULL,
-            stats TEXT NOT NULL,
+            stats JSON NOT NULL,
             completed_at VARCHAR(50),
             error TEXT
         ) ENGINE=InnoDB
     """)
 
+    # Replicas created while stats was still TEXT
+    await cursor.execute("""
+        SELECT DATA_TYPE FROM information_schema.COLUMNS
+        WHERE TABLE_SCHEMA = DATABASE()
+          AND TABLE_NAME = 's3gc_operations'
+          AND COLUMN_NAME = 'stats'
+    """)
+    row = await cursor.fetchone()
+    if row and row[0].lower() != "json":
+        await cursor.execute("ALTER TABLE s3gc_operations MODIFY stats JSON NOT NULL")
+
     await cursor.execute("""
         CREATE TABLE IF NOT EXISTS s3gc_deletions (
             id BIGINT PRIMARY KEY,
@@ -345,26 +506,157 @@ async def _create_mysql_tables(cursor: Any) -> None:
     """)
 
 
+# Files above this size are streamed as multipart uploads (S3 requires
+# parts of at least 5 MiB)
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+
+# Parts of one file uploaded concurrently; peak memory per file is
+# MULTIPART_CONCURRENCY * MULTIPART_PART_SIZE
+MULTIPART_CONCURRENCY = 4
+
+
+async def _upload_file(
+    s3_client: Any,
+    bucket: str,
+    key: str,
+    local_path: Path,
+) -> int:
+    """
+    Upload a local file to S3 without holding all of it in memory.
+
+    Backup files are already zstd-compressed, so they are sent as-is.
+    Large files are uploaded in parts read from their own offsets,
+    several parts at a time.
+
+    Returns:
+        Number of bytes uploaded
+    """
+    import aiofiles
+
+    size = local_path.stat().st_size
+    if size < MULTIPART_PART_SIZE:
+        async with aiofiles.open(local_path, "rb") as f:
+            body = await f.read()
+        await s3_client.put_object(Bucket=bucket, Key=key, Body=body)
+        return len(body)
+
+    upload = await s3_client.create_multipart_upload(Bucket=bucket, Key=key)
+    upload_id = upload["UploadId"]
+    semaphore = asyncio.Semaphore(MULTIPART_CONCURRENCY)
+
+    async def upload_part(part_number: int) -> dict:
+        async with semaphore:
+            async with aiofiles.open(local_path, "rb") as f:
+                await f.seek((part_number - 1) * MULTIPART_PART_SIZE)
+                chunk = await f.read(MULTIPART_PART_SIZE)
+            response = await s3_client.upload_part(
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=chunk,
+            )
+            return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+    part_count = -(-size // MULTIPART_PART_SIZE)
+    tasks = [
+        asyncio.ensure_future(upload_part(part_number))
+        for part_number in range(1, part_count + 1)
+    ]
+
+    try:
+        parts = await asyncio.gather(*tasks)
+        await s3_client.complete_multipart_upload(
+            Bucket=bucket,
+            Key=key,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        # Don't leave orphaned parts billing in the remote bucket
+        await s3_client.abort_multipart_upload(
+            Bucket=bucket, Key=key, UploadId=upload_id
+        )
+        raise
+
+    return size
+
+
+def _local_etag(local_path: Path) -> str:
+    """
+    Compute the ETag S3 will report for a file uploaded by _upload_file.
+
+    A single PUT gets the MD5 of the body; a multipart upload gets the
+    MD5 of the concatenated part MD5s followed by "-<part count>".
+    """
+    with open(local_path, "rb") as f:
+        first = f.read(MULTIPART_PART_SIZE)
+        if len(first) < MULTIPART_PART_SIZE:
+            return hashlib.md5(first).hexdigest()
+
+        digests = [hashlib.md5(first).digest()]
+        while chunk := f.read(MULTIPART_PART_SIZE):
+            digests.append(hashlib.md5(chunk).digest())
+
+    return f"{hashlib.md5(b''.join(digests)).hexdigest()}-{len(digests)}"
+
+
+async def _list_remote_objects(
+    s3_client: Any, bucket: str, prefix: str
+) -> Dict[str, tuple[int, str]]:
+    """
+    List the replicated backups already in the remote bucket.
+
+    Returns:
+        Mapping of remote key -> (size, ETag without quotes)
+    """
+    remote: Dict[str, tuple[int, str]] = {}
+    paginator = s3_client.get_paginator("list_objects_v2")
+
+    async for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        for obj in page.get("Contents", []):
+            remote[obj["Key"]] = (obj["Size"], obj["ETag"].strip('"'))
+
+    return remote
+
+
 async def replicate_backups_to_s3(
     vault_path: Path,
     remote_bucket: str,
     remote_prefix: str = "s3gc-backups/",
     region: str = "us-east-1",
     max_concurrent: int = 10,
+    verify_etags: bool = False,
 ) -> dict:
     """
     Replicate backup files to a remote S3 bucket.
 
+    The vault's zstd dictionaries are replicated along with the backups:
+    dictionary-compressed backups can't be decoded without them.
+
+    The remote prefix is listed once up front; files whose remote copy
+    has the same size (and, with verify_etags, the same content) are
+    skipped without a per-file request. Backups are written once and
+    never modified, so the size check is enough to find what is missing.
+
     Args:
         vault_path: Path to local vault directory
         remote_bucket: Remote S3 bucket name
         remote_prefix: Prefix for remote keys
         region: AWS region
         max_concurrent: Maximum concurrent uploads
+        verify_etags: Also compare content MD5s, catching corrupted
+            remote copies at the cost of reading and hashing every local
+            backup. Leave off for buckets whose ETags are not MD5-based
+            (SSE-KMS), which would otherwise be re-uploaded on every run.
 
     Returns:
         Dict with replication statistics
     """
+    from aiobotocore.config import AioConfig
     from aiobotocore.session import get_session
 
     backups_dir = vault_path / "backups"
@@ -380,9 +672,25 @@ async def replicate_backups_to_s3(
 
     session = get_session()
 
-    async with session.create_client("s3", region_name=region) as s3_client:
-        # Collect all backup files
+    # One connection per in-flight request: every file can have
+    # MULTIPART_CONCURRENCY parts uploading at once. The default pool of
+    # 10 would queue requests behind each other.
+    client_config = AioConfig(
+        max_pool_connections=max_concurrent * MULTIPART_CONCURRENCY,
+        connect_timeout=5,
+        read_timeout=60,
+        retries={"max_attempts": 3, "mode": "adaptive"},
+        connector_args={"keepalive_timeout": 60},
+    )
+
+    async with session.create_client(
+        "s3", region_name=region, config=client_config
+    ) as s3_client:
+        # Collect all backup files, and what the remote already has
         backup_files = list(backups_dir.rglob("*.zst"))
+        backup_files.extend((vault_path / DICTS_DIRNAME).glob("*.zdict"))
+        remote = await _list_remote_objects(s3_client, remote_bucket, remote_prefix)
+        loop = asyncio.get_running_loop()
 
         # Upload in batches
         semaphore = asyncio.Semaphore(max_concurrent)
@@ -394,34 +702,28 @@ async def replicate_backups_to_s3(
                     relative_path = local_path.relative_to(vault_path)
                     remote_key = f"{remote_prefix}{relative_path}"
 
-                    # Check if already exists with same size
-                    try:
-                        response = await s3_client.head_object(
-                            Bucket=remote_bucket, Key=remote_key
+                    # Skip files already synced
+                    remote_object = remote.get(remote_key)
+                    if (
+                        remote_object is not None
+                        and remote_object[0] == local_path.stat().st_size
+                        and (
+                            not verify_etags
+                            or remote_object[1]
+                            == await loop.run_in_executor(
+                                None, _local_etag, local_path
+                            )
                         )
-                        remote_size = response["ContentLength"]
-                        local_size = local_path.stat().st_size
-
-                        if remote_size == local_size:
-                            # Already synced
-                            return
-                    except Exception:
-                        pass  # File doesn't exist, upload it
+                    ):
+                        return
 
                     # Upload
-                    import aiofiles
-
-                    async with aiofiles.open(local_path, "rb") as f:
-                        content = await f.read()
-
-                    await s3_client.put_object(
-                        Bucket=remote_bucket,
-                        Key=remote_key,
-                        Body=content,
+                    uploaded = await _upload_file(
+                        s3_client, remote_bucket, remote_key, local_path
                     )
 
                     stats["files_synced"] += 1
-                    stats["bytes_synced"] += len(content)
+                    stats["bytes_synced"] += uploaded
 
                     logger.debug(
                         "backup_file_replicated",
@@ -458,10 +760,15 @@ async def run_full_replication(
     remote_s3_bucket: str | None = None,
     remote_s3_prefix: str = "s3gc-backups/",
     region: str = "us-east-1",
+    parallel: bool = True,
 ) -> dict:
     """
     Run full replication to all configured targets.
 
+    Database targets are reached through the shared replication pools,
+    which stay open for later runs and verify_replication(); call
+    close_replication_pools() on shutdown.
+
     Args:
         vault_path: Path to vault directory
         vault_db_path: Path to vault SQLite database
@@ -470,6 +777,8 @@ async def run_full_replication(
         remote_s3_bucket: Remote S3 bucket (optional)
         remote_s3_prefix: Prefix for S3 backups
         region: AWS region
+        parallel: Replicate to all targets concurrently; False runs them
+            one after another
 
     Returns:
         Dict with combined replication statistics
@@ -482,33 +791,47 @@ async def run_full_replication(
         "success": True,
     }
 
-    # Replicate to PostgreSQL
+    # The targets share no I/O, so by default they replicate concurrently
+    targets: List[tuple[str, Callable[[], Awaitable[dict]]]] = []
     if postgres_url:
-        try:
-            results["postgres"] = await replicate_to_postgres(
-                vault_db_path, postgres_url
-            )
-        except Exception as e:
-            results["postgres"] = {"error": str(e)}
-            results["success"] = False
-
-    # Replicate to MySQL
+        targets.append(
+            ("postgres", lambda: replicate_to_postgres(vault_db_path, postgres_url))
+        )
     if mysql_url:
-        try:
-            results["mysql"] = await replicate_to_mysql(vault_db_path, mysql_url)
-        except Exception as e:
-            results["mysql"] = {"error": str(e)}
-            results["success"] = False
-
-    # Replicate backups to S3
+        targets.append(
+            ("mysql", lambda: replicate_to_mysql(vault_db_path, mysql_url))
+        )
     if remote_s3_bucket:
-        try:
-            results["s3"] = await replicate_backups_to_s3(
-                vault_path, remote_s3_bucket, remote_s3_prefix, region
+        targets.append(
+            (
+                "s3",
+                lambda: replicate_backups_to_s3(
+                    vault_path, remote_s3_bucket, remote_s3_prefix, region
+                ),
             )
-        except Exception as e:
-            results["s3"] = {"error": str(e)}
+        )
+
+    if parallel:
+        outcomes = await asyncio.gather(
+            *(replicate() for _, replicate in targets), return_exceptions=True
+        )
+    else:
+        outcomes = []
+        for _, replicate in targets:
+            try:
+                outcomes.append(await replicate())
+            except Exception as e:
+                outcomes.append(e)
+
+    for (name, _), outcome in zip(targets, outcomes):
+        if isinstance(outcome, BaseException):
+            if not isinstance(outcome, Exception):
+                # Cancellation and interpreter exits must propagate
+                raise outcome
+            results[name] = {"error": str(outcome)}
             results["success"] = False
+        else:
+            results[name] = outcome
 
     return results
 
@@ -537,7 +860,7 @@ async def verify_replication(
     }
 
     # Get local counts
-    async with aiosqlite.connect(vault_db_path) as db:
+    async with connect_vault(vault_db_path) as db:
         async with db.execute("SELECT COUNT(*) FROM operations") as cursor:
             row = await cursor.fetchone()
             results["local"]["operations"] = row[0] if row else 0
@@ -548,54 +871,36 @@ async def verify_replication(
 
     # Check PostgreSQL
     if postgres_url:
-        import asyncpg
-
         try:
-            conn = await asyncpg.connect(postgres_url)
-            try:
+            pool = await _get_postgres_pool(postgres_url)
+            async with pool.acquire() as conn:
                 ops = await conn.fetchval("SELECT COUNT(*) FROM s3gc_operations")
                 dels = await conn.fetchval("SELECT COUNT(*) FROM s3gc_deletions")
                 results["postgres"] = {"operations": ops, "deletions": dels}
 
                 if ops != results["local"]["operations"] or dels != results["local"]["deletions"]:
                     results["in_sync"] = False
-            finally:
-                await conn.close()
         except Exception as e:
             results["postgres"] = {"error": str(e)}
             results["in_sync"] = False
 
     # Check MySQL
     if mysql_url:
-        import aiomysql
-        from urllib.parse import urlparse
-
         try:
-            parsed = urlparse(mysql_url)
-            pool = await aiomysql.create_pool(
-                host=parsed.hostname or "localhost",
-                port=parsed.port or 3306,
-                user=parsed.username or "root",
-                password=parsed.password or "",
-                db=parsed.path.lstrip("/") or "s3gc",
-            )
-            try:
-                async with pool.acquire() as conn:
-                    async with conn.cursor() as cursor:
-                        await cursor.execute("SELECT COUNT(*) FROM s3gc_operations")
-                        ops = (await cursor.fetchone())[0]
-                        await cursor.execute("SELECT COUNT(*) FROM s3gc_deletions")
-                        dels = (await cursor.fetchone())[0]
-                        results["mysql"] = {"operations": ops, "deletions": dels}
-
-                        if (
-                            ops != results["local"]["operations"]
-                            or dels != results["local"]["deletions"]
-                        ):
-                            results["in_sync"] = False
-            finally:
-                pool.close()
-                await pool.wait_closed()
+            pool = await _get_mysql_pool(mysql_url)
+            async with pool.acquire() as conn:
+                async with conn.cursor() as cursor:
+                    await cursor.execute("SELECT COUNT(*) FROM s3gc_operations")
+                    ops = (await cursor.fetchone())[0]
+                    await cursor.execute("SELECT COUNT(*) FROM s3gc_deletions")
+                    dels = (await cursor.fetchone())[0]
+                    results["mysql"] = {"operations": ops, "deletions": dels}
+
+                    if (
+                        ops != results["local"]["operations"]
+                        or dels != results["local"]["deletions"]
+                    ):
+                        results["in_sync"] = False
         except Exception as e:
             results["mysql"] = {"error": str(e)}
             results["in_sync"] = False
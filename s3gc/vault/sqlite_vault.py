@@ -12,18 +12,46 @@ The vault serves two purposes:
 2. Backup metadata - Links to backup files for restoration
 """
 
+import functools
 import json
+import sqlite3
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime, UTC
 from pathlib import Path
-from typing import List, TypedDict
+from typing import AsyncIterator, List, TypedDict
 
 import aiosqlite
 import structlog
 
 from s3gc.exceptions import VaultError
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast-json" extra
+    orjson = None
+
 logger = structlog.get_logger()
 
+# Keys per UPDATE ... IN (...) in mark_restored_bulk, leaving room for the
+# two other parameters under SQLite's historical 999-variable limit
+MARK_RESTORED_CHUNK_SIZE = 900
+
+# Applied to every vault connection. Under WAL (set once by init_vault_db,
+# it persists in the file) synchronous=NORMAL only fsyncs at checkpoints
+# and a committed transaction still survives a process crash.
+_CONNECTION_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=268435456;
+    PRAGMA cache_size=-65536;
+    PRAGMA busy_timeout=5000;
+"""
+
+# Prepared statements each vault connection keeps (sqlite3 defaults to
+# 128). Vault SQL is built from fixed strings, so every repeat is a hit.
+VAULT_CACHED_STATEMENTS = 512
+
 
 class OperationRecord(TypedDict):
     """Record of a GC operation."""
@@ -45,6 +73,198 @@ class DeletionRecord(TypedDict):
     compressed_size: int
     deleted_at: str  # ISO 8601
     restored_at: str | None  # ISO 8601 or None
+    content_hash: bytes | None  # Backup file digest, see backup_digest
+
+
+# (unix second, "YYYY-MM-DDTHH:MM:SS") for _utc_now_iso
+_now_prefix_cache: tuple[int, str] = (0, "")
+
+
+def _utc_now_iso() -> str:
+    """
+    Current UTC time as ISO-8601 with microseconds.
+
+    Equivalent to ``datetime.now(UTC).isoformat()`` (except that it
+    always includes the microseconds), but only formats the date and time
+    of day once per second.
+    """
+    global _now_prefix_cache
+
+    second, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    if _now_prefix_cache[0] != second:
+        _now_prefix_cache = (
+            second,
+            datetime.fromtimestamp(second, UTC).strftime("%Y-%m-%dT%H:%M:%S"),
+        )
+    return f"{_now_prefix_cache[1]}.{micros:06d}+00:00"
+
+
+async def configure_vault_connection(db: aiosqlite.Connection) -> None:
+    """
+    Apply the vault PRAGMAs to an open connection.
+
+    Args:
+        db: Connection to the vault database
+    """
+    await db.executescript(_CONNECTION_PRAGMAS)
+
+
+@asynccontextmanager
+async def connect_vault(db_path: Path) -> AsyncIterator[aiosqlite.Connection]:
+    """
+    Open a vault connection with the vault PRAGMAs applied.
+
+    Args:
+        db_path: Path to the vault database
+
+    Yields:
+        An open aiosqlite connection, closed when the block exits (after
+        a PRAGMA optimize, which is a no-op unless statistics are stale)
+    """
+    async with aiosqlite.connect(
+        db_path, cached_statements=VAULT_CACHED_STATEMENTS
+    ) as db:
+        await configure_vault_connection(db)
+        yield db
+        await db.execute("PRAGMA optimize")
+
+
+# Rows are never deleted from the audit trail, so a plain rowid key is
+# already monotonic; AUTOINCREMENT would only add a sqlite_sequence write
+# to every insert
+_DELETIONS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY,
+        operation_id TEXT NOT NULL,
+        s3_key TEXT NOT NULL,
+        backup_path TEXT NOT NULL,
+        original_size INTEGER NOT NULL,
+        compressed_size INTEGER NOT NULL,
+        content_hash BLOB,
+        deleted_at TEXT NOT NULL,
+        restored_at TEXT,
+        restore_operation_id TEXT,
+        FOREIGN KEY (operation_id) REFERENCES operations(id)
+    )
+"""
+
+_DELETIONS_COLUMNS = (
+    "id, operation_id, s3_key, backup_path, original_size, compressed_size, "
+    "content_hash, deleted_at, restored_at, restore_operation_id"
+)
+
+
+async def _drop_deletions_autoincrement(db: aiosqlite.Connection) -> None:
+    """
+    Rebuild a deletions table created with AUTOINCREMENT without it.
+
+    Ids are copied as-is. Must run before the deletions indexes are
+    created, since dropping the old table drops its indexes too.
+    """
+    async with db.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'deletions'"
+    ) as cursor:
+        row = await cursor.fetchone()
+    if row is None or "AUTOINCREMENT" not in row[0].upper():
+        return
+
+    await db.execute("BEGIN IMMEDIATE")
+    try:
+        await db.execute(_DELETIONS_TABLE_SQL.format(table="deletions_new"))
+        await db.execute(
+            f"INSERT INTO deletions_new ({_DELETIONS_COLUMNS}) "
+            f"SELECT {_DELETIONS_COLUMNS} FROM deletions"
+        )
+        await db.execute("DROP TABLE deletions")
+        await db.execute("ALTER TABLE deletions_new RENAME TO deletions")
+        await db.execute("DELETE FROM sqlite_sequence WHERE name = 'deletions'")
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+    logger.info("vault_deletions_autoincrement_dropped")
+
+
+# The FTS5 index and the triggers that keep it in sync with deletions
+_KEY_SEARCH_OBJECTS = (
+    "deletions_fts",
+    "deletions_fts_insert",
+    "deletions_fts_delete",
+    "deletions_fts_update",
+)
+
+_KEY_SEARCH_TRIGGERS_SQL = (
+    """
+    CREATE TRIGGER deletions_fts_insert AFTER INSERT ON deletions BEGIN
+        INSERT INTO deletions_fts(rowid, s3_key) VALUES (new.id, new.s3_key);
+    END
+    """,
+    """
+    CREATE TRIGGER deletions_fts_delete AFTER DELETE ON deletions BEGIN
+        INSERT INTO deletions_fts(deletions_fts, rowid, s3_key)
+        VALUES ('delete', old.id, old.s3_key);
+    END
+    """,
+    """
+    CREATE TRIGGER deletions_fts_update AFTER UPDATE OF s3_key ON deletions
+    BEGIN
+        INSERT INTO deletions_fts(deletions_fts, rowid, s3_key)
+        VALUES ('delete', old.id, old.s3_key);
+        INSERT INTO deletions_fts(rowid, s3_key) VALUES (new.id, new.s3_key);
+    END
+    """,
+)
+
+
+async def _create_key_search_index(db: aiosqlite.Connection) -> None:
+    """
+    Create the trigram FTS5 index that search_deletions matches keys on.
+
+    A plain index can't serve LIKE patterns with a leading wildcard
+    (``%user%``); a trigram index answers LIKE directly. Matching is
+    case-insensitive like LIKE, except that the trigram tokenizer also
+    folds non-ASCII letters (``É`` matches ``é``), which LIKE does not.
+    Vaults whose SQLite lacks FTS5 (or the trigram tokenizer, SQLite
+    < 3.34) keep searching with a table scan.
+
+    The table, its triggers and the initial rebuild are created in one
+    transaction; if an earlier attempt left any of them missing, they
+    are all dropped and built again.
+    """
+    placeholders = ", ".join("?" * len(_KEY_SEARCH_OBJECTS))
+    async with db.execute(
+        f"SELECT COUNT(*) FROM sqlite_master WHERE name IN ({placeholders})",
+        _KEY_SEARCH_OBJECTS,
+    ) as cursor:
+        (present,) = await cursor.fetchone()
+    if present == len(_KEY_SEARCH_OBJECTS):
+        return
+
+    try:
+        # Each statement runs through execute(): executescript() would
+        # COMMIT first and split the transaction
+        await db.execute("BEGIN IMMEDIATE")
+        for trigger in _KEY_SEARCH_OBJECTS[1:]:
+            await db.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+        await db.execute("DROP TABLE IF EXISTS deletions_fts")
+        await db.execute("""
+            CREATE VIRTUAL TABLE deletions_fts USING fts5(
+                s3_key, content='deletions', content_rowid='id',
+                tokenize='trigram'
+            )
+        """)
+        for trigger_sql in _KEY_SEARCH_TRIGGERS_SQL:
+            await db.execute(trigger_sql)
+        # Index the rows recorded before the table existed
+        await db.execute("INSERT INTO deletions_fts(deletions_fts) VALUES ('rebuild')")
+        await db.commit()
+    except aiosqlite.OperationalError as e:
+        await db.rollback()
+        logger.warning("vault_key_search_index_unavailable", error=str(e))
+    except BaseException:
+        await db.rollback()
+        raise
 
 
 async def init_vault_db(db_path: Path) -> None:
@@ -57,7 +277,15 @@ async def init_vault_db(db_path: Path) -> None:
         db_path: Path to the SQLite database file
     """
     try:
-        async with aiosqlite.connect(db_path) as db:
+        async with connect_vault(db_path) as db:
+            # page_size only takes effect before the first write (a no-op
+            # on existing vaults), so it must precede the switch to WAL
+            await db.execute("PRAGMA page_size=4096")
+
+            # WAL is persistent on the database file; it lets readers run
+            # alongside GC writes and makes synchronous=NORMAL durable
+            await db.execute("PRAGMA journal_mode=WAL")
+
             # Operations table - records each GC run
             await db.execute("""
                 CREATE TABLE IF NOT EXISTS operations (
@@ -71,21 +299,8 @@ async def init_vault_db(db_path: Path) -> None:
             """)
 
             # Deletions table - records each deleted object
-            await db.execute("""
-                CREATE TABLE IF NOT EXISTS deletions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    operation_id TEXT NOT NULL,
-                    s3_key TEXT NOT NULL,
-                    backup_path TEXT NOT NULL,
-                    original_size INTEGER NOT NULL,
-                    compressed_size INTEGER NOT NULL,
-                    content_hash TEXT,
-                    deleted_at TEXT NOT NULL,
-                    restored_at TEXT,
-                    restore_operation_id TEXT,
-                    FOREIGN KEY (operation_id) REFERENCES operations(id)
-                )
-            """)
+            await db.execute(_DELETIONS_TABLE_SQL.format(table="deletions"))
+            await _drop_deletions_autoincrement(db)
 
             # Indexes for efficient queries
             await db.execute("""
@@ -93,9 +308,18 @@ async def init_vault_db(db_path: Path) -> None:
                 ON deletions(operation_id)
             """)
 
+            # (s3_key, deleted_at) serves the latest-record-per-key lookup
+            # without a sort; it supersedes the old single-column index
+            await db.execute("DROP INDEX IF EXISTS idx_deletions_s3_key")
             await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_deletions_s3_key
-                ON deletions(s3_key)
+                CREATE INDEX IF NOT EXISTS idx_deletions_s3_key_deleted_at
+                ON deletions(s3_key, deleted_at)
+            """)
+
+            # Only unrestored rows, newest first, for get_unrestored_deletions
+            await db.execute("""
+                CREATE INDEX IF NOT EXISTS idx_deletions_unrestored
+                ON deletions(deleted_at) WHERE restored_at IS NULL
             """)
 
             await db.execute("""
@@ -103,11 +327,34 @@ async def init_vault_db(db_path: Path) -> None:
                 ON deletions(deleted_at)
             """)
 
+            # Dedup/verify lookups by content hash; most rows have none.
+            # Hashes are raw digest BLOBs, half the size of hex text
+            # (vaults created with a TEXT column store them the same way,
+            # since TEXT affinity leaves BLOB values alone)
             await db.execute("""
-                CREATE INDEX IF NOT EXISTS idx_operations_timestamp
-                ON operations(timestamp)
+                CREATE INDEX IF NOT EXISTS idx_deletions_content_hash
+                ON deletions(content_hash) WHERE content_hash IS NOT NULL
             """)
 
+            # (timestamp, id) keys the keyset pagination in list_operations;
+            # it supersedes the old single-column timestamp index
+            await db.execute("DROP INDEX IF EXISTS idx_operations_timestamp")
+            await db.execute("""
+                CREATE INDEX IF NOT EXISTS idx_operations_timestamp_id
+                ON operations(timestamp, id)
+            """)
+
+            await db.commit()
+
+            await _create_key_search_index(db)
+
+            # Give the planner statistics once; after that PRAGMA optimize
+            # re-analyzes only when the tables have changed enough
+            async with db.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'"
+            ) as cursor:
+                analyzed = await cursor.fetchone() is not None
+            await db.execute("PRAGMA optimize" if analyzed else "ANALYZE")
             await db.commit()
 
         logger.info("vault_db_initialized", db_path=str(db_path))
@@ -119,6 +366,19 @@ async def init_vault_db(db_path: Path) -> None:
         )
 
 
+def _dump_stats(stats: dict) -> str:
+    """Serialize operation stats for the TEXT stats column."""
+    if orjson is not None:
+        return orjson.dumps(stats, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(stats)
+
+
+_INSERT_OPERATION_SQL = """
+    INSERT INTO operations (id, timestamp, mode, stats)
+    VALUES (?, ?, ?, ?)
+"""
+
+
 async def record_operation(
     db: aiosqlite.Connection,
     operation_id: str,
@@ -134,14 +394,10 @@ async def record_operation(
         mode: Operation mode (dry_run, audit_only, execute)
         stats: Initial statistics
     """
-    now = datetime.now(UTC).isoformat()
+    now = _utc_now_iso()
 
     await db.execute(
-        """
-        INSERT INTO operations (id, timestamp, mode, stats)
-        VALUES (?, ?, ?, ?)
-        """,
-        (operation_id, now, mode, json.dumps(stats)),
+        _INSERT_OPERATION_SQL, (operation_id, now, mode, _dump_stats(stats))
     )
     await db.commit()
 
@@ -167,7 +423,7 @@ async def complete_operation(
         stats: Final statistics
         error: Error message if operation failed
     """
-    now = datetime.now(UTC).isoformat()
+    now = _utc_now_iso()
 
     await db.execute(
         """
@@ -175,11 +431,30 @@ async def complete_operation(
         SET stats = ?, completed_at = ?, error = ?
         WHERE id = ?
         """,
-        (json.dumps(stats), now, error, operation_id),
+        (_dump_stats(stats), now, error, operation_id),
     )
     await db.commit()
 
 
+_INSERT_DELETION_SQL = """
+    INSERT INTO deletions
+    (operation_id, s3_key, backup_path, original_size, compressed_size,
+     content_hash, deleted_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# INSERT ... RETURNING needs SQLite 3.35+
+_SQLITE_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+_INSERT_DELETION_RETURNING_SQL = _INSERT_DELETION_SQL + " RETURNING id"
+
+
+def _hash_blob(content_hash: bytes | str | None) -> bytes | None:
+    """Normalize a content hash to the raw bytes stored in the vault."""
+    if isinstance(content_hash, str):
+        return bytes.fromhex(content_hash)
+    return content_hash
+
+
 async def record_deletion(
     db: aiosqlite.Connection,
     operation_id: str,
@@ -187,13 +462,14 @@ async def record_deletion(
     backup_path: str,
     original_size: int,
     compressed_size: int,
-    content_hash: str | None = None,
+    content_hash: bytes | str | None = None,
 ) -> int:
     """
     Record a deleted S3 object.
 
     This must be called BEFORE the actual S3 deletion to ensure
-    we always have a record if the deletion succeeds.
+    we always have a record if the deletion succeeds. Each call is its
+    own transaction; batches should use record_deletions().
 
     Args:
         db: SQLite database connection
@@ -202,33 +478,181 @@ async def record_deletion(
         backup_path: Path to the backup file
         original_size: Original file size in bytes
         compressed_size: Compressed backup size in bytes
-        content_hash: Optional content hash for verification
+        content_hash: Optional content hash for verification, as raw
+            digest bytes or a hex string (stored as a BLOB either way)
 
     Returns:
         Deletion record ID
     """
-    now = datetime.now(UTC).isoformat()
-
-    cursor = await db.execute(
-        """
-        INSERT INTO deletions
-        (operation_id, s3_key, backup_path, original_size, compressed_size, content_hash, deleted_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
-        (operation_id, s3_key, backup_path, original_size, compressed_size, content_hash, now),
+    ids = await record_deletions(
+        db,
+        operation_id,
+        [(s3_key, backup_path, original_size, compressed_size, content_hash)],
     )
-    await db.commit()
+    return ids[0]
 
-    deletion_id = cursor.lastrowid
+
+async def record_deletions(
+    db: aiosqlite.Connection,
+    operation_id: str,
+    rows: List[tuple],
+) -> List[int]:
+    """
+    Record a batch of deleted S3 objects in a single transaction.
+
+    All rows are inserted with one prepared statement and committed
+    together, so the batch costs one fsync instead of one per row. If the
+    caller already has a transaction open, the rows join it and are left
+    for the caller to commit. This must be called BEFORE the
+    corresponding S3 deletions.
+
+    Args:
+        db: SQLite database connection
+        operation_id: Operation ID these deletions belong to
+        rows: Tuples of (s3_key, backup_path, original_size,
+            compressed_size) with an optional trailing content_hash
+            (digest bytes or hex, see record_deletion)
+
+    Returns:
+        Deletion record IDs, in the order of ``rows``
+    """
+    if not rows:
+        return []
+
+    now = _utc_now_iso()
+    params = [
+        (operation_id, *row[:4], _hash_blob(row[4]) if len(row) > 4 else None, now)
+        for row in rows
+    ]
+
+    if len(params) == 1 and _SQLITE_HAS_RETURNING:
+        # A single row needs no explicit transaction, and RETURNING hands
+        # back its id with the insert instead of a separate query
+        owns_transaction = not db.in_transaction
+        try:
+            inserted = await db.execute_fetchall(
+                _INSERT_DELETION_RETURNING_SQL, params[0]
+            )
+            if owns_transaction:
+                await db.commit()
+        except Exception:
+            if owns_transaction:
+                await db.rollback()
+            raise
+        ids = [inserted[0][0]]
+    else:
+        ids = await _insert_deletions_batch(db, params)
 
     logger.debug(
-        "deletion_recorded",
-        deletion_id=deletion_id,
+        "deletions_recorded",
         operation_id=operation_id,
-        s3_key=s3_key,
+        count=len(rows),
     )
 
-    return deletion_id
+    return ids
+
+
+async def _insert_deletions_batch(
+    db: aiosqlite.Connection, params: List[tuple]
+) -> List[int]:
+    """Insert deletion rows with one executemany and return their ids."""
+    # Join a transaction the caller already has open; the caller commits it
+    owns_transaction = not db.in_transaction
+    if owns_transaction:
+        await db.execute("BEGIN IMMEDIATE")
+    try:
+        await db.executemany(_INSERT_DELETION_SQL, params)
+        # Rowids are handed out consecutively while we hold the write lock
+        async with db.execute("SELECT last_insert_rowid()") as cursor:
+            last_id = (await cursor.fetchone())[0]
+        if owns_transaction:
+            await db.commit()
+    except Exception:
+        if owns_transaction:
+            await db.rollback()
+        raise
+
+    return list(range(last_id - len(params) + 1, last_id + 1))
+
+
+async def start_operation_with_deletions(
+    db: aiosqlite.Connection,
+    operation_id: str,
+    mode: str,
+    stats: dict,
+    rows: List[tuple],
+) -> List[int]:
+    """
+    Record a new operation together with its first batch of deletions.
+
+    Both go into one transaction, so starting a GC run costs one commit
+    instead of two. Like record_deletions, this must be called BEFORE the
+    corresponding S3 deletions.
+
+    Args:
+        db: SQLite database connection
+        operation_id: Unique operation ID (ULID)
+        mode: Operation mode (dry_run, audit_only, execute)
+        stats: Initial statistics
+        rows: Deletion rows, as accepted by record_deletions
+
+    Returns:
+        Deletion record IDs, in the order of ``rows``
+    """
+    now = _utc_now_iso()
+
+    await db.execute("BEGIN IMMEDIATE")
+    try:
+        await db.execute(
+            _INSERT_OPERATION_SQL, (operation_id, now, mode, _dump_stats(stats))
+        )
+        # Joins our transaction
+        ids = await record_deletions(db, operation_id, rows)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+    logger.info(
+        "operation_recorded",
+        operation_id=operation_id,
+        mode=mode,
+        deletions=len(rows),
+    )
+
+    return ids
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_cached_stats(text: str) -> dict:
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _parse_stats(text: str) -> dict:
+    """
+    Decode an operation's stats JSON, memoized on the text itself.
+
+    Keying on the text means complete_operation needs no invalidation:
+    rewritten stats are a new key. Callers get their own top-level copy.
+    """
+    return dict(_parse_cached_stats(text))
+
+
+def _deletion_record(row: tuple) -> DeletionRecord:
+    """Build a DeletionRecord from a row of the standard deletion SELECT."""
+    return DeletionRecord(
+        id=row[0],
+        operation_id=row[1],
+        s3_key=row[2],
+        backup_path=row[3],
+        original_size=row[4],
+        compressed_size=row[5],
+        deleted_at=row[6],
+        restored_at=row[7],
+        content_hash=_hash_blob(row[8]),
+    )
 
 
 async def get_deletion_record(
@@ -248,7 +672,7 @@ async def get_deletion_record(
     async with db.execute(
         """
         SELECT id, operation_id, s3_key, backup_path, original_size,
-               compressed_size, deleted_at, restored_at
+               compressed_size, deleted_at, restored_at, content_hash
         FROM deletions
         WHERE s3_key = ?
         ORDER BY deleted_at DESC
@@ -258,73 +682,85 @@ async def get_deletion_record(
     ) as cursor:
         row = await cursor.fetchone()
 
-        if row:
-            return DeletionRecord(
-                id=row[0],
-                operation_id=row[1],
-                s3_key=row[2],
-                backup_path=row[3],
-                original_size=row[4],
-                compressed_size=row[5],
-                deleted_at=row[6],
-                restored_at=row[7],
-            )
-
-        return None
+    return _deletion_record(row) if row else None
 
 
-async def get_deletions_by_operation(
+async def iter_deletions_by_operation(
     db: aiosqlite.Connection,
     operation_id: str,
     include_restored: bool = False,
-) -> List[DeletionRecord]:
+    page_size: int = 1000,
+) -> AsyncIterator[DeletionRecord]:
     """
-    Get all deletions for an operation.
+    Stream the deletions of an operation in id order.
+
+    Rows are read in keyset pages of ``page_size`` (``id > last id``),
+    so no statement stays open between pages and the caller may write to
+    the same connection while iterating, e.g. to mark rows restored.
 
     Args:
         db: SQLite database connection
         operation_id: Operation ID
         include_restored: Whether to include already-restored deletions
+        page_size: Rows fetched per query
 
-    Returns:
-        List of deletion records
+    Yields:
+        Deletion records
     """
     query = """
         SELECT id, operation_id, s3_key, backup_path, original_size,
-               compressed_size, deleted_at, restored_at
+               compressed_size, deleted_at, restored_at, content_hash
         FROM deletions
-        WHERE operation_id = ?
+        WHERE operation_id = ? AND id > ?
     """
 
     if not include_restored:
         query += " AND restored_at IS NULL"
 
-    query += " ORDER BY id"
-
-    records: List[DeletionRecord] = []
-
-    async with db.execute(query, (operation_id,)) as cursor:
-        async for row in cursor:
-            records.append(
-                DeletionRecord(
-                    id=row[0],
-                    operation_id=row[1],
-                    s3_key=row[2],
-                    backup_path=row[3],
-                    original_size=row[4],
-                    compressed_size=row[5],
-                    deleted_at=row[6],
-                    restored_at=row[7],
-                )
-            )
+    query += " ORDER BY id LIMIT ?"
+
+    last_id = 0
+    while True:
+        async with db.execute(query, (operation_id, last_id, page_size)) as cursor:
+            rows = await cursor.fetchall()
+
+        for row in rows:
+            yield _deletion_record(row)
 
-    return records
+        if len(rows) < page_size:
+            return
+        last_id = rows[-1][0]
+
+
+async def get_deletions_by_operation(
+    db: aiosqlite.Connection,
+    operation_id: str,
+    include_restored: bool = False,
+) -> List[DeletionRecord]:
+    """
+    Get all deletions for an operation.
+
+    Args:
+        db: SQLite database connection
+        operation_id: Operation ID
+        include_restored: Whether to include already-restored deletions
+
+    Returns:
+        List of deletion records
+    """
+    return [
+        record
+        async for record in iter_deletions_by_operation(
+            db, operation_id, include_restored
+        )
+    ]
 
 
 async def mark_restored(
     db: aiosqlite.Connection,
     s3_key: str,
     restore_operation_id: str | None = None,
+    commit: bool = True,
 ) -> bool:
     """
     Mark a deletion as restored.
@@ -333,11 +769,13 @@ async def mark_restored(
         db: SQLite database connection
         s3_key: S3 key that was restored
         restore_operation_id: Optional ID of the restore operation
+        commit: Commit immediately; pass False when queuing the update
+            for a group commit with VaultPool.write
 
     Returns:
         True if a record was updated, False if no unrestored deletion found
     """
-    now = datetime.now(UTC).isoformat()
+    now = _utc_now_iso()
 
     cursor = await db.execute(
         """
@@ -347,7 +785,8 @@ async def mark_restored(
         """,
         (now, restore_operation_id, s3_key),
     )
-    await db.commit()
+    if commit:
+        await db.commit()
 
     updated = cursor.rowcount > 0
 
@@ -357,6 +796,62 @@ async def mark_restored(
     return updated
 
 
+async def mark_restored_bulk(
+    db: aiosqlite.Connection,
+    s3_keys: List[str],
+    restore_operation_id: str | None = None,
+) -> int:
+    """
+    Mark many deletions as restored in a single transaction.
+
+    Keys are matched with ``IN`` lists of at most MARK_RESTORED_CHUNK_SIZE
+    parameters (SQLite's historical variable limit is 999), and the whole
+    batch commits once. Inside a transaction the caller already has open,
+    the updates join it and are left for the caller to commit.
+
+    Args:
+        db: SQLite database connection
+        s3_keys: S3 keys that were restored
+        restore_operation_id: Optional ID of the restore operation
+
+    Returns:
+        Number of deletion records updated
+    """
+    if not s3_keys:
+        return 0
+
+    now = _utc_now_iso()
+    updated = 0
+
+    # Join a transaction the caller already has open; the caller commits it
+    owns_transaction = not db.in_transaction
+    if owns_transaction:
+        await db.execute("BEGIN IMMEDIATE")
+    try:
+        for start in range(0, len(s3_keys), MARK_RESTORED_CHUNK_SIZE):
+            chunk = s3_keys[start : start + MARK_RESTORED_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            cursor = await db.execute(
+                f"""
+                UPDATE deletions
+                SET restored_at = ?, restore_operation_id = ?
+                WHERE s3_key IN ({placeholders}) AND restored_at IS NULL
+                """,
+                (now, restore_operation_id, *chunk),
+            )
+            updated += cursor.rowcount
+        if owns_transaction:
+            await db.commit()
+    except Exception:
+        if owns_transaction:
+            await db.rollback()
+        raise
+
+    logger.info("deletions_marked_restored", keys=len(s3_keys), updated=updated)
+
+    return updated
+
+
 async def get_operation(
     db: aiosqlite.Connection,
     operation_id: str,
@@ -382,7 +877,7 @@ async def get_operation(
                 id=row[0],
                 timestamp=row[1],
                 mode=row[2],
-                stats=json.loads(row[3]),
+                stats=_parse_stats(row[3]),
             )
 
         return None
@@ -393,43 +888,56 @@ async def list_operations(
     limit: int = 50,
     offset: int = 0,
     mode: str | None = None,
+    cursor: str | None = None,
 ) -> List[OperationRecord]:
     """
-    List operations with pagination.
+    List operations with pagination, newest first.
+
+    Pass the id of the last record of a page as ``cursor`` to fetch the
+    next one. Unlike ``offset``, a cursor seeks straight to its position
+    in the (timestamp, id) index, so deep pages cost the same as the
+    first.
 
     Args:
         db: SQLite database connection
         limit: Maximum number of records to return
         offset: Number of records to skip
         mode: Optional filter by mode
+        cursor: Return only operations listed after this operation id
 
     Returns:
         List of operation records
     """
     query = "SELECT id, timestamp, mode, stats FROM operations"
+    conditions: List[str] = []
     params: List = []
 
     if mode:
-        query += " WHERE mode = ?"
+        conditions.append("mode = ?")
         params.append(mode)
 
-    query += " ORDER BY timestamp DESC LIMIT ? OFFSET ?"
-    params.extend([limit, offset])
+    if cursor:
+        conditions.append(
+            "(timestamp, id) < (SELECT timestamp, id FROM operations WHERE id = ?)"
+        )
+        params.append(cursor)
 
-    records: List[OperationRecord] = []
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
 
-    async with db.execute(query, params) as cursor:
-        async for row in cursor:
-            records.append(
-                OperationRecord(
-                    id=row[0],
-                    timestamp=row[1],
-                    mode=row[2],
-                    stats=json.loads(row[3]),
-                )
-            )
+    query += " ORDER BY timestamp DESC, id DESC LIMIT ? OFFSET ?"
+    params.extend([limit, offset])
 
-    return records
+    async with db.execute(query, params) as rows:
+        return [
+            OperationRecord(
+                id=row[0],
+                timestamp=row[1],
+                mode=row[2],
+                stats=_parse_stats(row[3]),
+            )
+            for row in await rows.fetchall()
+        ]
 
 
 async def get_vault_stats(db: aiosqlite.Connection) -> dict:
@@ -441,36 +949,28 @@ async def get_vault_stats(db: aiosqlite.Connection) -> dict:
     """
     stats = {}
 
-    # Total operations
-    async with db.execute("SELECT COUNT(*) FROM operations") as cursor:
-        row = await cursor.fetchone()
-        stats["total_operations"] = row[0] if row else 0
-
-    # Operations by mode
+    # Operations by mode (their sum is the total)
     async with db.execute(
         "SELECT mode, COUNT(*) FROM operations GROUP BY mode"
     ) as cursor:
-        stats["operations_by_mode"] = {row[0]: row[1] async for row in cursor}
+        stats["operations_by_mode"] = dict(await cursor.fetchall())
+    stats["total_operations"] = sum(stats["operations_by_mode"].values())
 
-    # Total deletions
-    async with db.execute("SELECT COUNT(*) FROM deletions") as cursor:
-        row = await cursor.fetchone()
-        stats["total_deletions"] = row[0] if row else 0
-
-    # Restored deletions
+    # Deletion counts and bytes backed up, in one pass over deletions
+    # (COUNT(restored_at) only counts restored rows)
     async with db.execute(
-        "SELECT COUNT(*) FROM deletions WHERE restored_at IS NOT NULL"
-    ) as cursor:
-        row = await cursor.fetchone()
-        stats["restored_deletions"] = row[0] if row else 0
-
-    # Total bytes backed up
-    async with db.execute(
-        "SELECT SUM(original_size), SUM(compressed_size) FROM deletions"
+        """
+        SELECT COUNT(*), COUNT(restored_at),
+               COALESCE(SUM(original_size), 0), COALESCE(SUM(compressed_size), 0)
+        FROM deletions
+        """
     ) as cursor:
-        row = await cursor.fetchone()
-        stats["total_original_bytes"] = row[0] or 0
-        stats["total_compressed_bytes"] = row[1] or 0
+        (
+            stats["total_deletions"],
+            stats["restored_deletions"],
+            stats["total_original_bytes"],
+            stats["total_compressed_bytes"],
+        ) = await cursor.fetchone()
 
     # Average compression ratio
     if stats["total_compressed_bytes"] > 0:
@@ -483,50 +983,113 @@ async def get_vault_stats(db: aiosqlite.Connection) -> dict:
     return stats
 
 
-async def search_deletions(
+async def iter_search_deletions(
     db: aiosqlite.Connection,
     s3_key_pattern: str,
     limit: int = 100,
-) -> List[DeletionRecord]:
+    chunk_size: int = 500,
+) -> AsyncIterator[DeletionRecord]:
     """
-    Search for deletions by S3 key pattern.
+    Stream deletions matching an S3 key pattern, newest first.
+
+    The pattern is matched through the trigram index on s3_key when the
+    vault has one. The query's cursor stays open while iterating and rows
+    are fetched ``chunk_size`` at a time.
 
     Args:
         db: SQLite database connection
         s3_key_pattern: SQL LIKE pattern (e.g., 'avatars/%')
         limit: Maximum results
+        chunk_size: Rows fetched per round trip to the database thread
 
-    Returns:
-        List of matching deletion records
+    Yields:
+        Matching deletion records
     """
-    records: List[DeletionRecord] = []
+    async with db.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'deletions_fts'"
+    ) as cursor:
+        indexed = await cursor.fetchone() is not None
+
+    if indexed:
+        match = "id IN (SELECT rowid FROM deletions_fts WHERE s3_key LIKE ?)"
+    else:
+        match = "s3_key LIKE ?"
 
     async with db.execute(
-        """
+        f"""
         SELECT id, operation_id, s3_key, backup_path, original_size,
-               compressed_size, deleted_at, restored_at
+               compressed_size, deleted_at, restored_at, content_hash
         FROM deletions
-        WHERE s3_key LIKE ?
+        WHERE {match}
         ORDER BY deleted_at DESC
         LIMIT ?
         """,
         (s3_key_pattern, limit),
     ) as cursor:
-        async for row in cursor:
-            records.append(
-                DeletionRecord(
-                    id=row[0],
-                    operation_id=row[1],
-                    s3_key=row[2],
-                    backup_path=row[3],
-                    original_size=row[4],
-                    compressed_size=row[5],
-                    deleted_at=row[6],
-                    restored_at=row[7],
-                )
-            )
+        while rows := await cursor.fetchmany(chunk_size):
+            for row in rows:
+                yield _deletion_record(row)
 
-    return records
+
+async def search_deletions(
+    db: aiosqlite.Connection,
+    s3_key_pattern: str,
+    limit: int = 100,
+) -> List[DeletionRecord]:
+    """
+    Search for deletions by S3 key pattern.
+
+    Args:
+        db: SQLite database connection
+        s3_key_pattern: SQL LIKE pattern (e.g., 'avatars/%')
+        limit: Maximum results
+
+    Returns:
+        List of matching deletion records
+    """
+    return [
+        record async for record in iter_search_deletions(db, s3_key_pattern, limit)
+    ]
+
+
+async def search_deletions_by_prefix(
+    db: aiosqlite.Connection,
+    prefix: str,
+    limit: int = 100,
+) -> List[DeletionRecord]:
+    """
+    Find deletions whose S3 key starts with a prefix, newest first.
+
+    Unlike a ``prefix%`` LIKE pattern this is case-sensitive and treats
+    ``%`` and ``_`` literally; in exchange it is a range probe on the
+    (s3_key, deleted_at) index.
+
+    Args:
+        db: SQLite database connection
+        prefix: Exact key prefix (e.g., 'avatars/')
+        limit: Maximum results
+
+    Returns:
+        List of matching deletion records
+    """
+    query = """
+        SELECT id, operation_id, s3_key, backup_path, original_size,
+               compressed_size, deleted_at, restored_at, content_hash
+        FROM deletions
+        WHERE s3_key >= ?
+    """
+    params: List = [prefix]
+
+    if prefix:
+        # The smallest string greater than every key with this prefix
+        query += " AND s3_key < ?"
+        params.append(prefix[:-1] + chr(ord(prefix[-1]) + 1))
+
+    query += " ORDER BY deleted_at DESC LIMIT ?"
+    params.append(limit)
+
+    async with db.execute(query, params) as cursor:
+        return [_deletion_record(row) for row in await cursor.fetchall()]
 
 
 async def get_unrestored_deletions(
@@ -547,7 +1110,7 @@ async def get_unrestored_deletions(
     """
     query = """
         SELECT id, operation_id, s3_key, backup_path, original_size,
-               compressed_size, deleted_at, restored_at
+               compressed_size, deleted_at, restored_at, content_hash
         FROM deletions
         WHERE restored_at IS NULL
     """
@@ -563,21 +1126,5 @@ async def get_unrestored_deletions(
     query += " ORDER BY deleted_at DESC LIMIT ?"
     params.append(limit)
 
-    records: List[DeletionRecord] = []
-
     async with db.execute(query, params) as cursor:
-        async for row in cursor:
-            records.append(
-                DeletionRecord(
-                    id=row[0],
-                    operation_id=row[1],
-                    s3_key=row[2],
-                    backup_path=row[3],
-                    original_size=row[4],
-                    compressed_size=row[5],
-                    deleted_at=row[6],
-                    restored_at=row[7],
-                )
-            )
-
-    return records
+        return [_deletion_record(row) for row in await cursor.fetchall()]
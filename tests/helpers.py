@@ -0,0 +1,48 @@
+# SPDX-License-Identifier: LGPL-2.1-only
+# Copyright (c) 2026 Akshat Kotpalliwar (alias IntegerAlex)
+
+"""
+Shared helpers for S3GC tests.
+
+Plain functions imported by the test modules; fixtures live in conftest.py.
+"""
+
+import asyncio
+from pathlib import Path
+from typing import List
+
+
+async def seed_test_deletions(
+    db,
+    operation_id: str,
+    count: int,
+    vault_path: Path | None = None,
+    original_size: int = 100,
+    compressed_size: int = 50,
+) -> List[str]:
+    """
+    Record ``count`` deletions (file0.txt, file1.txt, ...) in one transaction.
+
+    With ``vault_path``, a real backup file is written for each key;
+    otherwise the records point at placeholder paths.
+
+    Returns:
+        The seeded S3 keys
+    """
+    from s3gc.backup.manager import write_backup_file
+    from s3gc.vault import record_deletions
+
+    keys = [f"file{i}.txt" for i in range(count)]
+    if vault_path is not None:
+        paths = await asyncio.gather(
+            *(write_backup_file(vault_path, operation_id, key, b"content") for key in keys)
+        )
+    else:
+        paths = [f"/backup/{i}.zst" for i in range(count)]
+
+    await record_deletions(
+        db,
+        operation_id,
+        [(key, str(path), original_size, compressed_size) for key, path in zip(keys, paths)],
+    )
+    return keys